@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark BM25 keyword search: exhaustive scan vs. inverted index.
+
+Builds a synthetic corpus with a Zipfian vocabulary (similar in shape to
+chunked API documentation), then measures index build time and query
+latency for the reference BM25 and the inverted-index BM25 with MaxScore
+pruning. Result lists are compared to confirm identical scores.
+
+Usage:
+    python scripts/benchmark_bm25.py [--sizes 10000 100000 1000000] [--queries 200]
+
+The exhaustive reference is skipped above --max-reference-size because a
+single query takes seconds at 1M chunks.
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import structlog
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.hybrid_search import BM25, InvertedIndexBM25  # noqa: E402
+
+
+def build_corpus(size: int, vocab_size: int, avg_len: int, seed: int) -> List[str]:
+    """Generate documents whose term frequencies follow a Zipf distribution."""
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(vocab_size)]
+    weights = [1.0 / (rank + 1) for rank in range(vocab_size)]
+    cum_weights = list(_accumulate(weights))
+
+    corpus = []
+    for _ in range(size):
+        length = max(1, int(rng.gauss(avg_len, avg_len / 3)))
+        corpus.append(" ".join(rng.choices(vocab, cum_weights=cum_weights, k=length)))
+    return corpus
+
+
+def build_queries(count: int, vocab_size: int, seed: int) -> List[str]:
+    """Generate 1-5 term queries biased towards mid-frequency terms."""
+    rng = random.Random(seed + 1)
+    return [
+        " ".join(f"term{rng.randint(0, vocab_size // 10)}" for _ in range(rng.randint(1, 5)))
+        for _ in range(count)
+    ]
+
+
+def _accumulate(values):
+    total = 0.0
+    for value in values:
+        total += value
+        yield total
+
+
+def time_queries(index: BM25, queries: List[str], top_k: int) -> List[float]:
+    """Return per-query latency in milliseconds."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, top_k=top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def summarize(latencies: List[float]) -> str:
+    """Format p50/p95 latency."""
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):8.2f} ms  p95={p95:8.2f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark BM25 implementations")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=40)
+    parser.add_argument("--vocab-size", type=int, default=50_000)
+    parser.add_argument("--avg-len", type=int, default=60)
+    parser.add_argument("--max-reference-size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    # Silence per-query debug logging
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    queries = build_queries(args.queries, args.vocab_size, args.seed)
+
+    for size in args.sizes:
+        print(f"\n=== {size:,} chunks ===")
+        corpus = build_corpus(size, args.vocab_size, args.avg_len, args.seed)
+
+        start = time.perf_counter()
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus)
+        print(f"inverted  build: {time.perf_counter() - start:8.2f} s")
+        inverted_latencies = time_queries(inverted, queries, args.top_k)
+        print(f"inverted  query: {summarize(inverted_latencies)}")
+
+        if size > args.max_reference_size:
+            print("reference skipped (use --max-reference-size to include)")
+            continue
+
+        start = time.perf_counter()
+        reference = BM25()
+        reference.fit(corpus)
+        print(f"reference build: {time.perf_counter() - start:8.2f} s")
+        sample = queries[: max(1, min(len(queries), 2_000_000 // size))]
+        reference_latencies = time_queries(reference, sample, args.top_k)
+        print(f"reference query: {summarize(reference_latencies)}  ({len(sample)} queries)")
+
+        mismatches = sum(
+            reference.search(q, top_k=args.top_k) != inverted.search(q, top_k=args.top_k)
+            for q in sample
+        )
+        print(f"result mismatches: {mismatches}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
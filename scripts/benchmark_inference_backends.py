@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark CPU inference backends for the embedding model and cross-encoder.
+
+Loads the fp32 PyTorch model as the reference, then each requested backend
+("onnx", "int8"), and reports load time, throughput and agreement with the
+reference on a sample corpus:
+- embeddings: row-wise cosine similarity to the fp32 embeddings
+- cross-encoder: Pearson correlation of scores and top-1 agreement
+
+Usage:
+    python scripts/benchmark_inference_backends.py [--backends onnx int8] [--texts 2000]
+    python scripts/benchmark_inference_backends.py --corpus chunks.txt --min-cosine 0.99
+
+The corpus defaults to synthetic API documentation snippets; --corpus reads
+one text per line instead. Exits non-zero if any embedding backend's mean
+cosine agreement is below --min-cosine.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import structlog
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import settings  # noqa: E402
+from src.core.cross_encoder import CrossEncoderReranker  # noqa: E402
+from src.core.inference_backends import (  # noqa: E402
+    TORCH_BACKEND,
+    embedding_agreement,
+    load_cross_encoder,
+    load_sentence_transformer,
+)
+
+METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+RESOURCES = ["users", "orders", "invoices", "webhooks", "payments", "tokens", "projects", "files"]
+ACTIONS = [
+    "Returns a paginated list of {r}.",
+    "Creates a new {r} record and returns its ID.",
+    "Updates the {r} identified by the path parameter.",
+    "Deletes the {r}; the operation cannot be undone.",
+    "Requires an OAuth 2.0 bearer token with the {r}:write scope.",
+    "Rate limited to 100 requests per minute per API key for {r}.",
+]
+
+
+def build_corpus(count: int, seed: int) -> List[str]:
+    """Generate API documentation-like snippets."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        resource = rng.choice(RESOURCES)
+        sentences = rng.sample(ACTIONS, k=rng.randint(1, 3))
+        corpus.append(
+            f"{rng.choice(METHODS)} /v{rng.randint(1, 3)}/{resource} "
+            + " ".join(s.format(r=resource) for s in sentences)
+        )
+    return corpus
+
+
+def load_corpus(path: str) -> List[str]:
+    """Read one non-empty text per line."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def time_call(func, *args, **kwargs):
+    """Return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_embeddings(args, corpus: List[str]) -> bool:
+    """Benchmark embedding backends; return False if accuracy is below threshold."""
+    print(f"\n=== Embeddings: {args.embedding_model} ({len(corpus):,} texts) ===")
+    passed = True
+    reference = None
+
+    for backend in [TORCH_BACKEND] + args.backends:
+        (model, backend), load_s = time_call(load_sentence_transformer, args.embedding_model, backend, device="cpu")
+        model.encode(corpus[: args.batch_size], batch_size=args.batch_size)  # Warm up
+        embeddings, encode_s = time_call(
+            model.encode, corpus, batch_size=args.batch_size, convert_to_numpy=True
+        )
+
+        line = f"{backend:6s} load: {load_s:6.2f} s  throughput: {len(corpus) / encode_s:8.1f} texts/s"
+        if reference is None:
+            reference = embeddings
+        else:
+            agreement = embedding_agreement(reference, embeddings)
+            line += (
+                f"  cosine mean={agreement['mean_cosine']:.4f}"
+                f" p5={agreement['p5_cosine']:.4f} min={agreement['min_cosine']:.4f}"
+            )
+            if agreement["mean_cosine"] < args.min_cosine:
+                line += "  BELOW THRESHOLD"
+                passed = False
+        print(line)
+
+    return passed
+
+
+def benchmark_cross_encoder(args, corpus: List[str]) -> None:
+    """Benchmark cross-encoder backends on query/document pairs."""
+    rng = random.Random(args.seed)
+    model_path = CrossEncoderReranker.MODELS.get(args.reranker_model, args.reranker_model)
+    queries = [f"how do I {rng.choice(['list', 'create', 'delete'])} {rng.choice(RESOURCES)}" for _ in range(20)]
+    candidates = max(1, args.pairs // len(queries))
+    pairs = [(q, doc) for q in queries for doc in rng.sample(corpus, k=min(candidates, len(corpus)))]
+
+    print(f"\n=== Cross-encoder: {model_path} ({len(pairs):,} pairs) ===")
+    reference = None
+
+    for backend in [TORCH_BACKEND] + args.backends:
+        (model, backend), load_s = time_call(load_cross_encoder, model_path, backend, device="cpu")
+        model.predict(pairs[: args.batch_size], batch_size=args.batch_size)  # Warm up
+        scores, predict_s = time_call(model.predict, pairs, batch_size=args.batch_size)
+        scores = np.asarray(scores, dtype=np.float32).reshape(len(queries), -1)
+
+        line = f"{backend:6s} load: {load_s:6.2f} s  throughput: {len(pairs) / predict_s:8.1f} pairs/s"
+        if reference is None:
+            reference = scores
+        else:
+            correlation = np.corrcoef(reference.ravel(), scores.ravel())[0, 1]
+            top1 = np.mean(reference.argmax(axis=1) == scores.argmax(axis=1))
+            line += f"  pearson={correlation:.4f}  top1 agreement={top1:.2%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark embedding/cross-encoder inference backends")
+    parser.add_argument("--backends", nargs="+", default=["onnx", "int8"])
+    parser.add_argument("--embedding-model", default=settings.embedding_model)
+    parser.add_argument("--reranker-model", default="ms-marco-mini-lm-6")
+    parser.add_argument("--corpus", help="File with one text per line (default: synthetic)")
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--pairs", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    parser.add_argument("--skip-reranker", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    corpus = load_corpus(args.corpus)[: args.texts] if args.corpus else build_corpus(args.texts, args.seed)
+
+    passed = benchmark_embeddings(args, corpus)
+    if not args.skip_reranker:
+        benchmark_cross_encoder(args, corpus)
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,28 +7,38 @@ This package contains specialized agents for query processing:
 - Code Generator: Generates integration code from templates
 - Documentation Analyzer: Identifies documentation gaps
 - Orchestrator: Supervises and coordinates agent workflows
+
+Exports are loaded lazily (PEP 562), so importing one agent module does
+not import every agent and its LLM dependencies.
 """
 
-from src.agents.base_agent import AgentRegistry, BaseAgent, PassThroughAgent
-from src.agents.code_agent import CodeGenerator
-from src.agents.doc_analyzer import DocumentationAnalyzer
-from src.agents.query_analyzer import QueryAnalyzer
-from src.agents.rag_agent import RAGAgent
-from src.agents.state import (
-    AgentError,
-    AgentMessage,
-    AgentState,
-    AgentType,
-    ConfidenceLevel,
-    IntentAnalysis,
-    QueryIntent,
-    RetrievedDocument,
-    SourceCitation,
-    add_to_processing_path,
-    create_initial_state,
-    set_error,
-)
-from src.agents.supervisor import SupervisorAgent, create_supervisor
+import importlib
+from typing import Any
+
+# Exported name -> submodule that defines it (imported on first access)
+_EXPORTS = {
+    "AgentRegistry": "base_agent",
+    "BaseAgent": "base_agent",
+    "PassThroughAgent": "base_agent",
+    "CodeGenerator": "code_agent",
+    "DocumentationAnalyzer": "doc_analyzer",
+    "QueryAnalyzer": "query_analyzer",
+    "RAGAgent": "rag_agent",
+    "AgentError": "state",
+    "AgentMessage": "state",
+    "AgentState": "state",
+    "AgentType": "state",
+    "ConfidenceLevel": "state",
+    "IntentAnalysis": "state",
+    "QueryIntent": "state",
+    "RetrievedDocument": "state",
+    "SourceCitation": "state",
+    "add_to_processing_path": "state",
+    "create_initial_state": "state",
+    "set_error": "state",
+    "SupervisorAgent": "supervisor",
+    "create_supervisor": "supervisor",
+}
 
 __all__ = [
     # State management
@@ -57,3 +67,18 @@ __all__ = [
     "SupervisorAgent",
     "create_supervisor",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """List exported names alongside the module's own attributes."""
+    return sorted(set(globals()) | set(_EXPORTS))
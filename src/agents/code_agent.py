@@ -22,7 +22,7 @@ from src.agents.state import (
     add_to_processing_path,
     set_error,
 )
-from src.core.llm_client import LLMClient
+from src.core.llm_client import LLMClient, get_llm_client
 
 logger = structlog.get_logger(__name__)
 
@@ -122,7 +122,7 @@ Respond ONLY with valid JSON, no other text:"""
             add_retry: Whether to add retry logic to generated code.
         """
         super().__init__()
-        self._llm_client = llm_client or LLMClient()
+        self._llm_client = llm_client or get_llm_client()
         self.default_library = default_library
         self.base_url = base_url
         self.validate_syntax = validate_syntax
@@ -18,7 +18,7 @@ from src.agents.state import (
     add_to_processing_path,
     set_error,
 )
-from src.core.llm_client import LLMClient
+from src.core.llm_client import LLMClient, get_llm_client
 
 logger = structlog.get_logger(__name__)
 
@@ -131,7 +131,7 @@ class DocumentationAnalyzer(BaseAgent):
             require_examples: Whether examples are required.
         """
         super().__init__()
-        self._llm_client = llm_client or LLMClient()
+        self._llm_client = llm_client or get_llm_client()
         self.min_description_length = min_description_length
         self.require_examples = require_examples
 
@@ -20,7 +20,7 @@ from src.agents.state import (
     add_to_processing_path,
     set_error,
 )
-from src.core.llm_client import LLMClient
+from src.core.llm_client import LLMClient, get_llm_client
 
 logger = structlog.get_logger(__name__)
 
@@ -104,7 +104,7 @@ Respond ONLY with valid JSON, no other text."""
             llm_client: Optional LLM client (creates default if not provided).
         """
         super().__init__()
-        self._llm_client = llm_client or LLMClient()
+        self._llm_client = llm_client or get_llm_client()
 
     @property
     def name(self) -> str:
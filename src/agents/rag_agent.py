@@ -20,7 +20,7 @@ from src.agents.state import (
     set_error,
 )
 from src.config import settings
-from src.core.llm_client import LLMClient
+from src.core.llm_client import LLMClient, get_llm_client
 from src.core.vector_store import VectorStore, get_vector_store
 from src.services.web_search import WebSearchService
 from src.services.url_scraper import URLScraperService
@@ -111,10 +111,12 @@ Respond with one variation per line, no numbering or bullets:"""
         """
         super().__init__()
         self._vector_store = vector_store or get_vector_store()
-        self._llm_client = llm_client or LLMClient()
+        self._llm_client = llm_client or get_llm_client()
         self._web_search = web_search or WebSearchService()
         self._url_scraper = url_scraper or URLScraperService()
-        self._conversation_memory = conversation_memory or ConversationMemoryService()
+        self._conversation_memory = conversation_memory or ConversationMemoryService(
+            vector_store=self._vector_store
+        )
         self.top_k = top_k
         self.min_relevance_score = min_relevance_score
         self.enable_web_search = settings.enable_web_search
@@ -282,20 +284,19 @@ Respond with one variation per line, no numbering or bullets:"""
         queries = self._expand_query(query, intent_analysis)
         self._logger.debug("Query expansion", original=query, variations=queries)
 
-        # Retrieve documents for each query variation
-        all_results = {}  # Use dict to deduplicate by doc_id
+        # Build metadata filter if needed
+        where_filter = self._build_metadata_filter(intent_analysis)
 
-        for search_query in queries:
-            # Build metadata filter if needed
-            where_filter = self._build_metadata_filter(intent_analysis)
+        # Retrieve documents for all query variations in one batched search
+        batch = self._vector_store.search_many(
+            queries=queries,
+            n_results=self.top_k,
+            where=where_filter,
+        )
 
-            # Search vector store
-            results = self._vector_store.search(
-                query=search_query,
-                n_results=self.top_k,
-                where=where_filter,
-            )
+        all_results = {}  # Use dict to deduplicate by doc_id
 
+        for results in batch["results"]:
             # Add to results (keeping highest score for duplicates)
             for result in results:
                 doc_id = result["id"]
@@ -562,6 +563,7 @@ Respond with one variation per line, no numbering or bullets:"""
                 prompt=expansion_prompt,
                 temperature=0.7,
                 max_tokens=200,
+                use_cache=True,  # Any good set of variations can be reused
             )
 
             # Parse variations (one per line)
@@ -2,8 +2,20 @@
 FastAPI REST API for API Assistant.
 
 Exposes all search and document management capabilities via REST API.
+create_app is loaded lazily (PEP 562) so importing src.api.models does not
+import the whole application.
 """
 
-from src.api.app import create_app
+import importlib
+from typing import Any
 
 __all__ = ["create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import src.api.app on first access to create_app."""
+    if name == "create_app":
+        value = importlib.import_module(f"{__name__}.app").create_app
+        globals()[name] = value  # Later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,11 +12,17 @@ Author: API Assistant Team
 Date: 2025-12-27
 """
 
+import asyncio
+import json
+import time
+from contextlib import aclosing, asynccontextmanager
+from datetime import datetime, timezone
+
 import structlog
-from typing import List, Optional
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile, status
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from src.api.auth import verify_api_key, get_current_user_optional, CurrentUser
 from src.api.auth_router import router as auth_router, init_auth_db
@@ -52,6 +58,8 @@ from src.api.models import (
     GenerateOverviewRequest,
     GenerateSequenceDiagramRequest,
     HealthResponse,
+    LivenessResponse,
+    ReadinessResponse,
     SearchMode,
     SearchRequest,
     SearchResponse,
@@ -73,9 +81,16 @@ from src.core import (
     MetadataFilter,
     QueryExpander,
     ResultDiversifier,
-    VectorStore,
 )
+from src.core.cancellation import check_disconnected
+from src.core.exceptions import RequestCancelledError
+from src.core.executors import INGEST_POOL, QUERY_POOL, run_in_executor, shutdown_executors
+from src.core.health import Readiness
+from src.core.llm_client import aclose_async_clients
+from src.core.performance import PerformanceMonitor
+from src.core.vector_store import AsyncVectorStore, get_vector_store
 from src.sessions import get_session_manager
+from src.services import ConversationMemoryService
 from src.diagrams import MermaidGenerator
 
 logger = structlog.get_logger(__name__)
@@ -100,12 +115,59 @@ def create_app(
     Returns:
         FastAPI application instance
     """
+    readiness = Readiness()
+
+    async def warm_up() -> None:
+        """
+        Load models and build indexes in the background; readiness follows it.
+
+        A failed attempt is reported and retried with exponential backoff
+        until one succeeds (or the app shuts down).
+        """
+        config = get_settings()
+        delay = config.warmup_retry_initial_s
+        while True:
+            try:
+                await async_store.warmup(on_stage=readiness.stage_complete)
+                readiness.mark_ready()
+                return
+            except Exception as e:
+                readiness.mark_failed(str(e))
+            logger.info("Retrying warmup", delay_s=delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, config.warmup_retry_max_s)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Initialize services, start the warmup, and persist state on shutdown."""
+        logger.info("Initializing authentication database...")
+        await init_auth_db()
+
+        warmup_task = None
+        if get_settings().warmup_enabled:
+            warmup_task = asyncio.create_task(warm_up())
+        else:
+            readiness.mark_ready()
+        logger.info("Application startup complete")
+
+        yield
+
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+
+        # Persist the BM25 index so the next startup can memory-map it
+        if await async_store.save_bm25_index():
+            logger.info("BM25 index persisted", path=str(vector_store.bm25_index_path))
+        await aclose_async_clients()
+        shutdown_executors()
+
     app = FastAPI(
         title="API Assistant REST API",
         description="Advanced semantic search API for API documentation",
         version=API_VERSION,
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware with secure configuration
@@ -125,22 +187,21 @@ def create_app(
     # Include authentication router
     app.include_router(auth_router)
 
-    # Add startup event for database initialization
-    @app.on_event("startup")
-    async def startup_event():
-        """Initialize services on application startup."""
-        logger.info("Initializing authentication database...")
-        await init_auth_db()
-        logger.info("Application startup complete")
-
-    # Initialize services
-    vector_store = VectorStore(
+    # Initialize services (shared per process so index state is built once)
+    vector_store = get_vector_store(
         enable_hybrid_search=enable_hybrid,
         enable_reranker=enable_reranker,
     )
+    # Endpoints go through the async facade so blocking work runs off the event loop
+    async_store = AsyncVectorStore(vector_store)
     query_expander = QueryExpander()
     result_diversifier = ResultDiversifier()
     session_manager = get_session_manager()
+    # Keyed by the (shared) vector store, so repeated create_app() calls replace it
+    session_manager.add_removal_listener(
+        ConversationMemoryService(vector_store=vector_store).delete_session_documents,
+        key=(ConversationMemoryService, vector_store),
+    )
     mermaid_generator = MermaidGenerator()
 
     # Helper functions
@@ -244,6 +305,37 @@ def create_app(
             },
         )
 
+    @app.get("/health/live", response_model=LivenessResponse, tags=["Health"])
+    async def liveness_check():
+        """
+        Liveness probe.
+
+        Succeeds as long as the process is serving requests, including
+        while the startup warmup is still running.
+        """
+        return LivenessResponse(status="alive")
+
+    @app.get(
+        "/health/ready",
+        response_model=ReadinessResponse,
+        responses={503: {"model": ReadinessResponse, "description": "Still warming up"}},
+        tags=["Health"],
+    )
+    async def readiness_check():
+        """
+        Readiness probe.
+
+        Returns 503 until models are loaded and indexes are built, so load
+        balancers only route traffic to warm instances.
+        """
+        response = ReadinessResponse(**readiness.snapshot())
+        if not response.ready:
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content=response.model_dump(),
+            )
+        return response
+
     @app.get("/stats", response_model=StatsResponse, tags=["Stats"])
     async def get_stats():
         """
@@ -252,8 +344,7 @@ def create_app(
         Returns document count and enabled features.
         """
         try:
-            collection = vector_store.collection
-            count = collection.count()
+            count = await async_store.count()
 
             return StatsResponse(
                 collection=CollectionStats(
@@ -338,13 +429,17 @@ def create_app(
 
                         # If it's an API spec type, use API parser
                         if detected_type in [DocumentType.OPENAPI, DocumentType.GRAPHQL, DocumentType.POSTMAN]:
-                            result = handler.parse(
+                            result = await run_in_executor(
+                                INGEST_POOL,
+                                handler.parse,
                                 content_str,
                                 source_file=file.filename or "unknown",
                             )
                         else:
                             # Use general document parser
-                            result = handler.parse_document(
+                            result = await run_in_executor(
+                                INGEST_POOL,
+                                handler.parse_document,
                                 content_str,
                                 filename=file.filename or "unknown",
                             )
@@ -359,7 +454,9 @@ def create_app(
                             }
                             format_hint = format_map.get(format.lower())
 
-                        result = handler.parse(
+                        result = await run_in_executor(
+                            INGEST_POOL,
+                            handler.parse,
                             content_str,
                             format_hint=format_hint,
                             source_file=file.filename or "unknown",
@@ -374,7 +471,7 @@ def create_app(
                         for doc in result["documents"]
                     ]
 
-                    add_result = vector_store.add_documents(docs)
+                    add_result = await async_store.add_documents(docs)
                     all_document_ids.extend(add_result["document_ids"])
                     total_new_count += add_result["new_count"]
                     total_skipped_count += add_result["skipped_count"]
@@ -450,7 +547,7 @@ def create_app(
                 for doc in request.documents
             ]
 
-            add_result = vector_store.add_documents(docs)
+            add_result = await async_store.add_documents(docs)
 
             logger.info(
                 "Documents added",
@@ -484,7 +581,7 @@ def create_app(
         Returns document content and metadata.
         """
         try:
-            doc = vector_store.get_document(document_id)
+            doc = await async_store.get_document(document_id)
 
             if not doc:
                 raise HTTPException(
@@ -518,7 +615,7 @@ def create_app(
         Returns list of all documents with optional limit.
         """
         try:
-            documents = vector_store.get_all_documents(limit=limit)
+            documents = await async_store.get_all_documents(limit=limit)
 
             return [
                 DocumentResponse(
@@ -550,7 +647,7 @@ def create_app(
         Returns success status and message.
         """
         try:
-            success = vector_store.delete_document(document_id)
+            success = await async_store.delete_document(document_id)
 
             if not success:
                 raise HTTPException(
@@ -588,15 +685,8 @@ def create_app(
         Returns count of deleted and not found documents.
         """
         try:
-            deleted_ids = []
-            not_found_count = 0
-
-            for doc_id in request.document_ids:
-                success = vector_store.delete_document(doc_id)
-                if success:
-                    deleted_ids.append(doc_id)
-                else:
-                    not_found_count += 1
+            deleted_ids = await async_store.delete_documents(request.document_ids)
+            not_found_count = len(request.document_ids) - len(deleted_ids)
 
             logger.info(
                 "Bulk delete completed",
@@ -653,12 +743,13 @@ def create_app(
                 filter_obj = convert_filter_spec_to_filter(request.filter)
                 logger.info("Filter converted", filter_obj=str(filter_obj))
 
-            # Determine search parameters based on mode
-            use_hybrid = request.mode in [SearchMode.HYBRID, SearchMode.RERANKED]
-            use_reranker = request.mode == SearchMode.RERANKED
+            # Determine search parameters based on mode (within this app's features;
+            # the shared store may have more enabled by other callers)
+            use_hybrid = enable_hybrid and request.mode in [SearchMode.HYBRID, SearchMode.RERANKED]
+            use_reranker = enable_reranker and request.mode == SearchMode.RERANKED
 
             # Perform search
-            results = vector_store.search(
+            results = await async_store.search(
                 query=query,
                 n_results=request.n_results,
                 where=filter_obj,
@@ -673,7 +764,9 @@ def create_app(
                     lambda_param=request.diversification_lambda,
                     embedding_service=vector_store.embedding_service,
                 )
-                results = diversifier.diversify(results, top_k=request.n_results)
+                results = await run_in_executor(
+                    QUERY_POOL, diversifier.diversify, results, top_k=request.n_results
+                )
                 logger.debug("Results diversified", count=len(results))
 
             # Convert to response format
@@ -730,12 +823,12 @@ def create_app(
                 filter_obj = convert_filter_spec_to_filter(request.filter)
 
             # Perform faceted search
-            results, facets = vector_store.search_with_facets(
+            results, facets = await async_store.search_with_facets(
                 query=request.query,
                 facet_fields=request.facet_fields,
                 n_results=request.n_results,
                 where=filter_obj,
-                use_hybrid=True,
+                use_hybrid=enable_hybrid,
             )
 
             # Convert results to response format
@@ -1011,7 +1104,8 @@ def create_app(
         Permanently removes the session and its conversation history.
         """
         try:
-            success = session_manager.delete_session(session_id)
+            # Removal listeners delete the session's stored documents (blocking I/O)
+            success = await run_in_executor(INGEST_POOL, session_manager.delete_session, session_id)
 
             if not success:
                 raise HTTPException(
@@ -1147,6 +1241,156 @@ def create_app(
                 detail=f"Error clearing session history: {str(e)}",
             )
 
+    # AI Chat helpers
+    def parse_conversation_history(conversation_history: Optional[str]) -> List[Dict[str, str]]:
+        """Parse the JSON conversation history form field into chat messages."""
+        if not conversation_history:
+            return []
+        try:
+            history_data = json.loads(conversation_history)
+            return [
+                {"role": msg.get("role", "user"), "content": msg.get("content", "")}
+                for msg in history_data
+            ]
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse conversation history JSON")
+            return []
+
+    async def index_chat_uploads(
+        files: Optional[List[UploadFile]],
+        session_id: Optional[str],
+    ) -> Tuple[int, List[str]]:
+        """
+        Parse files uploaded with a chat message and index them for the session.
+
+        Returns:
+            Number of new documents indexed and names of the indexed files
+        """
+        from src.parsers.format_handler import UnifiedFormatHandler
+
+        uploaded_file_count = 0
+        uploaded_file_names = []
+        if not files:
+            return uploaded_file_count, uploaded_file_names
+
+        logger.info("processing_uploaded_files", file_count=len(files))
+        handler = UnifiedFormatHandler()
+
+        for file in files:
+            try:
+                # Read file content
+                content = await file.read()
+
+                # Try UTF-8, fallback to latin-1, keep as bytes for binary files
+                try:
+                    content_str = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    try:
+                        content_str = content.decode("latin-1")
+                    except:
+                        # Keep as bytes for binary files (PDFs)
+                        content_str = content
+
+                # Parse the document
+                logger.info("parsing_uploaded_file", filename=file.filename)
+                result = await run_in_executor(
+                    INGEST_POOL,
+                    handler.parse_document,
+                    content_str,
+                    filename=file.filename or "",
+                )
+
+                # Add to vector store with session-specific metadata
+                docs = []
+                for doc in result.get("documents", []):
+                    metadata = doc.get("metadata", {})
+                    # Tag with session for potential cleanup
+                    metadata["uploaded_via_chat"] = True
+                    if session_id:
+                        metadata["chat_session_id"] = session_id
+                    metadata["upload_timestamp"] = datetime.now(timezone.utc).isoformat()
+                    metadata["source_file"] = file.filename
+
+                    docs.append({
+                        "content": doc["content"],
+                        "metadata": metadata,
+                    })
+
+                if docs:
+                    add_result = await async_store.add_documents(docs)
+                    uploaded_file_count += add_result["new_count"]
+                    uploaded_file_names.append(file.filename or "unknown")
+                    logger.info(
+                        "uploaded_file_indexed",
+                        filename=file.filename,
+                        chunks=len(docs),
+                        new_count=add_result["new_count"],
+                    )
+
+            except Exception as e:
+                logger.error(
+                    "file_upload_processing_failed",
+                    filename=file.filename,
+                    error=str(e),
+                )
+                # Continue with other files
+                continue
+
+        return uploaded_file_count, uploaded_file_names
+
+    def save_chat_turn(
+        session_id: str,
+        message: str,
+        response_text: str,
+        user_metadata: Dict[str, Any],
+        assistant_metadata: Dict[str, Any],
+    ) -> None:
+        """Append a user message and the assistant response to the session history."""
+        logger.info(
+            "chat_attempting_to_save_history",
+            session_id=session_id,
+            total_sessions_in_manager=len(session_manager.sessions),
+        )
+        try:
+            session = session_manager.get_session(session_id)
+            if session:
+                logger.info(
+                    "chat_session_found",
+                    session_id=session_id,
+                    current_message_count=len(session.conversation_history),
+                )
+                # Add user message
+                session.add_message(role="user", content=message, metadata=user_metadata)
+                # Add assistant response
+                session.add_message(role="assistant", content=response_text, metadata=assistant_metadata)
+                session_manager._save_sessions()
+                logger.info(
+                    "chat_history_saved_successfully",
+                    session_id=session_id,
+                    new_message_count=len(session.conversation_history),
+                )
+            else:
+                # Log all existing session IDs to help debug
+                existing_ids = list(session_manager.sessions.keys())
+                logger.warning(
+                    "chat_session_not_found_or_expired",
+                    session_id=session_id,
+                    existing_session_ids=existing_ids[:5],  # Log first 5 IDs
+                    total_sessions=len(existing_ids),
+                    message="Session not found or expired - messages not saved",
+                )
+        except Exception as e:
+            logger.warning(
+                "chat_history_save_failed",
+                session_id=session_id,
+                error=str(e),
+            )
+            # Don't fail the request if history save fails
+
+    def sse_event(event: str, data: Dict[str, Any]) -> str:
+        """Format one Server-Sent Event with a JSON payload."""
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
     # AI Chat Endpoint
     @app.post(
         "/chat",
@@ -1154,6 +1398,7 @@ def create_app(
         tags=["Chat"],
     )
     async def chat_generate(
+        request: Request,
         message: str = Form(...),
         session_id: Optional[str] = Form(None),
         conversation_history: Optional[str] = Form(None),  # JSON string
@@ -1174,6 +1419,7 @@ def create_app(
         - Generates intelligent responses using LLM (Groq/Ollama)
         - Supports code generation and API documentation assistance
         - Maintains conversation history if session_id provided
+        - Stops scraping, indexing and generation if the client disconnects
 
         Example:
             POST /chat (multipart/form-data)
@@ -1181,11 +1427,9 @@ def create_app(
             - session_id: "abc123"
             - files: [openapi.yaml]
         """
+        started = time.perf_counter()
         try:
-            import json
-            from datetime import datetime, timezone
             from src.services.chat_service import get_chat_service
-            from src.parsers.format_handler import UnifiedFormatHandler
 
             logger.info(
                 "chat_request_received",
@@ -1194,78 +1438,10 @@ def create_app(
             )
 
             # Parse conversation history if provided
-            history_list = []
-            if conversation_history:
-                try:
-                    history_data = json.loads(conversation_history)
-                    history_list = [
-                        {"role": msg.get("role", "user"), "content": msg.get("content", "")}
-                        for msg in history_data
-                    ]
-                except json.JSONDecodeError:
-                    logger.warning("Failed to parse conversation history JSON")
+            history_list = parse_conversation_history(conversation_history)
 
             # Process uploaded files if any
-            uploaded_file_count = 0
-            uploaded_file_names = []
-            if files and len(files) > 0:
-                logger.info("processing_uploaded_files", file_count=len(files))
-                handler = UnifiedFormatHandler()
-
-                for file in files:
-                    try:
-                        # Read file content
-                        content = await file.read()
-
-                        # Try UTF-8, fallback to latin-1, keep as bytes for binary files
-                        try:
-                            content_str = content.decode("utf-8")
-                        except UnicodeDecodeError:
-                            try:
-                                content_str = content.decode("latin-1")
-                            except:
-                                # Keep as bytes for binary files (PDFs)
-                                content_str = content
-
-                        # Parse the document
-                        logger.info("parsing_uploaded_file", filename=file.filename)
-                        result = handler.parse_document(content_str, filename=file.filename or "")
-
-                        # Add to vector store with session-specific metadata
-                        docs = []
-                        for doc in result.get("documents", []):
-                            metadata = doc.get("metadata", {})
-                            # Tag with session for potential cleanup
-                            metadata["uploaded_via_chat"] = True
-                            if session_id:
-                                metadata["chat_session_id"] = session_id
-                            metadata["upload_timestamp"] = datetime.now(timezone.utc).isoformat()
-                            metadata["source_file"] = file.filename
-
-                            docs.append({
-                                "content": doc["content"],
-                                "metadata": metadata,
-                            })
-
-                        if docs:
-                            add_result = vector_store.add_documents(docs)
-                            uploaded_file_count += add_result["new_count"]
-                            uploaded_file_names.append(file.filename or "unknown")
-                            logger.info(
-                                "uploaded_file_indexed",
-                                filename=file.filename,
-                                chunks=len(docs),
-                                new_count=add_result["new_count"],
-                            )
-
-                    except Exception as e:
-                        logger.error(
-                            "file_upload_processing_failed",
-                            filename=file.filename,
-                            error=str(e),
-                        )
-                        # Continue with other files
-                        continue
+            uploaded_file_count, uploaded_file_names = await index_chat_uploads(files, session_id)
 
             # Get chat service
             chat_service = get_chat_service(
@@ -1275,10 +1451,12 @@ def create_app(
             )
 
             # Generate response
+            await check_disconnected(request.is_disconnected, "retrieval")
             result = await chat_service.generate_response(
                 user_message=message,
                 conversation_history=history_list if history_list else None,
                 session_id=session_id,
+                is_disconnected=request.is_disconnected,
             )
 
             # Convert sources to ChatSource models
@@ -1300,61 +1478,20 @@ def create_app(
 
             # If session provided, add messages to session history
             if session_id:
-                logger.info(
-                    "chat_attempting_to_save_history",
-                    session_id=session_id,
-                    total_sessions_in_manager=len(session_manager.sessions),
+                save_chat_turn(
+                    session_id,
+                    message,
+                    result["response"],
+                    user_metadata={
+                        "scraped_urls": result["scraped_urls"],
+                        "indexed_docs": total_indexed,
+                        "uploaded_files": uploaded_file_names,
+                    },
+                    assistant_metadata={
+                        "context_results": result["context_results"],
+                        "sources_count": len(sources),
+                    },
                 )
-                try:
-                    session = session_manager.get_session(session_id)
-                    if session:
-                        logger.info(
-                            "chat_session_found",
-                            session_id=session_id,
-                            current_message_count=len(session.conversation_history),
-                        )
-                        # Add user message
-                        session.add_message(
-                            role="user",
-                            content=message,
-                            metadata={
-                                "scraped_urls": result["scraped_urls"],
-                                "indexed_docs": total_indexed,
-                                "uploaded_files": uploaded_file_names,
-                            },
-                        )
-                        # Add assistant response
-                        session.add_message(
-                            role="assistant",
-                            content=result["response"],
-                            metadata={
-                                "context_results": result["context_results"],
-                                "sources_count": len(sources),
-                            },
-                        )
-                        session_manager._save_sessions()
-                        logger.info(
-                            "chat_history_saved_successfully",
-                            session_id=session_id,
-                            new_message_count=len(session.conversation_history),
-                        )
-                    else:
-                        # Log all existing session IDs to help debug
-                        existing_ids = list(session_manager.sessions.keys())
-                        logger.warning(
-                            "chat_session_not_found_or_expired",
-                            session_id=session_id,
-                            existing_session_ids=existing_ids[:5],  # Log first 5 IDs
-                            total_sessions=len(existing_ids),
-                            message="Session not found or expired - messages not saved",
-                        )
-                except Exception as e:
-                    logger.warning(
-                        "chat_history_save_failed",
-                        session_id=session_id,
-                        error=str(e),
-                    )
-                    # Don't fail the request if history save fails
 
             logger.info(
                 "chat_response_generated",
@@ -1366,6 +1503,13 @@ def create_app(
 
             return response
 
+        except RequestCancelledError as e:
+            PerformanceMonitor.get_instance().record_cancellation(
+                "chat", e.details.get("stage", "unknown"), time.perf_counter() - started
+            )
+            # Nobody is listening; 499 (client closed request) is for the access log
+            return JSONResponse(status_code=499, content={"detail": "Client closed request"})
+
         except Exception as e:
             logger.error("chat_generation_failed", error=str(e), exc_info=e)
             raise HTTPException(
@@ -1373,6 +1517,142 @@ def create_app(
                 detail=f"Chat generation failed: {str(e)}",
             )
 
+    @app.post(
+        "/chat/stream",
+        response_class=StreamingResponse,
+        responses={200: {"content": {"text/event-stream": {}}, "description": "Server-Sent Events"}},
+        tags=["Chat"],
+    )
+    async def chat_stream(
+        request: Request,
+        message: str = Form(...),
+        session_id: Optional[str] = Form(None),
+        conversation_history: Optional[str] = Form(None),  # JSON string
+        enable_url_scraping: bool = Form(True),
+        enable_auto_indexing: bool = Form(True),
+        agent_type: str = Form("general"),
+        files: Optional[List[UploadFile]] = File(None),
+        api_key: str = Depends(verify_api_key),
+    ):
+        """
+        Stream an AI chat response as Server-Sent Events.
+
+        Takes the same form fields as POST /chat. Events:
+        - `retrieval`: context is ready; sources, scraped/failed URLs and counts
+        - `token`: one generated chunk (`content`)
+        - `done`: summary with session ID, timestamp, response length,
+          time to first token and total time (ms)
+        - `error`: generation failed after the stream started (`detail`)
+
+        The assistant message is saved to the session once the stream
+        completes. Closing the connection stops retrieval or generation,
+        whichever is running.
+        """
+        from src.services.chat_service import get_chat_service
+
+        started = time.perf_counter()
+        logger.info(
+            "chat_stream_request_received",
+            message_length=len(message),
+            has_files=files is not None and len(files) > 0,
+        )
+
+        history_list = parse_conversation_history(conversation_history)
+        # Read uploads before streaming starts: the request body is gone afterwards
+        uploaded_file_count, uploaded_file_names = await index_chat_uploads(files, session_id)
+
+        chat_service = get_chat_service(
+            agent_type=agent_type,
+            enable_url_scraping=enable_url_scraping,
+            enable_auto_indexing=enable_auto_indexing,
+        )
+
+        async def event_stream():
+            monitor = PerformanceMonitor.get_instance()
+            retrieval: Dict[str, Any] = {}
+            first_token_at = None
+            stage = "retrieval"
+
+            try:
+                async with aclosing(
+                    chat_service.generate_response_events(
+                        user_message=message,
+                        conversation_history=history_list if history_list else None,
+                        session_id=session_id,
+                        is_disconnected=request.is_disconnected,
+                    )
+                ) as events:
+                    async for event in events:
+                        name, data = event["event"], event["data"]
+
+                        if name == "retrieval":
+                            stage = "generation"
+                            retrieval = data
+                            retrieval["indexed_docs"] += uploaded_file_count
+                            yield sse_event(name, retrieval)
+
+                        elif name == "token":
+                            if first_token_at is None:
+                                first_token_at = time.perf_counter()
+                                monitor.record_operation("chat_time_to_first_token", first_token_at - started)
+                            yield sse_event(name, data)
+
+                        elif name == "done":
+                            total = time.perf_counter() - started
+                            monitor.record_operation("chat_stream_total", total)
+
+                            if session_id:
+                                save_chat_turn(
+                                    session_id,
+                                    message,
+                                    data["response"],
+                                    user_metadata={
+                                        "scraped_urls": retrieval["scraped_urls"],
+                                        "indexed_docs": retrieval["indexed_docs"],
+                                        "uploaded_files": uploaded_file_names,
+                                    },
+                                    assistant_metadata={
+                                        "context_results": retrieval["context_results"],
+                                        "sources_count": len(retrieval["sources"]),
+                                    },
+                                )
+
+                            yield sse_event(name, {
+                                "session_id": session_id,
+                                "timestamp": datetime.now(timezone.utc).isoformat(),
+                                "response_length": len(data["response"]),
+                                "time_to_first_token_ms": (
+                                    round((first_token_at - started) * 1000, 2) if first_token_at else None
+                                ),
+                                "total_ms": round(total * 1000, 2),
+                            })
+
+            except asyncio.CancelledError:
+                # Client went away while we were sending: the generation is
+                # closed with the generator
+                logger.info("chat_stream_client_disconnected", session_id=session_id)
+                monitor.record_cancellation("chat_stream", stage, time.perf_counter() - started)
+                raise
+
+            except RequestCancelledError as e:
+                # Disconnect noticed between stages or while tokens streamed
+                monitor.record_cancellation(
+                    "chat_stream", e.details.get("stage", stage), time.perf_counter() - started
+                )
+
+            except Exception as e:
+                logger.error("chat_stream_failed", error=str(e), exc_info=e)
+                yield sse_event("error", {"detail": f"Chat generation failed: {str(e)}"})
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+            },
+        )
+
     # Diagram Generation Endpoints
     @app.post(
         "/diagrams/sequence",
@@ -1387,7 +1667,7 @@ def create_app(
         """
         try:
             # Get the endpoint document
-            doc = vector_store.get_document(request.endpoint_id)
+            doc = await async_store.get_document(request.endpoint_id)
 
             if not doc:
                 raise HTTPException(
@@ -1586,11 +1866,27 @@ def create_app(
     return app
 
 
-# Create default app instance
-app = create_app()
+# Default app instance, created on first access (e.g. by "uvicorn src.api.app:app")
+# so that importing this module for create_app() does not build services
+_default_app: Optional[FastAPI] = None
+
+
+def get_app() -> FastAPI:
+    """Get the default app instance, creating it on first use."""
+    global _default_app
+    if _default_app is None:
+        _default_app = create_app()
+    return _default_app
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the module-level ``app`` lazily (PEP 562)."""
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(get_app(), host="0.0.0.0", port=8000)
@@ -75,6 +75,22 @@ class HealthResponse(BaseModel):
     features: Dict[str, bool] = Field(..., description="Available features")
 
 
+class LivenessResponse(BaseModel):
+    """Liveness probe response."""
+
+    status: str = Field(..., description="Process status")
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response."""
+
+    ready: bool = Field(..., description="Whether the service is warmed up and can take traffic")
+    stages: Dict[str, float] = Field(
+        default_factory=dict, description="Completed warmup stages (milliseconds)"
+    )
+    error: Optional[str] = Field(None, description="Warmup error, if it failed")
+
+
 class ErrorResponse(BaseModel):
     """Error response."""
 
@@ -11,7 +11,7 @@ Date: 2025-12-27
 import json
 import sys
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -33,18 +33,14 @@ app = typer.Typer(
 console = Console()
 
 # Global state (initialized on demand)
-_vector_store: Optional[Any] = None
 _format_handler: Optional[UnifiedFormatHandler] = None
 
 
 def get_vector_store():
-    """Get or create vector store instance (lazy import)."""
-    global _vector_store
-    if _vector_store is None:
-        # Lazy import to avoid loading heavy dependencies on CLI startup
-        from src.core.vector_store import VectorStore
-        _vector_store = VectorStore()
-    return _vector_store
+    """Get the shared vector store instance (lazy import)."""
+    # Lazy import to avoid loading heavy dependencies on CLI startup
+    from src.core.vector_store import get_vector_store as get_shared_vector_store
+    return get_shared_vector_store()
 
 
 def get_format_handler() -> UnifiedFormatHandler:
@@ -133,12 +129,8 @@ def parse_file(
         if add_to_store:
             console.print("\n[cyan]Adding documents to vector store...[/cyan]")
             vector_store = get_vector_store()
-            doc_ids = []
-            for doc in result["documents"]:
-                doc_id = vector_store.add_document(
-                    content=doc["content"], metadata=doc["metadata"]
-                )
-                doc_ids.append(doc_id)
+            added = vector_store.add_documents(result["documents"])
+            doc_ids = added["document_ids"]
             console.print(
                 f"[green]✓ Added {len(doc_ids)} documents to vector store[/green]"
             )
@@ -234,14 +226,11 @@ def parse_batch(
         if add_to_store and results["results"]:
             console.print("\n[cyan]Adding documents to vector store...[/cyan]")
             vector_store = get_vector_store()
-            total_docs = 0
 
-            for result in results["results"]:
-                for doc in result["documents"]:
-                    vector_store.add_document(
-                        content=doc["content"], metadata=doc["metadata"]
-                    )
-                    total_docs += 1
+            # One batch across all files so embedding can use the process pool
+            all_documents = [doc for result in results["results"] for doc in result["documents"]]
+            vector_store.add_documents(all_documents)
+            total_docs = len(all_documents)
 
             console.print(f"[green]✓ Added {total_docs} documents to vector store[/green]")
 
@@ -390,10 +379,10 @@ def collection_clear(
 
         vector_store = get_vector_store()
         # Get all document IDs
-        all_docs = vector_store.collection.get()
+        all_docs = vector_store.collection.get(include=[])
         if all_docs["ids"]:
-            # Delete all documents by their IDs
-            vector_store.collection.delete(ids=all_docs["ids"])
+            # Delete all documents by their IDs (keeps the keyword index in sync)
+            vector_store.delete_documents(all_docs["ids"])
             console.print(f"[green]✓ Cleared {len(all_docs['ids'])} documents from collection[/green]")
         else:
             console.print("[yellow]Collection is already empty[/yellow]")
@@ -916,8 +905,12 @@ def session_cleanup():
     """Remove all expired sessions."""
     try:
         from src.sessions import get_session_manager
+        from src.services import get_conversation_memory_service
 
         manager = get_session_manager()
+        manager.add_removal_listener(
+            get_conversation_memory_service().delete_session_documents
+        )
         count = manager.cleanup_expired_sessions()
 
         if count > 0:
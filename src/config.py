@@ -27,6 +27,10 @@ class Settings(BaseSettings):
 
     # ----- LLM Provider -----
     llm_provider: str = Field(default="ollama")  # "ollama" or "groq"
+    llm_http_max_connections: int = Field(default=20)  # Pooled async connections per event loop
+    llm_http_max_keepalive_connections: int = Field(default=10)
+    llm_http_keepalive_expiry: float = Field(default=30.0)  # Seconds an idle connection stays open
+    llm_http2: bool = Field(default=True)  # Use HTTP/2 when the h2 package is installed
 
     # ----- Ollama (Local LLM) -----
     ollama_base_url: str = Field(default="http://localhost:11434")
@@ -40,6 +44,49 @@ class Settings(BaseSettings):
 
     # ----- Embeddings -----
     embedding_model: str = Field(default="all-MiniLM-L6-v2")
+    embedding_backend: str = Field(default="torch")  # "torch", "onnx" or "int8"
+    embedding_disk_cache_enabled: bool = Field(default=False)  # Persist embeddings across restarts
+    embedding_disk_cache_path: str = Field(default="./data/embedding_cache.db")
+    embedding_disk_cache_dtype: str = Field(default="float32")  # "float32" or "float16"
+    embedding_batching_enabled: bool = Field(default=True)  # Coalesce concurrent query embeddings
+    embedding_batch_max_size: int = Field(default=32)  # Queries per batched encode
+    embedding_batch_max_wait_ms: float = Field(default=2.0)  # Wait for more queries before encoding
+    embedding_process_pool_workers: int = Field(default=0)  # Processes for bulk embedding (0/1 = off)
+    embedding_process_pool_threshold: int = Field(default=1000)  # Min texts per batch to use the pool
+    embedding_process_chunk_size: int = Field(default=0)  # Texts per worker task (0 = automatic)
+
+    # ----- Re-ranking -----
+    reranker_backend: str = Field(default="torch")  # "torch", "onnx" or "int8"
+
+    # ----- Executors (blocking work offloaded from async endpoints) -----
+    query_executor_workers: int = Field(default=4)  # Search, lookups, query embeddings
+    ingest_executor_workers: int = Field(default=2)  # Parsing, document embedding, writes
+    search_leg_executor_workers: int = Field(default=8)  # Parallel vector/BM25 legs of hybrid search
+    scrape_executor_workers: int = Field(default=4)  # Concurrent URL scrapes for chat messages
+    disconnect_poll_interval: float = Field(default=0.5)  # Seconds between client disconnect checks
+
+    # ----- Hybrid Search -----
+    hybrid_leg_timeout_ms: int = Field(default=2000)  # Response budget per leg before degrading (0 = no limit)
+
+    # ----- Search Result Cache -----
+    search_cache_enabled: bool = Field(default=True)
+    search_cache_semantic: bool = Field(default=False)  # Also reuse results of near-identical queries (approximate)
+    search_cache_size: int = Field(default=1000)
+    search_cache_ttl_seconds: int = Field(default=300)
+    semantic_cache_size: int = Field(default=50_000)  # Queries held by the semantic query cache
+
+    # ----- LLM Response Cache -----
+    llm_cache_enabled: bool = Field(default=True)
+    llm_cache_max_temperature: float = Field(default=0.3)  # Calls above this are only cached on request
+    llm_cache_semantic: bool = Field(default=False)  # Also match near-identical prompts by embedding
+    llm_cache_similarity_threshold: float = Field(default=0.97)
+    llm_cache_size: int = Field(default=1000)
+    llm_cache_ttl_seconds: int = Field(default=3600)
+
+    # ----- Startup -----
+    warmup_enabled: bool = Field(default=True)  # Load models/indexes before reporting ready
+    warmup_retry_initial_s: float = Field(default=1.0)  # Backoff after a failed warmup (doubles per attempt)
+    warmup_retry_max_s: float = Field(default=60.0)
 
     # ----- ChromaDB -----
     chroma_persist_dir: str = Field(default="./data/chroma_db")
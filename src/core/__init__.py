@@ -1,99 +1,100 @@
-"""Core business logic for API Integration Assistant."""
+"""Core business logic for API Integration Assistant.
 
-from src.core.embeddings import EmbeddingService
-from src.core.vector_store import VectorStore
-from src.core.llm_client import LLMClient
-from src.core.exceptions import (
-    APIAssistantError,
-    LLMError,
-    LLMConnectionError,
-    LLMTimeoutError,
-    LLMRateLimitError,
-    LLMResponseError,
-    LLMCircuitBreakerOpen,
-)
-from src.core.circuit_breaker import CircuitBreaker, CircuitState
-from src.core.health import HealthCheck, HealthStatus, check_system_health
-from src.core.logging_config import (
-    configure_logging,
-    configure_production_logging,
-    configure_development_logging,
-    get_logger,
-    set_request_id,
-    get_request_id,
-    clear_request_id,
-    log_performance,
-    log_performance_async,
-    LogContext,
-)
-from src.core.performance import (
-    PerformanceMonitor,
-    monitor_performance,
-    monitor_performance_async,
-    get_performance_report,
-    get_slow_operations,
-    log_performance_report,
-)
-from src.core.cache import (
-    LRUCache,
-    EmbeddingCache,
-    SemanticQueryCache,
-    get_embedding_cache,
-    get_query_cache,
-)
-from src.core.security import (
-    ValidationError,
-    InputValidator,
-    InputSanitizer,
-    RateLimiter,
-    get_validator,
-    get_sanitizer,
-    get_rate_limiter,
-)
-from src.core.hybrid_search import (
-    BM25,
-    HybridSearch,
-    SearchResult,
-    create_bm25_index,
-    get_bm25,
-    get_hybrid_search,
-)
-from src.core.cross_encoder import (
-    CrossEncoderReranker,
-    RerankResult,
-    get_cross_encoder_reranker,
-    rerank_results,
-)
-from src.core.query_expansion import (
-    QueryExpander,
-    ExpandedQuery,
-    get_query_expander,
-    expand_query,
-)
-from src.core.result_diversification import (
-    ResultDiversifier,
-    get_result_diversifier,
-    diversify_results,
-)
-from src.core.advanced_filtering import (
-    FilterOperator,
-    Filter,
-    MetadataFilter,
-    ContentFilter,
-    CombinedFilter,
-    FacetResult,
-    FilterBuilder,
-    FacetedSearch,
-    create_filter,
-    combine_filters,
-    compute_facets,
-)
+Exports are loaded lazily (PEP 562): ``from src.core import VectorStore``
+imports src.core.vector_store on first access, so importing a light
+submodule such as src.core.exceptions does not load sentence-transformers,
+torch or ChromaDB.
+"""
+
+import importlib
+from typing import Any
+
+# Exported name -> submodule of src.core that defines it
+_EXPORTS = {
+    "EmbeddingService": "embeddings",
+    "AsyncVectorStore": "vector_store",
+    "VectorStore": "vector_store",
+    "LLMClient": "llm_client",
+    "APIAssistantError": "exceptions",
+    "LLMError": "exceptions",
+    "LLMConnectionError": "exceptions",
+    "LLMTimeoutError": "exceptions",
+    "LLMRateLimitError": "exceptions",
+    "LLMResponseError": "exceptions",
+    "LLMCircuitBreakerOpen": "exceptions",
+    "CircuitBreaker": "circuit_breaker",
+    "CircuitState": "circuit_breaker",
+    "HealthCheck": "health",
+    "HealthStatus": "health",
+    "check_system_health": "health",
+    "configure_logging": "logging_config",
+    "configure_production_logging": "logging_config",
+    "configure_development_logging": "logging_config",
+    "get_logger": "logging_config",
+    "set_request_id": "logging_config",
+    "get_request_id": "logging_config",
+    "clear_request_id": "logging_config",
+    "log_performance": "logging_config",
+    "log_performance_async": "logging_config",
+    "LogContext": "logging_config",
+    "PerformanceMonitor": "performance",
+    "monitor_performance": "performance",
+    "monitor_performance_async": "performance",
+    "get_performance_report": "performance",
+    "get_slow_operations": "performance",
+    "log_performance_report": "performance",
+    "LRUCache": "cache",
+    "EmbeddingCache": "cache",
+    "SemanticQueryCache": "cache",
+    "get_embedding_cache": "cache",
+    "get_query_cache": "cache",
+    "ValidationError": "security",
+    "InputValidator": "security",
+    "InputSanitizer": "security",
+    "RateLimiter": "security",
+    "get_validator": "security",
+    "get_sanitizer": "security",
+    "get_rate_limiter": "security",
+    "BM25": "hybrid_search",
+    "InvertedIndexBM25": "hybrid_search",
+    "HybridSearch": "hybrid_search",
+    "SearchResult": "hybrid_search",
+    "create_bm25_index": "hybrid_search",
+    "get_bm25": "hybrid_search",
+    "get_hybrid_search": "hybrid_search",
+    "CrossEncoderReranker": "cross_encoder",
+    "RerankResult": "cross_encoder",
+    "get_cross_encoder_reranker": "cross_encoder",
+    "rerank_results": "cross_encoder",
+    "QueryExpander": "query_expansion",
+    "ExpandedQuery": "query_expansion",
+    "get_query_expander": "query_expansion",
+    "expand_query": "query_expansion",
+    "ResultDiversifier": "result_diversification",
+    "get_result_diversifier": "result_diversification",
+    "diversify_results": "result_diversification",
+    "FilterOperator": "advanced_filtering",
+    "Filter": "advanced_filtering",
+    "MetadataFilter": "advanced_filtering",
+    "ContentFilter": "advanced_filtering",
+    "CombinedFilter": "advanced_filtering",
+    "FacetResult": "advanced_filtering",
+    "FilterBuilder": "advanced_filtering",
+    "FacetedSearch": "advanced_filtering",
+    "create_filter": "advanced_filtering",
+    "combine_filters": "advanced_filtering",
+    "compute_facets": "advanced_filtering",
+    "CandidateSet": "metadata_index",
+    "MetadataIndex": "metadata_index",
+}
 
 __all__ = [
     "EmbeddingService",
     "VectorStore",
+    "AsyncVectorStore",
     "LLMClient",
     "BM25",
+    "InvertedIndexBM25",
     "HybridSearch",
     "SearchResult",
     "create_bm25_index",
@@ -121,6 +122,8 @@ __all__ = [
     "create_filter",
     "combine_filters",
     "compute_facets",
+    "MetadataIndex",
+    "CandidateSet",
     "APIAssistantError",
     "LLMError",
     "LLMConnectionError",
@@ -162,3 +165,18 @@ __all__ = [
     "get_sanitizer",
     "get_rate_limiter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """List exported names alongside the module's own attributes."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -10,6 +10,7 @@ Features:
 - Faceted search (count aggregations by field)
 - Integration with ChromaDB metadata filters
 - Type-safe filter building
+- Filters compiled once into predicate closures for client-side filtering
 
 Author: API Assistant Team
 Date: 2025-12-27
@@ -20,10 +21,33 @@ import structlog
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Union
 
 logger = structlog.get_logger(__name__)
 
+# Compiled filter: (metadata, content) -> bool
+Predicate = Callable[[Dict[str, Any], str], bool]
+
+_MISSING = object()
+
+
+class FilterPlan(NamedTuple):
+    """A compiled filter with the estimates used to order AND/OR branches."""
+
+    predicate: Predicate
+    selectivity: float  # Estimated fraction of documents that match
+    cost: float  # Relative evaluation cost
+
+
+def _order_for_and(plans: List[FilterPlan]) -> List[FilterPlan]:
+    """Cheapest-to-reject first: ascending cost / P(false)."""
+    return sorted(plans, key=lambda p: p.cost / max(1.0 - p.selectivity, 1e-6))
+
+
+def _order_for_or(plans: List[FilterPlan]) -> List[FilterPlan]:
+    """Cheapest-to-accept first: ascending cost / P(true)."""
+    return sorted(plans, key=lambda p: p.cost / max(p.selectivity, 1e-6))
+
 
 class FilterOperator(Enum):
     """Filter operators."""
@@ -53,8 +77,62 @@ class FilterOperator(Enum):
     NOT = "not"  # Logical NOT
 
 
+# (selectivity, cost) estimates per operator, used only for ordering
+_OPERATOR_ESTIMATES = {
+    FilterOperator.EQ: (0.1, 1.0),
+    FilterOperator.NE: (0.9, 1.0),
+    FilterOperator.GT: (0.5, 1.0),
+    FilterOperator.GTE: (0.5, 1.0),
+    FilterOperator.LT: (0.5, 1.0),
+    FilterOperator.LTE: (0.5, 1.0),
+    FilterOperator.CONTAINS: (0.3, 2.0),
+    FilterOperator.NOT_CONTAINS: (0.7, 2.0),
+    FilterOperator.STARTS_WITH: (0.3, 1.5),
+    FilterOperator.ENDS_WITH: (0.3, 1.5),
+    FilterOperator.REGEX: (0.3, 5.0),
+    FilterOperator.IN: (0.2, 1.0),
+    FilterOperator.NOT_IN: (0.8, 1.0),
+}
+
+# Content is much longer than a metadata value
+_CONTENT_COST_FACTOR = 10.0
+
+
 class Filter(ABC):
-    """Base class for all filters."""
+    """
+    Base class for all filters.
+
+    ``compile()`` turns a filter into a predicate once (regexes compiled,
+    membership lists turned into sets, AND/OR branches ordered by estimated
+    selectivity) and caches it on the instance, so filters should not be
+    mutated after they are first used.
+    """
+
+    def compile(self) -> Predicate:
+        """Get the compiled predicate (metadata, content) -> bool."""
+        return self.plan().predicate
+
+    def plan(self) -> FilterPlan:
+        """Get the compiled filter with its ordering estimates (cached)."""
+        plan = self.__dict__.get("_plan")
+        if plan is None:
+            plan = self._compile()
+            self._plan = plan
+        return plan
+
+    def _compile(self) -> FilterPlan:
+        """Compile the filter (subclasses without a compiler fall back to matches())."""
+        return FilterPlan(lambda metadata, content="": self.matches(metadata, content), 0.5, 5.0)
+
+    def fingerprint(self) -> str:
+        """
+        Get a stable string identifying the filter's semantics.
+
+        Equal filters built separately have equal fingerprints, so it can be
+        used in cache keys (e.g. the search result cache).
+        """
+        state = {k: v for k, v in self.__dict__.items() if not k.startswith("_")}
+        return f"{type(self).__name__}({state!r})"
 
     @abstractmethod
     def to_chroma_where(self) -> Optional[Dict[str, Any]]:
@@ -132,44 +210,25 @@ class MetadataFilter(Filter):
 
     def matches(self, metadata: Dict[str, Any], content: str = "") -> bool:
         """Check if document matches filter."""
-        if self.field not in metadata:
-            return False
+        return self.compile()(metadata, content)
+
+    def _compile(self) -> FilterPlan:
+        """Compile to a closure over the field value."""
+        test = _compile_value_test(self.operator, self.value)
+        field = self.field
 
-        field_value = metadata[self.field]
-
-        if self.operator == FilterOperator.EQ:
-            return field_value == self.value
-        elif self.operator == FilterOperator.NE:
-            return field_value != self.value
-        elif self.operator == FilterOperator.GT:
-            return field_value > self.value
-        elif self.operator == FilterOperator.GTE:
-            return field_value >= self.value
-        elif self.operator == FilterOperator.LT:
-            return field_value < self.value
-        elif self.operator == FilterOperator.LTE:
-            return field_value <= self.value
-        elif self.operator == FilterOperator.IN:
-            return field_value in self.value
-        elif self.operator == FilterOperator.NOT_IN:
-            return field_value not in self.value
-        elif self.operator == FilterOperator.CONTAINS:
-            return self.value in str(field_value)
-        elif self.operator == FilterOperator.NOT_CONTAINS:
-            return self.value not in str(field_value)
-        elif self.operator == FilterOperator.STARTS_WITH:
-            return str(field_value).startswith(self.value)
-        elif self.operator == FilterOperator.ENDS_WITH:
-            return str(field_value).endswith(self.value)
-        elif self.operator == FilterOperator.REGEX:
-            try:
-                return bool(re.search(self.value, str(field_value)))
-            except re.error:
-                # Invalid regex pattern, return False
-                logger.warning("Invalid regex pattern", pattern=self.value)
+        def predicate(metadata: Dict[str, Any], content: str = "") -> bool:
+            field_value = metadata.get(field, _MISSING)
+            if field_value is _MISSING:
                 return False
+            return test(field_value)
+
+        selectivity, cost = _OPERATOR_ESTIMATES.get(self.operator, (0.5, 1.0))
+        return FilterPlan(predicate, selectivity, cost)
 
-        return False
+    def fingerprint(self) -> str:
+        """Get a stable string identifying the filter's semantics."""
+        return f"meta({self.field!r},{self.operator.value},{self.value!r})"
 
 
 class ContentFilter(Filter):
@@ -208,23 +267,24 @@ class ContentFilter(Filter):
 
     def matches(self, metadata: Dict[str, Any], content: str = "") -> bool:
         """Check if document matches filter."""
-        if self.operator == FilterOperator.CONTAINS:
-            return self.value in content
-        elif self.operator == FilterOperator.NOT_CONTAINS:
-            return self.value not in content
-        elif self.operator == FilterOperator.STARTS_WITH:
-            return content.startswith(self.value)
-        elif self.operator == FilterOperator.ENDS_WITH:
-            return content.endswith(self.value)
-        elif self.operator == FilterOperator.REGEX:
-            try:
-                return bool(re.search(self.value, content))
-            except re.error:
-                # Invalid regex pattern, return False
-                logger.warning("Invalid regex pattern", pattern=self.value)
-                return False
+        return self.compile()(metadata, content)
+
+    def _compile(self) -> FilterPlan:
+        """Compile to a closure over the document content."""
+        if self.operator in _STRING_OPERATORS:
+            test = _compile_value_test(self.operator, self.value)
+        else:
+            test = _never
+
+        def predicate(metadata: Dict[str, Any], content: str = "") -> bool:
+            return test(content)
 
-        return False
+        selectivity, cost = _OPERATOR_ESTIMATES.get(self.operator, (0.5, 1.0))
+        return FilterPlan(predicate, selectivity, cost * _CONTENT_COST_FACTOR)
+
+    def fingerprint(self) -> str:
+        """Get a stable string identifying the filter's semantics."""
+        return f"content({self.operator.value},{self.value!r})"
 
 
 class CombinedFilter(Filter):
@@ -254,6 +314,10 @@ class CombinedFilter(Filter):
         self.operator = operator
         self.filters = filters
 
+    def fingerprint(self) -> str:
+        """Get a stable string identifying the filter's semantics."""
+        return f"{self.operator.value}({','.join(f.fingerprint() for f in self.filters)})"
+
     def to_chroma_where(self) -> Optional[Dict[str, Any]]:
         """Convert to ChromaDB where clause."""
         where_clauses = []
@@ -315,14 +379,119 @@ class CombinedFilter(Filter):
 
     def matches(self, metadata: Dict[str, Any], content: str = "") -> bool:
         """Check if document matches filter."""
+        return self.compile()(metadata, content)
+
+    def _compile(self) -> FilterPlan:
+        """Compile children and order them so AND/OR short-circuit early."""
+        plans = [f.plan() for f in self.filters]
+
+        if self.operator == FilterOperator.NOT:
+            inner = plans[0].predicate
+
+            def negation(metadata: Dict[str, Any], content: str = "") -> bool:
+                return not inner(metadata, content)
+
+            return FilterPlan(negation, 1.0 - plans[0].selectivity, plans[0].cost)
+
         if self.operator == FilterOperator.AND:
-            return all(f.matches(metadata, content) for f in self.filters)
-        elif self.operator == FilterOperator.OR:
-            return any(f.matches(metadata, content) for f in self.filters)
-        elif self.operator == FilterOperator.NOT:
-            return not self.filters[0].matches(metadata, content)
+            plans = _order_for_and(plans)
+            predicates = tuple(p.predicate for p in plans)
+
+            def conjunction(metadata: Dict[str, Any], content: str = "") -> bool:
+                for predicate in predicates:
+                    if not predicate(metadata, content):
+                        return False
+                return True
+
+            selectivity = 1.0
+            for plan in plans:
+                selectivity *= plan.selectivity
+            return FilterPlan(conjunction, selectivity, sum(p.cost for p in plans))
+
+        plans = _order_for_or(plans)
+        predicates = tuple(p.predicate for p in plans)
+
+        def disjunction(metadata: Dict[str, Any], content: str = "") -> bool:
+            for predicate in predicates:
+                if predicate(metadata, content):
+                    return True
+            return False
+
+        rejected = 1.0
+        for plan in plans:
+            rejected *= 1.0 - plan.selectivity
+        return FilterPlan(disjunction, 1.0 - rejected, sum(p.cost for p in plans))
+
+
+_STRING_OPERATORS = {
+    FilterOperator.CONTAINS,
+    FilterOperator.NOT_CONTAINS,
+    FilterOperator.STARTS_WITH,
+    FilterOperator.ENDS_WITH,
+    FilterOperator.REGEX,
+}
+
 
-        return False
+def _never(value: Any) -> bool:
+    return False
+
+
+def _compile_value_test(operator: FilterOperator, expected: Any) -> Callable[[Any], bool]:
+    """
+    Compile one operator into a test on a single value.
+
+    String operators apply to str(value); membership lists become sets when
+    their items are hashable.
+    """
+    if operator == FilterOperator.EQ:
+        return lambda value: value == expected
+    if operator == FilterOperator.NE:
+        return lambda value: value != expected
+    if operator == FilterOperator.GT:
+        return lambda value: value > expected
+    if operator == FilterOperator.GTE:
+        return lambda value: value >= expected
+    if operator == FilterOperator.LT:
+        return lambda value: value < expected
+    if operator == FilterOperator.LTE:
+        return lambda value: value <= expected
+
+    if operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+        try:
+            members = frozenset(expected)
+        except TypeError:
+            members = None  # Unhashable items: keep list semantics
+
+        def contained(value: Any) -> bool:
+            if members is not None:
+                try:
+                    return value in members
+                except TypeError:
+                    pass  # Unhashable value
+            return value in expected
+
+        if operator == FilterOperator.IN:
+            return contained
+        return lambda value: not contained(value)
+
+    if operator == FilterOperator.CONTAINS:
+        return lambda value: expected in str(value)
+    if operator == FilterOperator.NOT_CONTAINS:
+        return lambda value: expected not in str(value)
+    if operator == FilterOperator.STARTS_WITH:
+        return lambda value: str(value).startswith(expected)
+    if operator == FilterOperator.ENDS_WITH:
+        return lambda value: str(value).endswith(expected)
+    if operator == FilterOperator.REGEX:
+        try:
+            pattern = re.compile(expected)
+        except re.error:
+            # Invalid regex pattern never matches
+            logger.warning("Invalid regex pattern", pattern=expected)
+            return _never
+        return lambda value: pattern.search(str(value)) is not None
+
+    return _never
 
 
 @dataclass
@@ -516,7 +685,8 @@ class FacetedSearch:
         """
         Apply filter to documents (client-side filtering).
 
-        Useful when filter cannot be converted to ChromaDB syntax.
+        Useful when filter cannot be converted to ChromaDB syntax. The
+        filter is compiled once, not re-interpreted per document.
 
         Args:
             documents: Documents to filter
@@ -525,14 +695,12 @@ class FacetedSearch:
         Returns:
             Filtered documents
         """
-        filtered = []
-
-        for doc in documents:
-            metadata = doc.get("metadata", {})
-            content = doc.get("content", "")
+        predicate = filter.compile()
 
-            if filter.matches(metadata, content):
-                filtered.append(doc)
+        filtered = [
+            doc for doc in documents
+            if predicate(doc.get("metadata") or {}, doc.get("content", ""))
+        ]
 
         logger.debug(
             "Applied client-side filter",
@@ -606,6 +774,8 @@ __all__ = [
     "FacetResult",
     "FilterBuilder",
     "FacetedSearch",
+    "FilterPlan",
+    "Predicate",
     "create_filter",
     "combine_filters",
     "compute_facets",
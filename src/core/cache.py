@@ -10,16 +10,20 @@ Features:
 """
 
 import hashlib
+import heapq
 import pickle
+import sqlite3
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import structlog
 
+from src.config import settings
 from src.core.performance import PerformanceMonitor
 
 logger = structlog.get_logger(__name__)
@@ -187,6 +191,141 @@ class LRUCache:
             }
 
 
+# ============================================================================
+# Persistent Embedding Store
+# ============================================================================
+
+
+class PersistentEmbeddingStore:
+    """
+    On-disk embedding cache backed by SQLite.
+
+    Second tier behind the in-process EmbeddingCache: survives restarts and
+    can be shared by instances mounting the same volume. Entries are keyed
+    by (model, sha256 of the text), so switching models never returns stale
+    vectors; get_embedding_cache() includes the inference backend in the
+    model key for the same reason. Vectors are stored as float32 or float16 blobs and always
+    returned as float32.
+
+    Usage:
+        store = PersistentEmbeddingStore("./data/embedding_cache.db", model="all-MiniLM-L6-v2")
+        found = store.get_many([text_hash])
+        store.put_many({text_hash: embedding})
+    """
+
+    # Hashes per SELECT (stays below SQLite's bound-parameter limit)
+    LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, path: str, model: str, dtype: str = "float32"):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            path: SQLite database file
+            model: Embedding model name (part of every key)
+            dtype: Storage precision, "float32" or "float16"
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+        self.path = Path(path)
+        self.model = model
+        self.dtype = dtype
+        self.name = "embedding_disk_cache"
+        self._lock = Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dtype TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+        monitor = PerformanceMonitor.get_instance()
+        monitor.register_cache(self.name, max_size=0)
+
+    def get_many(self, text_hashes: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up embeddings by text hash.
+
+        Args:
+            text_hashes: sha256 hex digests of the texts
+
+        Returns:
+            Map of found hashes to float32 embeddings
+        """
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for i in range(0, len(text_hashes), self.LOOKUP_BATCH_SIZE):
+                batch = text_hashes[i:i + self.LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, dtype, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [self.model, *batch],
+                )
+                for text_hash, dtype, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=dtype).astype(np.float32)
+
+        monitor = PerformanceMonitor.get_instance()
+        for _ in range(len(found)):
+            monitor.record_cache_hit(self.name)
+        for _ in range(len(text_hashes) - len(found)):
+            monitor.record_cache_miss(self.name)
+
+        return found
+
+    def put_many(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """
+        Store embeddings by text hash (existing entries are replaced).
+
+        Args:
+            embeddings: Map of sha256 hex digests to embedding vectors
+        """
+        if not embeddings:
+            return
+
+        rows = [
+            (self.model, text_hash, self.dtype, np.asarray(vector, dtype=self.dtype).tobytes())
+            for text_hash, vector in embeddings.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text_hash, dtype, vector) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Get the number of stored embeddings for this model."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM embeddings WHERE model = ?", (self.model,)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all stored embeddings for this model."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings WHERE model = ?", (self.model,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 # ============================================================================
 # Embedding Cache
 # ============================================================================
@@ -197,26 +336,34 @@ class EmbeddingCache:
     Cache for text embeddings.
 
     Caches embeddings to avoid redundant computation.
-    Uses content hashing for cache keys.
+    Uses content hashing for cache keys. An optional persistent store is
+    consulted on in-process misses before the embedding function is called.
 
     Usage:
         cache = EmbeddingCache(max_size=5000)
         embedding = cache.get_embedding(text, embed_fn)
     """
 
-    def __init__(self, max_size: int = 5000, ttl: float = 3600):
+    def __init__(
+        self,
+        max_size: int = 5000,
+        ttl: float = 3600,
+        persistent: Optional[PersistentEmbeddingStore] = None,
+    ):
         """
         Initialize embedding cache.
 
         Args:
             max_size: Maximum number of cached embeddings
             ttl: Time-to-live in seconds (default: 1 hour)
+            persistent: Optional on-disk second tier
         """
         self.cache = LRUCache(
             max_size=max_size,
             ttl=ttl,
             name="embedding_cache",
         )
+        self.persistent = persistent
 
     def _get_key(self, text: str) -> str:
         """Generate cache key from text."""
@@ -237,6 +384,27 @@ class EmbeddingCache:
         Returns:
             Embedding vector
         """
+        cached = self.lookup(text)
+        if cached is not None:
+            return cached
+
+        # Generate embedding
+        logger.debug("embedding_cache_miss", text_length=len(text))
+        embedding = embed_fn(text)
+
+        self.store(text, embedding)
+        return embedding
+
+    def lookup(self, text: str) -> Optional[np.ndarray]:
+        """
+        Get a cached embedding without computing it.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            Cached embedding, or None if neither tier has it
+        """
         key = self._get_key(text)
         cached = self.cache.get(key)
 
@@ -244,14 +412,26 @@ class EmbeddingCache:
             logger.debug("embedding_cache_hit", text_length=len(text))
             return cached
 
-        # Generate embedding
-        logger.debug("embedding_cache_miss", text_length=len(text))
-        embedding = embed_fn(text)
+        if self.persistent is not None:
+            stored = self.persistent.get_many([key]).get(key)
+            if stored is not None:
+                self.cache.put(key, stored)
+                return stored
 
-        # Cache it
-        self.cache.put(key, embedding)
+        return None
 
-        return embedding
+    def store(self, text: str, embedding: np.ndarray) -> None:
+        """
+        Cache an embedding computed by the caller.
+
+        Args:
+            text: Text that was embedded
+            embedding: Its embedding vector
+        """
+        key = self._get_key(text)
+        self.cache.put(key, embedding)
+        if self.persistent is not None:
+            self.persistent.put_many({key: embedding})
 
     def get_embeddings_batch(
         self,
@@ -271,6 +451,7 @@ class EmbeddingCache:
         embeddings = []
         uncached_indices = []
         uncached_texts = []
+        uncached_keys = []
 
         # Check cache for each text
         for i, text in enumerate(texts):
@@ -283,6 +464,21 @@ class EmbeddingCache:
                 embeddings.append(None)  # Placeholder
                 uncached_indices.append(i)
                 uncached_texts.append(text)
+                uncached_keys.append(key)
+
+        # Check the persistent tier for the in-process misses in one pass
+        if uncached_keys and self.persistent is not None:
+            stored = self.persistent.get_many(list(dict.fromkeys(uncached_keys)))
+            remaining = []
+            for idx, text, key in zip(uncached_indices, uncached_texts, uncached_keys):
+                if key in stored:
+                    embeddings[idx] = stored[key]
+                    self.cache.put(key, stored[key])
+                else:
+                    remaining.append((idx, text, key))
+            uncached_indices = [idx for idx, _, _ in remaining]
+            uncached_texts = [text for _, text, _ in remaining]
+            uncached_keys = [key for _, _, key in remaining]
 
         # Generate uncached embeddings
         if uncached_texts:
@@ -297,15 +493,57 @@ class EmbeddingCache:
             new_embeddings = embed_fn(uncached_texts)
 
             # Fill in placeholders and cache
-            for idx, text, embedding in zip(uncached_indices, uncached_texts, new_embeddings):
+            for idx, key, embedding in zip(uncached_indices, uncached_keys, new_embeddings):
                 embeddings[idx] = embedding
-                key = self._get_key(text)
                 self.cache.put(key, embedding)
 
+            if self.persistent is not None:
+                self.persistent.put_many(dict(zip(uncached_keys, new_embeddings)))
+
         return embeddings
 
+    def get_embeddings_matrix(
+        self,
+        texts: List[str],
+        embed_fn: Any,
+    ) -> np.ndarray:
+        """
+        Get multiple embeddings with caching as one contiguous float32 matrix.
+
+        When none of the texts are cached, the matrix produced by embed_fn is
+        returned as is; otherwise cached rows and newly computed rows are
+        copied once into a preallocated matrix.
+
+        Args:
+            texts: List of texts to embed
+            embed_fn: Function to generate embeddings for a batch of texts
+
+        Returns:
+            Matrix of shape (len(texts), dimension)
+        """
+        computed = None
+
+        def embed_batch(batch: List[str]) -> np.ndarray:
+            nonlocal computed
+            computed = np.ascontiguousarray(embed_fn(batch), dtype=np.float32)
+            return computed
+
+        rows = self.get_embeddings_batch(texts, embed_batch)
+
+        # Every text was embedded in order: the batch output is the result
+        if computed is not None and len(computed) == len(texts):
+            return computed
+
+        if not rows:
+            return np.empty((0, 0), dtype=np.float32)
+
+        matrix = np.empty((len(rows), len(rows[0])), dtype=np.float32)
+        for i, row in enumerate(rows):
+            matrix[i] = row
+        return matrix
+
     def clear(self) -> None:
-        """Clear all cached embeddings."""
+        """Clear the in-process cached embeddings (the persistent tier is kept)."""
         self.cache.clear()
 
 
@@ -319,7 +557,14 @@ class SemanticQueryCache:
     Cache for query results with semantic similarity matching.
 
     Caches query results and retrieves them for semantically similar queries.
-    Uses cosine similarity for matching.
+    Uses cosine similarity for matching. An optional scope (e.g. search mode
+    and filters) restricts matches to entries cached under the same scope.
+
+    Embeddings are stored normalized in one contiguous float32 matrix (grown
+    by doubling up to max_size rows), so a lookup is a single matrix-vector
+    product plus argmax. Freed rows are reused, expiry is tracked in a
+    min-heap and eviction is least-recently-used, all without scanning the
+    entries in Python.
 
     Usage:
         cache = SemanticQueryCache(max_size=100, similarity_threshold=0.95)
@@ -327,11 +572,18 @@ class SemanticQueryCache:
         cache.put(query, query_embedding, result)
     """
 
+    # Rows allocated on first put (the matrix doubles from here as needed)
+    INITIAL_CAPACITY = 1024
+
+    # Similarity above which a put replaces the matching entry
+    DUPLICATE_SIMILARITY = 0.9999
+
     def __init__(
         self,
         max_size: int = 100,
         similarity_threshold: float = 0.95,
         ttl: float = 1800,
+        name: str = "semantic_query_cache",
     ):
         """
         Initialize semantic query cache.
@@ -340,108 +592,254 @@ class SemanticQueryCache:
             max_size: Maximum number of cached queries
             similarity_threshold: Minimum cosine similarity for cache hit (0-1)
             ttl: Time-to-live in seconds (default: 30 minutes)
+            name: Cache name for metrics
         """
         self.max_size = max_size
         self.similarity_threshold = similarity_threshold
         self.ttl = ttl
-        self.name = "semantic_query_cache"
-        self._cache: List[Tuple[str, np.ndarray, Any, float]] = []
+        self.name = name
         self._lock = Lock()
 
+        self._matrix: Optional[np.ndarray] = None  # (capacity, dim) normalized embeddings
+        self._occupied = np.zeros(0, dtype=bool)
+        self._scope_ids = np.zeros(0, dtype=np.int32)
+        self._created_at = np.zeros(0, dtype=np.float64)
+        self._queries: List[Optional[str]] = []
+        self._results: List[Any] = []
+        self._used = 0  # Rows ever used; lookups only scan these
+        self._free: List[int] = []  # Freed rows below _used
+        self._lru: OrderedDict[int, None] = OrderedDict()  # Slot order, least recent first
+        self._expiry: List[Tuple[float, int]] = []  # Min-heap of (created_at, slot)
+        self._scope_index: Dict[str, int] = {}  # Scope -> id
+        self._scope_names: Dict[int, str] = {}  # Scope id -> scope
+        self._scope_counts: Dict[int, int] = {}  # Scope id -> live entries
+        self._next_scope_id = 0
+
         # Register with performance monitor
         monitor = PerformanceMonitor.get_instance()
         monitor.register_cache(self.name, max_size)
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """Calculate cosine similarity between two vectors."""
-        return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> Optional[np.ndarray]:
+        """Convert to a unit-length float32 vector (None for a zero vector)."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+
+    def _allocate(self, dimension: int, capacity: int) -> None:
+        """(Re)allocate storage for the given number of rows, keeping used rows."""
+        matrix = np.zeros((capacity, dimension), dtype=np.float32)
+        occupied = np.zeros(capacity, dtype=bool)
+        scope_ids = np.full(capacity, -1, dtype=np.int32)
+        created_at = np.zeros(capacity, dtype=np.float64)
+
+        if self._matrix is not None:
+            matrix[:self._used] = self._matrix[:self._used]
+            occupied[:self._used] = self._occupied[:self._used]
+            scope_ids[:self._used] = self._scope_ids[:self._used]
+            created_at[:self._used] = self._created_at[:self._used]
+
+        self._matrix = matrix
+        self._occupied = occupied
+        self._scope_ids = scope_ids
+        self._created_at = created_at
+        self._queries.extend([None] * (capacity - len(self._queries)))
+        self._results.extend([None] * (capacity - len(self._results)))
+
+    def _release(self, slot: int) -> None:
+        """Free a slot (caller holds the lock)."""
+        self._occupied[slot] = False
+        self._queries[slot] = None
+        self._results[slot] = None
+        self._lru.pop(slot, None)
+        self._free.append(slot)
+
+        # Forget scopes without entries (e.g. search scopes of old generations)
+        scope_id = int(self._scope_ids[slot])
+        self._scope_counts[scope_id] -= 1
+        if self._scope_counts[scope_id] == 0:
+            del self._scope_counts[scope_id]
+            del self._scope_index[self._scope_names.pop(scope_id)]
+
+    def _expire(self, current_time: float) -> None:
+        """Release entries whose TTL has passed (caller holds the lock)."""
+        if not self.ttl:
+            return
+
+        monitor = PerformanceMonitor.get_instance()
+        while self._expiry and current_time - self._expiry[0][0] > self.ttl:
+            created_at, slot = heapq.heappop(self._expiry)
+            # Skip heap records of slots that were released or reused since
+            if self._occupied[slot] and self._created_at[slot] == created_at:
+                self._release(slot)
+                monitor.record_cache_eviction(self.name)
+
+    def _best_match(self, vector: np.ndarray, scope_id: int) -> Tuple[int, float]:
+        """Find the most similar live entry in a scope (caller holds the lock)."""
+        if self._matrix is None or self._used == 0 or vector.shape[0] != self._matrix.shape[1]:
+            return -1, 0.0
 
-    def get(self, query: str, query_embedding: np.ndarray) -> Optional[Any]:
+        similarities = self._matrix[:self._used] @ vector
+        candidates = self._occupied[:self._used] & (self._scope_ids[:self._used] == scope_id)
+        similarities = np.where(candidates, similarities, -np.inf)
+
+        slot = int(np.argmax(similarities))
+        if not np.isfinite(similarities[slot]):
+            return -1, 0.0
+        return slot, float(similarities[slot])
+
+    def get(self, query: str, query_embedding: np.ndarray, scope: str = "") -> Optional[Any]:
         """
         Get cached result for semantically similar query.
 
         Args:
             query: Query text
             query_embedding: Query embedding vector
+            scope: Only match entries cached under this scope
 
         Returns:
             Cached result if similar query found, None otherwise
         """
         monitor = PerformanceMonitor.get_instance()
+        vector = self._normalize(query_embedding)
 
         with self._lock:
-            current_time = time.time()
-
-            # Find most similar cached query
-            best_similarity = 0.0
-            best_result = None
-
-            for cached_query, cached_embedding, cached_result, created_at in self._cache:
-                # Check expiration
-                if self.ttl and (current_time - created_at) > self.ttl:
-                    continue
-
-                # Calculate similarity
-                similarity = self._cosine_similarity(query_embedding, cached_embedding)
-
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_result = cached_result
-
-            # Check if similarity meets threshold
-            if best_similarity >= self.similarity_threshold:
-                monitor.record_cache_hit(self.name)
-                logger.info(
-                    "semantic_cache_hit",
-                    query=query[:100],
-                    similarity=round(best_similarity, 4),
-                )
-                return best_result
+            self._expire(time.time())
+
+            scope_id = self._scope_index.get(scope)
+            if vector is not None and scope_id is not None:
+                slot, similarity = self._best_match(vector, scope_id)
+                if slot >= 0 and similarity >= self.similarity_threshold:
+                    self._lru.move_to_end(slot)
+                    monitor.record_cache_hit(self.name)
+                    monitor.update_cache_size(self.name, len(self._lru))
+                    logger.info(
+                        "semantic_cache_hit",
+                        query=query[:100],
+                        similarity=round(similarity, 4),
+                    )
+                    return self._results[slot]
 
             monitor.record_cache_miss(self.name)
+            monitor.update_cache_size(self.name, len(self._lru))
             return None
 
-    def put(self, query: str, query_embedding: np.ndarray, result: Any) -> None:
+    def put(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        result: Any,
+        scope: str = "",
+    ) -> None:
         """
         Cache query result.
 
+        An entry with (practically) the same embedding in the same scope is
+        replaced rather than duplicated.
+
         Args:
             query: Query text
             query_embedding: Query embedding vector
             result: Query result to cache
+            scope: Scope the entry is cached under
         """
+        vector = self._normalize(query_embedding)
+        if vector is None or self.max_size <= 0:
+            return
+
         monitor = PerformanceMonitor.get_instance()
 
         with self._lock:
-            # Remove expired entries
             current_time = time.time()
-            self._cache = [
-                entry
-                for entry in self._cache
-                if not self.ttl or (current_time - entry[3]) <= self.ttl
-            ]
+            self._expire(current_time)
 
-            # Add new entry
-            self._cache.append((query, query_embedding, result, current_time))
-
-            # Evict oldest if over capacity
-            if len(self._cache) > self.max_size:
-                self._cache.pop(0)
-                monitor.record_cache_eviction(self.name)
-
-            monitor.update_cache_size(self.name, len(self._cache))
+            if self._matrix is not None and vector.shape[0] != self._matrix.shape[1]:
+                logger.warning(
+                    "semantic_cache_dimension_changed",
+                    old=self._matrix.shape[1],
+                    new=vector.shape[0],
+                )
+                self._clear_locked()
+
+            scope_id = self._scope_index.get(scope)
+            slot = -1
+            if scope_id is not None:
+                slot, similarity = self._best_match(vector, scope_id)
+                if similarity < self.DUPLICATE_SIMILARITY:
+                    slot = -1
+
+            if slot < 0:
+                if len(self._lru) >= self.max_size:
+                    evicted, _ = self._lru.popitem(last=False)
+                    self._release(evicted)
+                    monitor.record_cache_eviction(self.name)
+
+                scope_id = self._scope_index.get(scope)
+                if scope_id is None:
+                    scope_id = self._next_scope_id
+                    self._next_scope_id += 1
+                    self._scope_index[scope] = scope_id
+                    self._scope_names[scope_id] = scope
+
+                slot = self._take_slot(vector.shape[0])
+                self._scope_ids[slot] = scope_id
+                self._scope_counts[scope_id] = self._scope_counts.get(scope_id, 0) + 1
+
+            self._matrix[slot] = vector
+            self._occupied[slot] = True
+            self._created_at[slot] = current_time
+            self._queries[slot] = query
+            self._results[slot] = result
+            self._lru[slot] = None
+            self._lru.move_to_end(slot)
+            if self.ttl:
+                heapq.heappush(self._expiry, (current_time, slot))
+
+            monitor.update_cache_size(self.name, len(self._lru))
+
+    def _take_slot(self, dimension: int) -> int:
+        """Get a free row, growing the matrix if needed (caller holds the lock)."""
+        if self._free:
+            return self._free.pop()
+
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if self._used == capacity:
+            new_capacity = min(self.max_size, max(self.INITIAL_CAPACITY, capacity * 2))
+            self._allocate(dimension, new_capacity)
+
+        slot = self._used
+        self._used += 1
+        return slot
+
+    def _clear_locked(self) -> None:
+        """Drop all entries and storage (caller holds the lock)."""
+        self._matrix = None
+        self._occupied = np.zeros(0, dtype=bool)
+        self._scope_ids = np.zeros(0, dtype=np.int32)
+        self._created_at = np.zeros(0, dtype=np.float64)
+        self._queries = []
+        self._results = []
+        self._used = 0
+        self._free = []
+        self._lru.clear()
+        self._expiry = []
+        self._scope_index = {}
+        self._scope_names = {}
+        self._scope_counts = {}
 
     def clear(self) -> None:
         """Clear all cached queries."""
         with self._lock:
-            self._cache.clear()
+            self._clear_locked()
             monitor = PerformanceMonitor.get_instance()
             monitor.update_cache_size(self.name, 0)
 
     def size(self) -> int:
         """Get current cache size."""
         with self._lock:
-            return len(self._cache)
+            return len(self._lru)
 
 
 # ============================================================================
@@ -451,13 +849,25 @@ class SemanticQueryCache:
 # Singleton cache instances
 _embedding_cache: Optional[EmbeddingCache] = None
 _query_cache: Optional[SemanticQueryCache] = None
+_search_result_cache: Optional[LRUCache] = None
+_llm_response_cache: Optional[LRUCache] = None
+_llm_semantic_cache: Optional[SemanticQueryCache] = None
 
 
 def get_embedding_cache() -> EmbeddingCache:
     """Get global embedding cache instance."""
     global _embedding_cache
     if _embedding_cache is None:
-        _embedding_cache = EmbeddingCache(max_size=5000, ttl=3600)
+        persistent = None
+        if settings.embedding_disk_cache_enabled:
+            # Backends produce slightly different vectors, so each gets its own keys
+            backend = settings.embedding_backend.strip().lower()
+            persistent = PersistentEmbeddingStore(
+                settings.embedding_disk_cache_path,
+                model=f"{settings.embedding_model}:{backend}",
+                dtype=settings.embedding_disk_cache_dtype,
+            )
+        _embedding_cache = EmbeddingCache(max_size=5000, ttl=3600, persistent=persistent)
     return _embedding_cache
 
 
@@ -466,8 +876,45 @@ def get_query_cache() -> SemanticQueryCache:
     global _query_cache
     if _query_cache is None:
         _query_cache = SemanticQueryCache(
-            max_size=100,
+            max_size=settings.semantic_cache_size,
             similarity_threshold=0.95,
             ttl=1800,
         )
     return _query_cache
+
+
+def get_search_result_cache() -> LRUCache:
+    """Get global search result cache instance (exact query matches)."""
+    global _search_result_cache
+    if _search_result_cache is None:
+        _search_result_cache = LRUCache(
+            max_size=settings.search_cache_size,
+            ttl=settings.search_cache_ttl_seconds,
+            name="search_result_cache",
+        )
+    return _search_result_cache
+
+
+def get_llm_response_cache() -> LRUCache:
+    """Get global LLM response cache instance (exact prompt matches)."""
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LRUCache(
+            max_size=settings.llm_cache_size,
+            ttl=settings.llm_cache_ttl_seconds,
+            name="llm_response_cache",
+        )
+    return _llm_response_cache
+
+
+def get_llm_semantic_cache() -> SemanticQueryCache:
+    """Get global LLM response cache instance for near-identical prompts."""
+    global _llm_semantic_cache
+    if _llm_semantic_cache is None:
+        _llm_semantic_cache = SemanticQueryCache(
+            max_size=settings.llm_cache_size,
+            similarity_threshold=settings.llm_cache_similarity_threshold,
+            ttl=settings.llm_cache_ttl_seconds,
+            name="llm_semantic_cache",
+        )
+    return _llm_semantic_cache
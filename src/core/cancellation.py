@@ -0,0 +1,78 @@
+"""
+Request-scoped cancellation for work done on behalf of an HTTP client.
+
+Handlers pass ``request.is_disconnected`` down to the services as a
+DisconnectCheck. Services call check_disconnected() between stages and wrap
+long stages (scraping, LLM generation) in run_until_disconnected(), which
+polls the check while the stage runs and cancels it once the client is gone.
+Both raise RequestCancelledError naming the stage that was stopped.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+import structlog
+
+from src.config import settings
+from src.core.exceptions import RequestCancelledError
+
+logger = structlog.get_logger(__name__)
+
+# Returns True once the client has disconnected (e.g. Request.is_disconnected)
+DisconnectCheck = Callable[[], Awaitable[bool]]
+
+
+async def check_disconnected(is_disconnected: Optional[DisconnectCheck], stage: str) -> None:
+    """
+    Stop before a stage if the client has disconnected.
+
+    Args:
+        is_disconnected: Disconnect check, or None when not tied to a client.
+        stage: Name of the stage about to run.
+
+    Raises:
+        RequestCancelledError: If the client has disconnected.
+    """
+    if is_disconnected is not None and await is_disconnected():
+        raise RequestCancelledError("Client disconnected", details={"stage": stage})
+
+
+async def run_until_disconnected(
+    awaitable: Awaitable[Any],
+    is_disconnected: Optional[DisconnectCheck],
+    stage: str,
+    poll_interval: Optional[float] = None,
+) -> Any:
+    """
+    Await a stage, cancelling it if the client disconnects first.
+
+    Args:
+        awaitable: The stage's coroutine or future.
+        is_disconnected: Disconnect check, or None to simply await the stage.
+        stage: Name of the stage (reported on cancellation).
+        poll_interval: Seconds between checks (default: settings.disconnect_poll_interval).
+
+    Returns:
+        The stage's result.
+
+    Raises:
+        RequestCancelledError: If the client disconnected while the stage ran.
+    """
+    if is_disconnected is None:
+        return await awaitable
+
+    interval = poll_interval or settings.disconnect_poll_interval
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                return task.result()
+            if await is_disconnected():
+                logger.info("Client disconnected, cancelling stage", stage=stage)
+                raise RequestCancelledError("Client disconnected", details={"stage": stage})
+    finally:
+        # Also on outer cancellation: never leave the stage running detached
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
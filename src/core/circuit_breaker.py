@@ -119,6 +119,73 @@ class CircuitBreaker:
             LLMCircuitBreakerOpen: If circuit is open
             Exception: Any exception raised by func
         """
+        self._before_call()
+
+        # Try the call
+        try:
+            start_time = time.time()
+            result = func(*args, **kwargs)
+            latency = time.time() - start_time
+
+            self._on_success(latency)
+            return result
+
+        except Exception as e:
+            self._on_failure(e)
+            raise
+
+        except BaseException:
+            # Cancelled or interrupted: not a verdict on the service
+            self._on_abandoned()
+            raise
+
+    async def acall(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+
+        Shares state with call(), so sync and async callers open and close
+        the same circuit. A cancelled call (e.g. on client disconnect) counts
+        as neither success nor failure, but frees its half-open test slot.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func
+
+        Raises:
+            LLMCircuitBreakerOpen: If circuit is open
+            Exception: Any exception raised by func
+        """
+        self._before_call()
+
+        try:
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            latency = time.time() - start_time
+
+            self._on_success(latency)
+            return result
+
+        except Exception as e:
+            self._on_failure(e)
+            raise
+
+        except BaseException:
+            # Cancelled or interrupted: not a verdict on the service
+            self._on_abandoned()
+            raise
+
+    def _before_call(self):
+        """
+        Admit or reject a call based on the circuit state.
+
+        Raises:
+            LLMCircuitBreakerOpen: If circuit is open or the half-open test
+                call limit is reached
+        """
         # Check if circuit should transition from OPEN to HALF_OPEN
         if self.state == CircuitState.OPEN:
             if self._should_attempt_reset():
@@ -149,19 +216,6 @@ class CircuitBreaker:
                 )
             self.half_open_attempts += 1
 
-        # Try the call
-        try:
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            latency = time.time() - start_time
-
-            self._on_success(latency)
-            return result
-
-        except Exception as e:
-            self._on_failure(e)
-            raise
-
     def _on_success(self, latency: float):
         """
         Handle successful call.
@@ -226,6 +280,16 @@ class CircuitBreaker:
                 )
                 self._transition_to_open()
 
+    def _on_abandoned(self):
+        """Handle a call that was cancelled or interrupted before finishing."""
+        if self.state == CircuitState.HALF_OPEN and self.half_open_attempts > 0:
+            # Free the test slot so the next call can probe the service
+            self.half_open_attempts -= 1
+            logger.info(
+                "circuit_breaker_test_call_abandoned",
+                name=self.name,
+            )
+
     def _transition_to_open(self):
         """Transition circuit to OPEN state."""
         self.state = CircuitState.OPEN
@@ -17,10 +17,12 @@ import time
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import structlog
-from sentence_transformers import CrossEncoder as STCrossEncoder
 
+from src.config import settings
 from src.core.cache import LRUCache
+from src.core.inference_backends import load_cross_encoder
 
 logger = structlog.get_logger(__name__)
 
@@ -76,6 +78,7 @@ class CrossEncoderReranker:
         max_length: int = 512,
         batch_size: int = 32,
         use_cache: bool = True,
+        backend: Optional[str] = None,
     ):
         """
         Initialize cross-encoder re-ranker.
@@ -86,8 +89,10 @@ class CrossEncoderReranker:
             max_length: Maximum sequence length
             batch_size: Batch size for processing
             use_cache: Whether to cache rerank scores
+            backend: Inference backend ('torch', 'onnx', 'int8'; None=settings)
         """
         self.model_name = model_name
+        self.backend = backend or settings.reranker_backend
         self.max_length = max_length
         self.batch_size = batch_size
         self.use_cache = use_cache
@@ -104,16 +109,21 @@ class CrossEncoderReranker:
             model_path=model_path,
             max_length=max_length,
             batch_size=batch_size,
+            backend=self.backend,
         )
 
         # Load model
         start_time = time.time()
-        self.model = STCrossEncoder(model_path, max_length=max_length, device=device)
+        # Reports the backend that actually loaded (a failed ONNX load falls back to torch)
+        self.model, self.backend = load_cross_encoder(
+            model_path, self.backend, max_length=max_length, device=device
+        )
         load_time = time.time() - start_time
 
         logger.info(
             "CrossEncoder loaded successfully",
             model_name=model_name,
+            backend=self.backend,
             load_time_seconds=round(load_time, 2),
         )
 
@@ -127,6 +137,10 @@ class CrossEncoderReranker:
         else:
             self.cache = None
 
+    def warmup(self) -> None:
+        """Run one prediction so lazy initialization happens before real traffic."""
+        self.model.predict([("warmup", "warmup")], batch_size=1)
+
     def _compute_scores(
         self, query: str, documents: List[str]
     ) -> List[float]:
@@ -140,57 +154,53 @@ class CrossEncoderReranker:
         Returns:
             List of relevance scores
         """
-        # Create query-document pairs
         pairs = [(query, doc) for doc in documents]
+        return self._score(pairs).tolist()
 
-        # Check cache
-        if self.cache:
-            cached_scores = []
-            uncached_pairs = []
-            uncached_indices = []
-
-            for i, (q, doc) in enumerate(pairs):
-                cache_key = f"{q}||{doc}"
-                cached_score = self.cache.get(cache_key)
-                if cached_score is not None:
-                    cached_scores.append((i, cached_score))
-                else:
-                    uncached_pairs.append((q, doc))
-                    uncached_indices.append(i)
-
-            logger.debug(
-                "cross_encoder_cache_stats",
-                total=len(pairs),
-                cached=len(cached_scores),
-                uncached=len(uncached_pairs),
-                hit_rate=round(len(cached_scores) / len(pairs), 3) if pairs else 0,
-            )
+    def _score(self, pairs: List[Tuple[str, str]]) -> np.ndarray:
+        """
+        Score query-document pairs, using the cache where possible.
+
+        Cached and newly predicted scores are written into one preallocated
+        array, so no per-score Python lists are built.
+
+        Args:
+            pairs: List of (query, document) tuples
+
+        Returns:
+            Array of relevance scores, one per pair
+        """
+        if not self.cache:
+            return np.asarray(self.model.predict(pairs, batch_size=self.batch_size))
 
-            # Compute uncached scores
-            if uncached_pairs:
-                uncached_scores = self.model.predict(
-                    uncached_pairs, batch_size=self.batch_size
-                ).tolist()
+        scores = np.empty(len(pairs), dtype=np.float32)
+        uncached_pairs = []
+        uncached_indices = []
 
-                # Cache the new scores
-                for (q, doc), score in zip(uncached_pairs, uncached_scores):
-                    cache_key = f"{q}||{doc}"
-                    self.cache.put(cache_key, score)
+        for i, (q, doc) in enumerate(pairs):
+            cached_score = self.cache.get(f"{q}||{doc}")
+            if cached_score is not None:
+                scores[i] = cached_score
             else:
-                uncached_scores = []
+                uncached_pairs.append((q, doc))
+                uncached_indices.append(i)
 
-            # Combine cached and uncached scores in original order
-            all_scores = [0.0] * len(pairs)
-            for i, score in cached_scores:
-                all_scores[i] = score
-            for i, score in zip(uncached_indices, uncached_scores):
-                all_scores[i] = score
+        logger.debug(
+            "cross_encoder_cache_stats",
+            total=len(pairs),
+            cached=len(pairs) - len(uncached_pairs),
+            uncached=len(uncached_pairs),
+            hit_rate=round(1 - len(uncached_pairs) / len(pairs), 3) if pairs else 0,
+        )
 
-            return all_scores
-        else:
-            # No caching
-            scores = self.model.predict(pairs, batch_size=self.batch_size)
-            return scores.tolist()
+        # Compute uncached scores and cache them
+        if uncached_pairs:
+            new_scores = self.model.predict(uncached_pairs, batch_size=self.batch_size)
+            scores[uncached_indices] = new_scores
+            for (q, doc), score in zip(uncached_pairs, scores[uncached_indices].tolist()):
+                self.cache.put(f"{q}||{doc}", score)
+
+        return scores
 
     def rerank(
         self,
@@ -226,7 +236,7 @@ class CrossEncoderReranker:
         documents = [r.get("content", "") for r in results]
 
         # Compute cross-encoder scores
-        rerank_scores = self._compute_scores(query, documents)
+        rerank_scores = self._score([(query, doc) for doc in documents]).tolist()
 
         # Create RerankResult objects
         rerank_results = []
@@ -305,45 +315,7 @@ class CrossEncoderReranker:
             num_pairs=len(query_doc_pairs),
         )
 
-        # Check cache
-        if self.cache:
-            cached_scores = []
-            uncached_pairs = []
-            uncached_indices = []
-
-            for i, (q, doc) in enumerate(query_doc_pairs):
-                cache_key = f"{q}||{doc}"
-                cached_score = self.cache.get(cache_key)
-                if cached_score is not None:
-                    cached_scores.append((i, cached_score))
-                else:
-                    uncached_pairs.append((q, doc))
-                    uncached_indices.append(i)
-
-            # Compute uncached
-            if uncached_pairs:
-                uncached_scores = self.model.predict(
-                    uncached_pairs, batch_size=self.batch_size
-                ).tolist()
-
-                # Cache
-                for (q, doc), score in zip(uncached_pairs, uncached_scores):
-                    cache_key = f"{q}||{doc}"
-                    self.cache.put(cache_key, score)
-            else:
-                uncached_scores = []
-
-            # Combine
-            all_scores = [0.0] * len(query_doc_pairs)
-            for i, score in cached_scores:
-                all_scores[i] = score
-            for i, score in zip(uncached_indices, uncached_scores):
-                all_scores[i] = score
-
-            return all_scores
-        else:
-            scores = self.model.predict(query_doc_pairs, batch_size=self.batch_size)
-            return scores.tolist()
+        return self._score(query_doc_pairs).tolist()
 
     def get_cache_stats(self) -> Optional[Dict[str, Any]]:
         """Get cache statistics."""
@@ -1,19 +1,157 @@
 """
 Embedding service for generating vector embeddings from text.
 Uses sentence-transformers for local, free embedding generation.
-Includes caching and performance monitoring for optimization.
+Includes caching, micro-batching of concurrent queries and performance
+monitoring for optimization.
 """
 
+import asyncio
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+import numpy as np
 import structlog
 from sentence_transformers import SentenceTransformer
 
 from src.config import settings
 from src.core.cache import get_embedding_cache
-from src.core.performance import monitor_performance
+from src.core.executors import INGEST_POOL, QUERY_POOL, run_in_executor
+from src.core.inference_backends import load_sentence_transformer
+from src.core.performance import PerformanceMonitor, monitor_performance
 
 logger = structlog.get_logger(__name__)
 
 
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into batched encodes.
+
+    Callers enqueue a text and wait on a future. A worker thread takes the
+    first queued text, collects more until max_batch_size is reached or
+    max_wait_ms has passed, and runs one encode for the whole batch. Under
+    load, texts that arrive while a batch is encoding form the next batch;
+    a lone request waits at most max_wait_ms.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[list[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        name: str = "query_embedding",
+    ):
+        """
+        Initialize the batcher and start its worker thread.
+
+        Args:
+            encode_fn: Embeds a list of texts, returning one row per text.
+            max_batch_size: Maximum texts per encode call.
+            max_wait_ms: How long to wait for more texts after the first.
+            name: Name used for metrics and the worker thread.
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.name = name
+
+        self._queue: "queue.Queue[tuple[str, Future] | None]" = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name=f"{name}-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, text: str) -> Future:
+        """
+        Enqueue a text for embedding.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            Future resolving to the text's embedding vector.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Embedding batcher '{self.name}' is closed")
+            self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed a text, blocking until its batch has been encoded."""
+        return self.submit(text).result()
+
+    async def aembed(self, text: str) -> np.ndarray:
+        """Embed a text without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(text))
+
+    def close(self) -> None:
+        """Stop accepting texts, finish queued batches and stop the worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        """Worker loop: collect batches from the queue and encode them."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            self._encode_batch(batch)
+
+    def _encode_batch(self, batch: list[tuple[str, Future]]) -> None:
+        """Encode one batch and resolve its futures."""
+        # Skip requests cancelled while queued
+        batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        # Identical concurrent texts are encoded once
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        monitor = PerformanceMonitor.get_instance()
+        start = time.perf_counter()
+
+        try:
+            embeddings = self.encode_fn(unique_texts)
+        except Exception as e:
+            monitor.record_operation(f"{self.name}_batch_encode", time.perf_counter() - start, error=True)
+            logger.error("Batched embedding failed", batcher=self.name, size=len(batch), error=str(e))
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        monitor.record_operation(f"{self.name}_batch_encode", time.perf_counter() - start)
+        monitor.record_batch(self.name, len(batch))
+
+        rows = {text: embeddings[i] for i, text in enumerate(unique_texts)}
+        for text, future in batch:
+            future.set_result(rows[text])
+
+
 class EmbeddingService:
     """
     Service for generating text embeddings using sentence-transformers.
@@ -27,6 +165,16 @@ class EmbeddingService:
 
     _instance: "EmbeddingService | None" = None
     _model: SentenceTransformer | None = None
+    _batcher: EmbeddingBatcher | None = None
+    _model_lock = threading.Lock()
+
+    # Worker processes for bulk embedding (see _encode_bulk)
+    _process_pool: dict[str, Any] | None = None
+    _process_pool_failed: bool = False
+    _process_pool_lock = threading.Lock()
+    # One encode_multi_process() call at a time: the pool's queues are shared
+    # and chunk ids restart at 0 per call, so concurrent calls mix results
+    _process_pool_encode_lock = threading.Lock()
 
     def __new__(cls) -> "EmbeddingService":
         """Singleton pattern to avoid loading model multiple times."""
@@ -35,21 +183,27 @@ class EmbeddingService:
         return cls._instance
 
     def __init__(self):
-        """Initialize the embedding service."""
-        if self._model is None:
-            self._load_model()
+        """Initialize the embedding service (the model is loaded on first use or by warmup())."""
+        if self._batcher is None and settings.embedding_batching_enabled:
+            EmbeddingService._batcher = EmbeddingBatcher(
+                lambda texts: self._encode(texts, batch_size=settings.embedding_batch_max_size),
+                max_batch_size=settings.embedding_batch_max_size,
+                max_wait_ms=settings.embedding_batch_max_wait_ms,
+            )
         self._cache = get_embedding_cache()
 
     def _load_model(self) -> None:
         """Load the sentence transformer model."""
         model_name = settings.embedding_model
-        logger.info("Loading embedding model", model=model_name)
+        backend = settings.embedding_backend
+        logger.info("Loading embedding model", model=model_name, backend=backend)
         
         try:
-            self._model = SentenceTransformer(model_name)
+            self._model, loaded_backend = load_sentence_transformer(model_name, backend)
             logger.info(
                 "Embedding model loaded successfully",
                 model=model_name,
+                backend=loaded_backend,
                 embedding_dimension=self._model.get_sentence_embedding_dimension(),
             )
         except Exception as e:
@@ -58,16 +212,97 @@ class EmbeddingService:
 
     @property
     def model(self) -> SentenceTransformer:
-        """Get the loaded model."""
+        """Get the loaded model, loading it on first use."""
         if self._model is None:
-            self._load_model()
+            with self._model_lock:
+                if self._model is None:
+                    self._load_model()
         return self._model
 
+    def warmup(self) -> None:
+        """Load the model and run one encode so lazy initialization happens now."""
+        self._encode(["warmup"])
+
     @property
     def embedding_dimension(self) -> int:
         """Get the dimension of the embedding vectors."""
         return self.model.get_sentence_embedding_dimension()
 
+    def _encode(self, texts: str | list[str], batch_size: int = 32) -> np.ndarray:
+        """Run the model and return float32 embeddings (one row per text)."""
+        return self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=not isinstance(texts, str) and len(texts) > 100,
+        ).astype(np.float32, copy=False)
+
+    def _get_process_pool(self) -> dict[str, Any] | None:
+        """Get the multi-process embedding pool, starting it on first use."""
+        with self._process_pool_lock:
+            if EmbeddingService._process_pool is None and not EmbeddingService._process_pool_failed:
+                workers = settings.embedding_process_pool_workers
+                try:
+                    EmbeddingService._process_pool = self.model.start_multi_process_pool(
+                        target_devices=["cpu"] * workers
+                    )
+                    atexit.register(EmbeddingService.stop_process_pool)
+                    logger.info("Embedding process pool started", workers=workers)
+                except Exception as e:
+                    EmbeddingService._process_pool_failed = True
+                    logger.warning("Could not start embedding process pool, encoding in-process", error=str(e))
+            return EmbeddingService._process_pool
+
+    @classmethod
+    def stop_process_pool(cls) -> None:
+        """Stop the multi-process embedding pool (it restarts on next use)."""
+        with cls._process_pool_lock:
+            pool, cls._process_pool = cls._process_pool, None
+        if pool is not None:
+            SentenceTransformer.stop_multi_process_pool(pool)
+            logger.info("Embedding process pool stopped")
+
+    def _encode_bulk(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Embed a batch of texts, fanning large batches out to worker processes.
+
+        Batches of at least embedding_process_pool_threshold texts are split
+        into chunks that are encoded by embedding_process_pool_workers
+        processes (each holding a copy of the model) and reassembled in input
+        order. Concurrent callers take turns on the pool. If the pool cannot
+        be started or fails, the batch is encoded in this process and the
+        pool is not used again.
+        """
+        workers = settings.embedding_process_pool_workers
+        if workers > 1 and len(texts) >= settings.embedding_process_pool_threshold:
+            pool = self._get_process_pool()
+            if pool is not None:
+                try:
+                    with self._process_pool_encode_lock:
+                        embeddings = self.model.encode_multi_process(
+                            texts,
+                            pool,
+                            batch_size=batch_size,
+                            chunk_size=settings.embedding_process_chunk_size or None,
+                        )
+                    return np.ascontiguousarray(embeddings, dtype=np.float32)
+                except Exception as e:
+                    logger.warning(
+                        "Multi-process embedding failed, encoding in-process",
+                        count=len(texts),
+                        error=str(e),
+                    )
+                    EmbeddingService._process_pool_failed = True
+                    self.stop_process_pool()
+
+        return self._encode(texts, batch_size=batch_size)
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        """Embed one text, coalesced with concurrent requests when batching is enabled."""
+        if self._batcher is not None:
+            return self._batcher.embed(text)
+        return self._encode(text)
+
     @monitor_performance("embed_text")
     def embed_text(self, text: str) -> list[float]:
         """
@@ -79,14 +314,8 @@ class EmbeddingService:
         Returns:
             List of floats representing the embedding vector.
         """
-        # Use cache to avoid redundant computation
-        embedding = self._cache.get_embedding(
-            text,
-            lambda t: self.model.encode(t, convert_to_numpy=True),
-        )
-        return embedding.tolist()
+        return self.embed_query_np(text).tolist()
 
-    @monitor_performance("embed_texts_batch")
     def embed_texts(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         """
         Generate embeddings for multiple texts in batches with caching.
@@ -98,25 +327,34 @@ class EmbeddingService:
         Returns:
             List of embedding vectors.
         """
+        return self.embed_texts_np(texts, batch_size=batch_size).tolist()
+
+    @monitor_performance("embed_texts_batch")
+    def embed_texts_np(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts as one float32 matrix.
+
+        Prefer this over embed_texts when the vectors go to numpy code or
+        ChromaDB, since it avoids creating a Python float per component.
+
+        Args:
+            texts: List of texts to embed.
+            batch_size: Number of texts to process at once.
+
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension).
+        """
         if not texts:
-            return []
+            return np.empty((0, self.embedding_dimension), dtype=np.float32)
 
         logger.debug("Embedding texts", count=len(texts), batch_size=batch_size)
 
         # Use batch caching for efficiency
-        embeddings = self._cache.get_embeddings_batch(
+        return self._cache.get_embeddings_matrix(
             texts,
-            lambda txts: self.model.encode(
-                txts,
-                batch_size=batch_size,
-                convert_to_numpy=True,
-                show_progress_bar=len(txts) > 100,
-            ),
+            lambda txts: self._encode_bulk(txts, batch_size=batch_size),
         )
 
-        return [emb.tolist() for emb in embeddings]
-
-    @monitor_performance("embed_query")
     def embed_query(self, query: str) -> list[float]:
         """
         Generate embedding for a search query with caching.
@@ -130,10 +368,111 @@ class EmbeddingService:
         Returns:
             List of floats representing the query embedding.
         """
-        return self.embed_text(query)
+        return self.embed_query_np(query).tolist()
+
+    @monitor_performance("embed_query")
+    def embed_query_np(self, query: str) -> np.ndarray:
+        """
+        Generate embedding for a search query as a float32 vector.
+
+        Args:
+            query: The search query to embed.
+
+        Returns:
+            1-D float32 array of length dimension.
+        """
+        return np.asarray(self._cache.get_embedding(query, self._encode_one), dtype=np.float32)
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several search queries in one batch.
+
+        Args:
+            queries: The search queries to embed.
+
+        Returns:
+            One embedding vector per query.
+        """
+        return self.embed_queries_np(queries).tolist()
+
+    @monitor_performance("embed_queries")
+    def embed_queries_np(self, queries: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for several search queries as one float32 matrix.
+
+        Args:
+            queries: The search queries to embed.
+
+        Returns:
+            C-contiguous float32 array of shape (len(queries), dimension).
+        """
+        return self.embed_texts_np(queries)
+
+    async def aembed_query(self, query: str) -> list[float]:
+        """
+        Generate a query embedding without blocking the event loop.
+
+        Args:
+            query: The search query to embed.
+
+        Returns:
+            List of floats representing the query embedding.
+        """
+        return (await self.aembed_query_np(query)).tolist()
+
+    async def aembed_query_np(self, query: str) -> np.ndarray:
+        """
+        Generate a query embedding as a float32 vector without blocking the event loop.
+
+        With batching enabled, the request waits for its batch on the event
+        loop rather than on a query pool thread, so any number of concurrent
+        requests can share one encode. The result is cached like
+        embed_query_np()'s.
+
+        Args:
+            query: The search query to embed.
+
+        Returns:
+            1-D float32 array of length dimension.
+        """
+        if self._batcher is None:
+            return await run_in_executor(QUERY_POOL, self.embed_query_np, query)
+
+        # The disk tier is a blocking SQLite read
+        if self._cache.persistent is not None:
+            cached = await run_in_executor(QUERY_POOL, self._cache.lookup, query)
+        else:
+            cached = self._cache.lookup(query)
+        if cached is not None:
+            return np.asarray(cached, dtype=np.float32)
+
+        embedding = await self._batcher.aembed(query)
+        if self._cache.persistent is not None:
+            await run_in_executor(QUERY_POOL, self._cache.store, query, embedding)
+        else:
+            self._cache.store(query, embedding)
+        return np.asarray(embedding, dtype=np.float32)
+
+    async def aembed_texts(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        """
+        Generate embeddings for multiple texts on the ingest executor pool.
+
+        Args:
+            texts: List of texts to embed.
+            batch_size: Number of texts to process at once.
+
+        Returns:
+            List of embedding vectors.
+        """
+        return await run_in_executor(INGEST_POOL, self.embed_texts, texts, batch_size)
 
 
 # Convenience function for getting embeddings
 def get_embedding_service() -> EmbeddingService:
     """Get the singleton embedding service instance."""
     return EmbeddingService()
+
+
+async def aembed(texts: list[str]) -> list[list[float]]:
+    """Embed texts without blocking the event loop (see EmbeddingService.aembed_texts)."""
+    return await get_embedding_service().aembed_texts(texts)
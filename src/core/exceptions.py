@@ -162,6 +162,12 @@ class ConversationMemoryError(ServiceError):
     pass
 
 
+class RequestCancelledError(ServiceError):
+    """Raised when the client disconnects before the request completes."""
+
+    pass
+
+
 # ============================================================================
 # Parser exceptions
 # ============================================================================
@@ -0,0 +1,162 @@
+"""
+Bounded thread pools for running blocking work from async code.
+
+Embedding, ChromaDB queries, BM25 scoring and index rebuilds are synchronous
+and CPU-bound. Async callers (e.g. the FastAPI endpoints) offload them to
+these pools so the event loop keeps serving other requests. Query-time and
+ingest-time work run on separate pools, so a large upload cannot starve
+searches of worker threads. A third pool runs the legs of a hybrid search
+concurrently; it is separate so legs never wait behind the searches that
+submitted them. URL scraping for chat messages is network-bound and gets its
+own pool.
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+import structlog
+
+from src.config import settings
+
+logger = structlog.get_logger(__name__)
+
+# Pool names
+QUERY_POOL = "query"
+INGEST_POOL = "ingest"
+SEARCH_LEG_POOL = "search_leg"
+SCRAPE_POOL = "scrape"
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+# Workers reserved per pool (see try_reserve_workers)
+_worker_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _pool_size(pool: str) -> int:
+    """Get the configured number of worker threads for a pool."""
+    if pool == QUERY_POOL:
+        return max(1, settings.query_executor_workers)
+    if pool == INGEST_POOL:
+        return max(1, settings.ingest_executor_workers)
+    if pool == SEARCH_LEG_POOL:
+        return max(2, settings.search_leg_executor_workers)
+    if pool == SCRAPE_POOL:
+        return max(1, settings.scrape_executor_workers)
+    raise ValueError(f"Unknown executor pool: {pool}")
+
+
+def get_executor(pool: str = QUERY_POOL) -> ThreadPoolExecutor:
+    """
+    Get the shared executor for a pool, creating it on first use.
+
+    Args:
+        pool: QUERY_POOL, INGEST_POOL, SEARCH_LEG_POOL or SCRAPE_POOL.
+
+    Returns:
+        Shared ThreadPoolExecutor bounded to the configured worker count.
+    """
+    with _executors_lock:
+        executor = _executors.get(pool)
+        if executor is None:
+            max_workers = _pool_size(pool)
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix=f"{pool}-worker",
+            )
+            _executors[pool] = executor
+            logger.info("Executor pool created", pool=pool, max_workers=max_workers)
+        return executor
+
+
+async def run_in_executor(pool: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking callable on a pool and await its result.
+
+    Context variables (e.g. the request ID used for logging) are copied into
+    the worker thread.
+
+    Args:
+        pool: One of the pool names.
+        func: Blocking callable to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The return value of func.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(pool), call)
+
+
+def _get_worker_slots(pool: str) -> threading.BoundedSemaphore:
+    """Get the reservation counter for a pool, creating it on first use."""
+    with _executors_lock:
+        slots = _worker_slots.get(pool)
+        if slots is None:
+            slots = _worker_slots[pool] = threading.BoundedSemaphore(_pool_size(pool))
+        return slots
+
+
+def try_reserve_workers(pool: str, count: int = 1) -> bool:
+    """
+    Reserve workers of a pool without waiting.
+
+    For work that must not queue behind earlier tasks that may still be
+    running after their caller gave up on them (e.g. timed-out hybrid search
+    legs). Every task submitted under a reservation must call
+    release_workers() when it finishes, or when it is cancelled before
+    starting.
+
+    Args:
+        pool: One of the pool names.
+        count: Number of workers needed.
+
+    Returns:
+        True if all count workers were reserved, False (none reserved) if
+        the pool does not have that many free.
+    """
+    slots = _get_worker_slots(pool)
+    reserved = 0
+    while reserved < count and slots.acquire(blocking=False):
+        reserved += 1
+
+    if reserved < count:
+        for _ in range(reserved):
+            slots.release()
+        return False
+    return True
+
+
+def release_workers(pool: str, count: int = 1) -> None:
+    """
+    Release workers reserved with try_reserve_workers().
+
+    Args:
+        pool: One of the pool names.
+        count: Number of workers to release.
+    """
+    slots = _get_worker_slots(pool)
+    for _ in range(count):
+        slots.release()
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    Shut down all pools (they are recreated on next use).
+
+    Args:
+        wait: Wait for running work to finish.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+
+    for executor in executors:
+        executor.shutdown(wait=wait)
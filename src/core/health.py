@@ -8,6 +8,7 @@ This module provides health checks for all critical services:
 - Embedding service
 """
 
+import threading
 from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional
@@ -32,6 +33,53 @@ class HealthStatus(Enum):
     UNHEALTHY = "unhealthy"
 
 
+class Readiness:
+    """
+    Whether the service should receive traffic, driven by the startup warmup.
+
+    Liveness does not depend on this: an instance that is still loading
+    models and building indexes is alive but not ready. Ready once the
+    warmup completes; a failed warmup keeps the instance not ready and
+    reports the error until a retry succeeds.
+    """
+
+    def __init__(self):
+        """Initialize readiness (not ready, no stages completed)."""
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self.stages: Dict[str, float] = {}
+        self.ready = False
+        self.error: Optional[str] = None
+
+    def stage_complete(self, stage: str, duration_ms: float) -> None:
+        """Record a completed warmup stage."""
+        with self._lock:
+            self.stages[stage] = duration_ms
+
+    def mark_ready(self) -> None:
+        """Mark the service ready for traffic."""
+        with self._lock:
+            self.ready = True
+            self.error = None
+        logger.info(
+            "service_ready",
+            startup_s=round((datetime.now() - self.started_at).total_seconds(), 2),
+            stages_ms=dict(self.stages),
+        )
+
+    def mark_failed(self, error: str) -> None:
+        """Record a failed warmup attempt (not ready until a later attempt succeeds)."""
+        with self._lock:
+            self.ready = False
+            self.error = error
+        logger.error("warmup_failed", error=error, stages_ms=dict(self.stages))
+
+    def snapshot(self) -> Dict:
+        """Get readiness, completed stages (milliseconds) and any error."""
+        with self._lock:
+            return {"ready": self.ready, "stages": dict(self.stages), "error": self.error}
+
+
 class HealthCheck:
     """
     Health check coordinator for all system services.
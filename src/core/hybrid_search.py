@@ -3,16 +3,24 @@ Hybrid search combining BM25 keyword search and vector similarity search.
 
 This module implements:
 1. BM25 (Best Matching 25) algorithm for keyword-based relevance
-2. Reciprocal Rank Fusion (RRF) for combining BM25 and vector results
-3. Hybrid search strategy with configurable weights
+2. Inverted-index BM25 with MaxScore top-k pruning for large corpora
+3. Reciprocal Rank Fusion (RRF) for combining BM25 and vector results
+4. Hybrid search strategy with configurable weights
 """
 
+import json
 import math
+import mmap
+import os
 import re
+import struct
+from array import array
 from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -63,6 +71,7 @@ class BM25:
         self.corpus: List[str] = []
         self.doc_ids: List[str] = []
         self.doc_freqs: List[Counter] = []  # Term frequencies per document
+        self.doc_lengths: List[int] = []  # Token count per document
         self.idf: Dict[str, float] = {}  # Inverse document frequency
         self.avgdl: float = 0.0  # Average document length
         self.num_docs: int = 0
@@ -121,15 +130,15 @@ class BM25:
 
         # Calculate term frequencies for each document
         self.doc_freqs = []
-        doc_lengths = []
+        self.doc_lengths = []
 
         for doc in corpus:
             tokens = self.tokenize(doc)
             self.doc_freqs.append(Counter(tokens))
-            doc_lengths.append(len(tokens))
+            self.doc_lengths.append(len(tokens))
 
         # Calculate average document length
-        self.avgdl = sum(doc_lengths) / self.num_docs if self.num_docs > 0 else 0
+        self.avgdl = sum(self.doc_lengths) / self.num_docs if self.num_docs > 0 else 0
 
         # Calculate IDF for each term
         # IDF(term) = log((N - df + 0.5) / (df + 0.5) + 1)
@@ -140,6 +149,7 @@ class BM25:
             for term in doc_freq.keys():
                 df[term] += 1
 
+        self.idf = {}
         for term, doc_freq in df.items():
             # Standard BM25 IDF formula
             idf = math.log((self.num_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1)
@@ -175,11 +185,13 @@ class BM25:
         if doc_idx >= len(self.doc_freqs):
             return 0.0
 
+        return self._score_tokens(self.tokenize(query), doc_idx)
+
+    def _score_tokens(self, query_tokens: List[str], doc_idx: int) -> float:
+        """Calculate BM25 score for already-tokenized query terms."""
         score = 0.0
         doc_freq = self.doc_freqs[doc_idx]
-        doc_len = sum(doc_freq.values())
-
-        query_tokens = self.tokenize(query)
+        doc_len = self.doc_lengths[doc_idx]
 
         for term in query_tokens:
             if term not in self.idf:
@@ -199,13 +211,19 @@ class BM25:
 
         return score
 
-    def search(self, query: str, top_k: int = 10) -> List[Tuple[str, float]]:
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
         """
         Search for top-k most relevant documents using BM25.
 
         Args:
             query: Search query
             top_k: Number of top results to return
+            allowed_ids: Only score these documents (e.g. metadata filter matches)
 
         Returns:
             List of (doc_id, score) tuples sorted by relevance
@@ -214,10 +232,15 @@ class BM25:
             logger.warning("BM25 not fitted, returning empty results")
             return []
 
-        # Calculate scores for all documents
+        allowed = set(allowed_ids) if allowed_ids is not None else None
+
+        # Calculate scores for all documents (tokenize the query once)
+        query_tokens = self.tokenize(query)
         scores = []
         for idx in range(self.num_docs):
-            score = self.score(query, idx)
+            if allowed is not None and self.doc_ids[idx] not in allowed:
+                continue
+            score = self._score_tokens(query_tokens, idx)
             if score > 0:  # Only include documents with non-zero scores
                 scores.append((self.doc_ids[idx], score))
 
@@ -234,6 +257,959 @@ class BM25:
 
         return results
 
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search for several queries at once.
+
+        Args:
+            queries: Search queries
+            top_k: Number of top results to return per query
+            allowed_ids: Only score these documents (shared by all queries)
+
+        Returns:
+            One list of (doc_id, score) tuples per query
+        """
+        allowed = set(allowed_ids) if allowed_ids is not None else None
+        return [self.search(query, top_k=top_k, allowed_ids=allowed) for query in queries]
+
+
+class InvertedIndexBM25(BM25):
+    """
+    BM25 backed by an inverted index with MaxScore top-k pruning.
+
+    Produces the same scores and ranking as :class:`BM25`, but only touches
+    documents that contain at least one query term instead of scoring the
+    whole corpus.
+
+    Index layout:
+    - vocabulary: term -> term id
+    - base segment (CSR, numpy arrays built by fit/compact):
+      term_offsets[t]:term_offsets[t + 1] slices post_docs / post_tfs, the
+      document slot and term frequency of every posting of term t, sorted
+      by slot; a forward index (term ids per slot) supports removals
+    - delta segment: postings of documents added after the last build,
+      appended in slot order
+    - doc_len / deleted: token count and tombstone flag per document slot
+
+    The index is maintained incrementally: add/remove/update cost
+    O(size of the document) and keep document frequencies and the average
+    document length current. IDF and score upper bounds are recomputed
+    lazily per query term. Tombstones and delta postings are folded into a
+    new base segment once they grow past a fraction of the index (amortized,
+    no re-tokenization).
+
+    Search uses term-at-a-time accumulation in decreasing order of each
+    term's maximum possible contribution. Once the k-th best partial score
+    exceeds the summed upper bounds of the remaining terms, documents not
+    seen yet can no longer enter the top-k, so the remaining terms are only
+    applied to surviving candidates (MaxScore). The final top-k is re-scored
+    exactly in query order, so scores match :class:`BM25` bit for bit.
+
+    The index can be saved to a single binary file and loaded back with
+    ``mmap``, so posting arrays are paged in on demand instead of being
+    rebuilt from document text (see :meth:`save` / :meth:`load`).
+    """
+
+    # On-disk format: magic, uint64 header length, JSON header, aligned arrays
+    FILE_MAGIC = b"BM25IDX1"
+    FILE_VERSION = 1
+    _FILE_ALIGNMENT = 64
+
+    # Arrays that load() maps from the file: file array name -> attribute
+    _MAPPED_ARRAYS = {
+        "doc_len": "doc_len",
+        "term_offsets": "term_offsets",
+        "post_docs": "post_docs",
+        "post_tfs": "post_tfs",
+        "forward_offsets": "_forward_offsets",
+        "forward_terms": "_forward_terms",
+    }
+
+    # Relative tolerance for pruning decisions (vectorized vs. exact summation order)
+    _SCORE_SLACK = 1e-9
+
+    # Compaction thresholds
+    _COMPACT_DELETED_RATIO = 0.25  # Deleted slots / all slots
+    _COMPACT_DELTA_RATIO = 0.5  # Delta postings / base postings
+    _COMPACT_MIN_DELTA_POSTINGS = 10_000
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        """
+        Initialize inverted-index BM25 with tuning parameters.
+
+        Args:
+            k1: Term frequency saturation parameter (default: 1.5)
+            b: Document length normalization parameter (default: 0.75)
+        """
+        # BM25.__init__ is not called: idf is derived from document
+        # frequencies here instead of being stored
+        self.k1 = k1
+        self.b = b
+        self.corpus: List[str] = []  # Document text is not retained
+        self.doc_freqs: List[Counter] = []
+        self.doc_lengths: List[int] = []
+        self._reset()
+
+        logger.debug("Initialized inverted BM25", k1=k1, b=b)
+
+    def _reset(self) -> None:
+        """Reset to an empty index."""
+        self.doc_ids: List[str] = []  # Slot -> document ID (kept for deleted slots)
+        self.num_docs = 0  # Live documents
+        self.avgdl = 0.0
+        self._total_length = 0
+
+        self.vocabulary: Dict[str, int] = {}
+        self._terms: List[str] = []  # Term id -> term
+        self._doc_freq: List[int] = []  # Term id -> live document frequency
+        self._slots: Dict[str, int] = {}  # Document ID -> slot
+
+        # Per-slot arrays (grown by doubling)
+        self.doc_len = np.zeros(0, dtype=np.int32)
+        self._deleted = np.zeros(0, dtype=bool)
+        self._num_slots = 0
+        self._num_deleted = 0
+
+        # Base segment
+        self.term_offsets = np.zeros(1, dtype=np.int64)
+        self.post_docs = np.zeros(0, dtype=np.int32)
+        self.post_tfs = np.zeros(0, dtype=np.int32)
+        self._base_slots = 0
+        self._forward_offsets = np.zeros(1, dtype=np.int64)
+        self._forward_terms = np.zeros(0, dtype=np.int32)
+
+        # Delta segment
+        self._delta_postings: Dict[int, Tuple[array, array]] = {}
+        self._delta_forward: Dict[int, array] = {}
+        self._delta_size = 0
+
+        self._invalidate_statistics()
+        self._unmap()
+
+    def close(self) -> None:
+        """Drop all documents and unmap the index file, if any."""
+        self._reset()
+
+    def release_file(self) -> None:
+        """
+        Copy memory-mapped arrays into memory and unmap the index file.
+
+        Call before replacing or deleting the file the index was loaded from
+        (Windows refuses both while it is mapped). No-op if the index is not
+        backed by a file.
+        """
+        if getattr(self, "_mapping", None) is None:
+            return
+        for attr in self._MAPPED_ARRAYS.values():
+            setattr(self, attr, np.array(getattr(self, attr)))
+        self._unmap()
+
+    def _unmap(self) -> None:
+        """Close the file mapping (callers first replace the arrays viewing it)."""
+        mapping = getattr(self, "_mapping", None)
+        self._mapping: Optional[mmap.mmap] = None
+        self._mapped_path: Optional[Path] = None
+        if mapping is None:
+            return
+        try:
+            mapping.close()
+        except BufferError:
+            # A caller still holds a view; the mapping closes when it is dropped
+            logger.debug("BM25 index file still referenced, unmapping later")
+
+    def _invalidate_statistics(self) -> None:
+        """Drop lazily computed per-term statistics after a change."""
+        self._idf_cache: Dict[int, float] = {}
+        self._bound_cache: Dict[int, float] = {}
+
+    @property
+    def idf(self) -> Dict[str, float]:
+        """Inverse document frequency of every term in the live corpus."""
+        return {
+            term: self._term_idf(term_id)
+            for term, term_id in self.vocabulary.items()
+            if self._doc_freq[term_id] > 0
+        }
+
+    def fit(self, corpus: List[str], doc_ids: Optional[List[str]] = None):
+        """
+        Build the inverted index for a document corpus.
+
+        Args:
+            corpus: List of document texts
+            doc_ids: Optional list of document IDs (generated if not provided)
+        """
+        num_docs = len(corpus)
+
+        if doc_ids is None:
+            doc_ids = [f"doc_{i}" for i in range(num_docs)]
+        elif len(doc_ids) != num_docs:
+            raise ValueError("doc_ids length must match corpus length")
+
+        vocabulary: Dict[str, int] = {}
+        pair_terms = array("i")
+        pair_docs = array("i")
+        pair_tfs = array("i")
+        doc_lengths = np.zeros(num_docs, dtype=np.int32)
+
+        for doc_idx, doc in enumerate(corpus):
+            tokens = self.tokenize(doc)
+            doc_lengths[doc_idx] = len(tokens)
+            for term, tf in Counter(tokens).items():
+                pair_terms.append(vocabulary.setdefault(term, len(vocabulary)))
+                pair_docs.append(doc_idx)
+                pair_tfs.append(tf)
+
+        self._reset()
+        self._build_segment(
+            list(doc_ids),
+            doc_lengths,
+            vocabulary,
+            np.frombuffer(pair_terms, dtype=np.int32),
+            np.frombuffer(pair_docs, dtype=np.int32),
+            np.frombuffer(pair_tfs, dtype=np.int32),
+        )
+
+        logger.info(
+            "Inverted BM25 index built",
+            num_docs=self.num_docs,
+            avg_doc_length=round(self.avgdl, 2),
+            unique_terms=len(self.vocabulary),
+            postings=len(self.post_docs),
+        )
+
+    def _build_segment(
+        self,
+        doc_ids: List[str],
+        doc_lengths: np.ndarray,
+        vocabulary: Dict[str, int],
+        pair_terms: np.ndarray,
+        pair_docs: np.ndarray,
+        pair_tfs: np.ndarray,
+    ) -> None:
+        """
+        Replace the index with a base segment built from (term, slot, tf) triples.
+
+        Triples must be in increasing slot order; a stable sort by term id
+        then keeps each posting list sorted by slot, and the unsorted triples
+        double as the forward index.
+        """
+        num_docs = len(doc_ids)
+
+        self.doc_ids = doc_ids
+        self._slots = {doc_id: slot for slot, doc_id in enumerate(doc_ids)}
+        self.vocabulary = vocabulary
+        self._terms = list(vocabulary)
+
+        self.doc_len = np.ascontiguousarray(doc_lengths, dtype=np.int32)
+        self._deleted = np.zeros(num_docs, dtype=bool)
+        self._num_slots = num_docs
+        self._num_deleted = 0
+        self._base_slots = num_docs
+
+        self.num_docs = num_docs
+        self._total_length = int(self.doc_len.sum())
+        self._update_avgdl()
+
+        order = np.argsort(pair_terms, kind="stable")
+        self.post_docs = pair_docs[order]
+        self.post_tfs = pair_tfs[order]
+
+        term_counts = np.bincount(pair_terms, minlength=len(vocabulary))
+        self.term_offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(term_counts, out=self.term_offsets[1:])
+        self._doc_freq = term_counts.tolist()
+
+        self._forward_terms = np.array(pair_terms, dtype=np.int32)
+        self._forward_offsets = np.zeros(num_docs + 1, dtype=np.int64)
+        np.cumsum(np.bincount(pair_docs, minlength=num_docs), out=self._forward_offsets[1:])
+
+        self._delta_postings = {}
+        self._delta_forward = {}
+        self._delta_size = 0
+        self._invalidate_statistics()
+
+    def _update_avgdl(self) -> None:
+        """Recompute the average document length from running totals."""
+        self.avgdl = self._total_length / self.num_docs if self.num_docs > 0 else 0
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+
+    def __contains__(self, doc_id: str) -> bool:
+        """Check whether a document is in the live index."""
+        return doc_id in self._slots
+
+    def add(self, doc_id: str, text: str) -> None:
+        """
+        Add a document to the index in O(size of the document).
+
+        Adding an ID that is already indexed replaces the document.
+
+        Args:
+            doc_id: Document ID
+            text: Document text
+        """
+        if doc_id in self._slots:
+            self.remove(doc_id)
+
+        tokens = self.tokenize(text)
+        slot = self._num_slots
+        self._ensure_capacity(slot + 1)
+        self.doc_len[slot] = len(tokens)
+        self._deleted[slot] = False
+        self._num_slots += 1
+        self.doc_ids.append(doc_id)
+        self._slots[doc_id] = slot
+
+        forward = array("i")
+        for term, tf in Counter(tokens).items():
+            term_id = self.vocabulary.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self.vocabulary[term] = term_id
+                self._terms.append(term)
+                self._doc_freq.append(0)
+
+            self._doc_freq[term_id] += 1
+            docs, tfs = self._delta_postings.setdefault(term_id, (array("i"), array("i")))
+            docs.append(slot)
+            tfs.append(tf)
+            forward.append(term_id)
+
+        self._delta_forward[slot] = forward
+        self._delta_size += len(forward)
+
+        self.num_docs += 1
+        self._total_length += len(tokens)
+        self._update_avgdl()
+        self._invalidate_statistics()
+        self._maybe_compact()
+
+    def update(self, doc_id: str, text: str) -> None:
+        """
+        Replace the text of a document (added if it is not indexed yet).
+
+        Args:
+            doc_id: Document ID
+            text: New document text
+        """
+        self.add(doc_id, text)
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document from the index in O(size of the document).
+
+        Args:
+            doc_id: Document ID
+
+        Returns:
+            True if the document was indexed, False otherwise
+        """
+        slot = self._slots.pop(doc_id, None)
+        if slot is None:
+            return False
+
+        if slot < self._base_slots:
+            start, end = self._forward_offsets[slot], self._forward_offsets[slot + 1]
+            term_ids = self._forward_terms[start:end].tolist()
+        else:
+            term_ids = self._delta_forward.pop(slot).tolist()
+
+        for term_id in term_ids:
+            self._doc_freq[term_id] -= 1
+
+        self._deleted[slot] = True
+        self._num_deleted += 1
+
+        self.num_docs -= 1
+        self._total_length -= int(self.doc_len[slot])
+        self._update_avgdl()
+        self._invalidate_statistics()
+        self._maybe_compact()
+        return True
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow the per-slot arrays to hold at least `size` slots."""
+        capacity = len(self.doc_len)
+        if size <= capacity:
+            return
+
+        new_capacity = max(size, capacity * 2, 16)
+        doc_len = np.zeros(new_capacity, dtype=np.int32)
+        doc_len[:capacity] = self.doc_len
+        deleted = np.zeros(new_capacity, dtype=bool)
+        deleted[:capacity] = self._deleted
+        self.doc_len = doc_len
+        self._deleted = deleted
+
+    def _maybe_compact(self) -> None:
+        """Compact once tombstones or delta postings outgrow the base segment."""
+        many_deleted = self._num_deleted > self._COMPACT_DELETED_RATIO * self._num_slots
+        large_delta = self._delta_size > max(
+            self._COMPACT_MIN_DELTA_POSTINGS,
+            self._COMPACT_DELTA_RATIO * len(self.post_docs),
+        )
+        if many_deleted or large_delta:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Merge the delta segment into the base segment and drop deleted documents.
+
+        Live documents keep their relative order, so rankings are unchanged.
+        """
+        num_slots = self._num_slots
+        live_slots = np.flatnonzero(~self._deleted[:num_slots])
+        new_slot = np.full(num_slots, -1, dtype=np.int32)
+        new_slot[live_slots] = np.arange(len(live_slots), dtype=np.int32)
+
+        # Gather every posting as (term, slot, tf)
+        term_parts = [
+            np.repeat(
+                np.arange(len(self.term_offsets) - 1, dtype=np.int32),
+                np.diff(self.term_offsets),
+            )
+        ]
+        doc_parts = [self.post_docs]
+        tf_parts = [self.post_tfs]
+        for term_id, (docs, tfs) in self._delta_postings.items():
+            term_parts.append(np.full(len(docs), term_id, dtype=np.int32))
+            doc_parts.append(np.array(docs, dtype=np.int32))
+            tf_parts.append(np.array(tfs, dtype=np.int32))
+
+        terms = np.concatenate(term_parts)
+        docs = np.concatenate(doc_parts)
+        tfs = np.concatenate(tf_parts)
+
+        keep = ~self._deleted[docs]
+        terms, docs, tfs = terms[keep], new_slot[docs[keep]], tfs[keep]
+
+        # Drop terms that no longer occur anywhere
+        live_terms = np.flatnonzero(np.asarray(self._doc_freq, dtype=np.int64) > 0)
+        new_term = np.full(len(self._terms), -1, dtype=np.int32)
+        new_term[live_terms] = np.arange(len(live_terms), dtype=np.int32)
+        vocabulary = {self._terms[term_id]: i for i, term_id in enumerate(live_terms.tolist())}
+
+        order = np.argsort(docs, kind="stable")
+        doc_ids = [self.doc_ids[slot] for slot in live_slots.tolist()]
+
+        self._build_segment(
+            doc_ids,
+            self.doc_len[live_slots],
+            vocabulary,
+            new_term[terms[order]],
+            docs[order],
+            tfs[order],
+        )
+        # The base segment no longer views the index file
+        del doc_parts, tf_parts
+        self._unmap()
+
+        logger.debug(
+            "Inverted BM25 index compacted",
+            num_docs=self.num_docs,
+            unique_terms=len(self.vocabulary),
+            postings=len(self.post_docs),
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Save the index to a binary file (written atomically).
+
+        Pending delta postings and tombstones are compacted first, so the
+        file always holds a single base segment. Saving over the file the
+        index is mapped from unmaps it first and maps the new file after.
+
+        Args:
+            path: Destination file
+            metadata: JSON-serializable values stored in the header (e.g. the
+                collection generation the index was built from)
+        """
+        if self._delta_size or self._num_deleted:
+            self.compact()
+
+        terms_blob, terms_offsets = self._pack_strings(self._terms)
+        ids_blob, ids_offsets = self._pack_strings(self.doc_ids)
+        arrays = {
+            "doc_len": self.doc_len[:self._num_slots],
+            "term_offsets": self.term_offsets,
+            "post_docs": self.post_docs,
+            "post_tfs": self.post_tfs,
+            "forward_offsets": self._forward_offsets,
+            "forward_terms": self._forward_terms,
+            "terms_blob": terms_blob,
+            "terms_offsets": terms_offsets,
+            "ids_blob": ids_blob,
+            "ids_offsets": ids_offsets,
+        }
+
+        # Lay out arrays at aligned offsets relative to the data section
+        layout = {}
+        offset = 0
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            arrays[name] = values
+            layout[name] = {
+                "dtype": values.dtype.str,
+                "offset": offset,
+                "length": len(values),
+            }
+            offset += self._aligned(values.nbytes)
+
+        header = json.dumps({
+            "version": self.FILE_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "num_docs": self.num_docs,
+            "num_terms": len(self._terms),
+            "num_postings": len(self.post_docs),
+            "metadata": metadata or {},
+            "arrays": layout,
+        }).encode("utf-8")
+        data_start = self._aligned(len(self.FILE_MAGIC) + 8 + len(header))
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+
+        with open(tmp_path, "wb") as f:
+            f.write(self.FILE_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for name, values in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(values.tobytes())
+            f.truncate(data_start + offset)
+
+        # The file cannot be replaced while it is mapped (on Windows)
+        del arrays
+        remap = self._mapped_path is not None and self._mapped_path == path.resolve()
+        if remap:
+            self.release_file()
+
+        os.replace(tmp_path, path)
+
+        if remap:
+            self._map_file(path)
+
+        logger.info(
+            "Inverted BM25 index saved",
+            path=str(path),
+            num_docs=self.num_docs,
+            size_bytes=data_start + offset,
+        )
+
+    @classmethod
+    def read_header(cls, path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Read the header of a saved index without loading its arrays.
+
+        Args:
+            path: Index file
+
+        Returns:
+            Header dict (version, k1, b, num_docs, metadata, ...)
+
+        Raises:
+            ValueError: If the file is not a BM25 index of a supported version
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.FILE_MAGIC)) != cls.FILE_MAGIC:
+                raise ValueError(f"Not a BM25 index file: {path}")
+            (header_length,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(header_length).decode("utf-8"))
+
+        if header.get("version") != cls.FILE_VERSION:
+            raise ValueError(f"Unsupported BM25 index version: {header.get('version')}")
+
+        header["data_start"] = cls._aligned(len(cls.FILE_MAGIC) + 8 + header_length)
+        return header
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "InvertedIndexBM25":
+        """
+        Load a saved index, memory-mapping its posting arrays.
+
+        Posting, length and forward-index arrays stay backed by the file
+        (read-only, paged in on demand); only the vocabulary and document ID
+        table are materialized as Python objects.
+
+        Args:
+            path: Index file
+
+        Returns:
+            Loaded index (further add/remove calls work as usual)
+        """
+        header = cls.read_header(path)
+        index = cls(k1=header["k1"], b=header["b"])
+        view = index._map_file(path)
+
+        terms = cls._unpack_strings(view("terms_blob"), view("terms_offsets"))
+        doc_ids = cls._unpack_strings(view("ids_blob"), view("ids_offsets"))
+        num_docs = len(doc_ids)
+
+        index.doc_ids = doc_ids
+        index._slots = {doc_id: slot for slot, doc_id in enumerate(doc_ids)}
+        index.vocabulary = {term: term_id for term_id, term in enumerate(terms)}
+        index._terms = terms
+
+        index._deleted = np.zeros(num_docs, dtype=bool)
+        index._num_slots = num_docs
+        index._base_slots = num_docs
+        index.num_docs = num_docs
+        index._total_length = int(index.doc_len.sum())
+        index._update_avgdl()
+
+        index._doc_freq = np.diff(index.term_offsets).tolist()
+
+        logger.info(
+            "Inverted BM25 index loaded",
+            path=str(path),
+            num_docs=index.num_docs,
+            unique_terms=len(index.vocabulary),
+        )
+        return index
+
+    def _map_file(self, path: Union[str, Path]) -> Callable[[str], np.ndarray]:
+        """
+        Memory-map an index file and point the mapped arrays at it.
+
+        Returns:
+            Function returning a read-only view of any array in the file by name
+        """
+        header = self.read_header(path)
+
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        def view(name: str) -> np.ndarray:
+            spec = header["arrays"][name]
+            return np.frombuffer(
+                buffer,
+                dtype=np.dtype(spec["dtype"]),
+                count=spec["length"],
+                offset=header["data_start"] + spec["offset"],
+            )
+
+        for name, attr in self._MAPPED_ARRAYS.items():
+            setattr(self, attr, view(name))
+        self._mapping = buffer
+        self._mapped_path = Path(path).resolve()
+        return view
+
+    @classmethod
+    def _aligned(cls, size: int) -> int:
+        """Round a byte size up to the file alignment."""
+        return -(-size // cls._FILE_ALIGNMENT) * cls._FILE_ALIGNMENT
+
+    @staticmethod
+    def _pack_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode strings as one UTF-8 blob plus an offsets array."""
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+    @staticmethod
+    def _unpack_strings(blob: np.ndarray, offsets: np.ndarray) -> List[str]:
+        """Decode strings packed by _pack_strings."""
+        data = blob.tobytes()
+        bounds = offsets.tolist()
+        return [data[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:])]
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+
+    def _term_idf(self, term_id: int) -> float:
+        """IDF of a term, computed lazily from its live document frequency."""
+        idf = self._idf_cache.get(term_id)
+        if idf is None:
+            doc_freq = self._doc_freq[term_id]
+            # math.log (not np.log) so IDFs are bit-identical to BM25
+            idf = math.log((self.num_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1)
+            self._idf_cache[term_id] = idf
+        return idf
+
+    def _term_upper_bound(self, term_id: int) -> float:
+        """Maximum contribution of a term to any document score (lazy)."""
+        bound = self._bound_cache.get(term_id)
+        if bound is None:
+            docs, tfs = self._postings(term_id)
+            bound = 0.0
+            if len(docs):
+                bound = self._term_idf(term_id) * float(self._contributions(docs, tfs).max())
+            self._bound_cache[term_id] = bound
+        return bound
+
+    def _contributions(self, docs: np.ndarray, tfs: np.ndarray) -> np.ndarray:
+        """Vectorized BM25 term-frequency component (without IDF)."""
+        tf = tfs.astype(np.float64)
+        doc_len = self.doc_len[docs].astype(np.float64)
+        numerator = tf * (self.k1 + 1)
+        denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
+        return numerator / denominator
+
+    def _postings(self, term_id: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return live (doc slots, term frequencies) for a term, sorted by slot."""
+        if term_id < len(self.term_offsets) - 1:
+            start, end = self.term_offsets[term_id], self.term_offsets[term_id + 1]
+            docs, tfs = self.post_docs[start:end], self.post_tfs[start:end]
+        else:
+            docs = tfs = np.zeros(0, dtype=np.int32)
+
+        delta = self._delta_postings.get(term_id)
+        if delta is not None:
+            docs = np.concatenate([docs, np.array(delta[0], dtype=np.int32)])
+            tfs = np.concatenate([tfs, np.array(delta[1], dtype=np.int32)])
+
+        if self._num_deleted:
+            live = ~self._deleted[docs]
+            docs, tfs = docs[live], tfs[live]
+
+        return docs, tfs
+
+    def _query_postings(self, query_tokens: List[str]) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """Live postings of every query term in the corpus, merged once per query."""
+        postings = {}
+        for term in query_tokens:
+            term_id = self.vocabulary.get(term)
+            if term_id is not None and term_id not in postings and self._doc_freq[term_id] > 0:
+                postings[term_id] = self._postings(term_id)
+        return postings
+
+    def _term_frequency(
+        self,
+        term_id: int,
+        doc_idx: int,
+        postings: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None,
+    ) -> int:
+        """Look up a term's frequency in one document via binary search."""
+        docs, tfs = postings[term_id] if postings is not None else self._postings(term_id)
+        pos = int(np.searchsorted(docs, doc_idx))
+        if pos < len(docs) and docs[pos] == doc_idx:
+            return int(tfs[pos])
+        return 0
+
+    def _score_tokens(
+        self,
+        query_tokens: List[str],
+        doc_idx: int,
+        postings: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None,
+    ) -> float:
+        """
+        Calculate BM25 score for already-tokenized query terms.
+
+        Pass the query's postings (see _query_postings()) when scoring many
+        documents, so delta postings and tombstones are merged only once.
+        """
+        score = 0.0
+        doc_len = int(self.doc_len[doc_idx])
+
+        for term in query_tokens:
+            term_id = self.vocabulary.get(term)
+            if term_id is None or self._doc_freq[term_id] == 0:
+                continue  # Term not in corpus
+
+            tf = self._term_frequency(term_id, doc_idx, postings)
+            idf = self._term_idf(term_id)
+
+            numerator = tf * (self.k1 + 1)
+            denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
+
+            score += idf * (numerator / denominator)
+
+        return score
+
+    def score(self, query: str, doc_idx: int) -> float:
+        """
+        Calculate BM25 score for a query-document pair.
+
+        Args:
+            query: Search query
+            doc_idx: Document slot in the index
+
+        Returns:
+            BM25 relevance score
+        """
+        if doc_idx >= self._num_slots or self._deleted[doc_idx]:
+            return 0.0
+
+        return self._score_tokens(self.tokenize(query), doc_idx)
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Search for top-k most relevant documents using the inverted index.
+
+        Args:
+            query: Search query
+            top_k: Number of top results to return
+            allowed_ids: Only score these documents (e.g. metadata filter
+                matches); postings of other documents are skipped
+
+        Returns:
+            List of (doc_id, score) tuples sorted by relevance
+        """
+        return self.search_many([query], top_k=top_k, allowed_ids=allowed_ids)[0]
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        allowed_ids: Optional[Iterable[str]] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Search for several queries at once.
+
+        The allowed-slot mask is built once and shared by all queries.
+
+        Args:
+            queries: Search queries
+            top_k: Number of top results to return per query
+            allowed_ids: Only score these documents (e.g. metadata filter matches)
+
+        Returns:
+            One list of (doc_id, score) tuples per query
+        """
+        if self.num_docs == 0:
+            logger.warning("BM25 not fitted, returning empty results")
+            return [[] for _ in queries]
+
+        allowed = None
+        if allowed_ids is not None:
+            allowed = np.zeros(self._num_slots, dtype=bool)
+            allowed[[self._slots[d] for d in allowed_ids if d in self._slots]] = True
+
+        return [self._search_one(query, top_k, allowed) for query in queries]
+
+    def _search_one(
+        self,
+        query: str,
+        top_k: int,
+        allowed: Optional[np.ndarray],
+    ) -> List[Tuple[str, float]]:
+        """Score one query against the index (see search())."""
+        query_tokens = self.tokenize(query)
+        postings = self._query_postings(query_tokens)
+        candidates = self._candidate_docs(query_tokens, top_k, allowed, postings)
+
+        # Exact re-scoring in query order keeps scores identical to BM25
+        scored = []
+        for doc_idx in candidates.tolist():
+            score = self._score_tokens(query_tokens, doc_idx, postings)
+            if score > 0:
+                scored.append((doc_idx, score))
+
+        scored.sort(key=lambda x: (-x[1], x[0]))
+        results = [(self.doc_ids[doc_idx], score) for doc_idx, score in scored[:top_k]]
+
+        logger.debug(
+            "BM25 search completed",
+            query=query[:50],
+            candidates=len(candidates),
+            returned=len(results),
+        )
+
+        return results
+
+    def _candidate_docs(
+        self,
+        query_tokens: List[str],
+        top_k: int,
+        allowed: Optional[np.ndarray] = None,
+        postings: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None,
+    ) -> np.ndarray:
+        """
+        Find the documents that can reach the top-k (MaxScore pruning).
+
+        If an allowed-slot mask is given, only those documents are scored.
+        Candidates and their partial scores are kept as sorted arrays built
+        from the postings, so the cost follows the postings touched rather
+        than the number of documents in the index.
+
+        Returns:
+            Sorted array of candidate document slots (a small superset of the
+            true top-k, to absorb floating-point summation differences).
+        """
+        if top_k <= 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Query term multiplicity matters: repeated tokens are scored repeatedly
+        term_counts = Counter(
+            self.vocabulary[t]
+            for t in query_tokens
+            if t in self.vocabulary and self._doc_freq[self.vocabulary[t]] > 0
+        )
+        if not term_counts:
+            return np.zeros(0, dtype=np.int64)
+        if postings is None:
+            postings = self._query_postings(query_tokens)
+
+        terms = [
+            (term_id, count, count * self._term_upper_bound(term_id))
+            for term_id, count in term_counts.items()
+        ]
+        terms.sort(key=lambda t: t[2], reverse=True)
+        remaining_bounds = np.cumsum([t[2] for t in terms][::-1])[::-1]
+
+        # Sorted candidate slots and their partial scores
+        candidates = np.zeros(0, dtype=np.int64)
+        scores = np.zeros(0, dtype=np.float64)
+        pruning = False
+
+        for i, (term_id, count, _) in enumerate(terms):
+            docs, tfs = postings[term_id]
+            if allowed is not None:
+                keep = allowed[docs]
+                docs, tfs = docs[keep], tfs[keep]
+            contributions = count * self._term_idf(term_id) * self._contributions(docs, tfs)
+
+            if pruning:
+                # Non-essential term: only update documents still in the race
+                pos = np.searchsorted(candidates, docs)
+                found = pos < len(candidates)
+                found[found] = candidates[pos[found]] == docs[found]
+                scores[pos[found]] += contributions[found]
+            else:
+                merged, inverse = np.unique(np.concatenate([candidates, docs]), return_inverse=True)
+                scores = np.bincount(
+                    inverse, weights=np.concatenate([scores, contributions]), minlength=len(merged)
+                )
+                candidates = merged
+
+            if i + 1 < len(terms) and len(candidates) > top_k:
+                threshold = np.partition(scores, -top_k)[-top_k]
+                threshold -= self._SCORE_SLACK * max(abs(threshold), 1.0)
+                rest = remaining_bounds[i + 1]
+                if threshold > rest:
+                    pruning = True
+                    # Drop candidates that can no longer reach the threshold
+                    keep = scores + rest >= threshold
+                    candidates, scores = candidates[keep], scores[keep]
+
+        if len(candidates) <= top_k:
+            return candidates
+
+        threshold = np.partition(scores, -top_k)[-top_k]
+        threshold -= self._SCORE_SLACK * max(abs(threshold), 1.0)
+        return candidates[scores >= threshold]
+
 
 class HybridSearch:
     """
@@ -329,6 +1305,30 @@ class HybridSearch:
 
         return merged
 
+    @staticmethod
+    def fuse_rankings(
+        rankings: List[List[str]],
+        k: int = 60,
+    ) -> List[Tuple[str, float]]:
+        """
+        Merge any number of ranked ID lists using Reciprocal Rank Fusion.
+
+        Used to combine the results of several query variations.
+
+        Args:
+            rankings: Ranked lists of document IDs
+            k: RRF constant (higher k reduces impact of rank differences)
+
+        Returns:
+            List of (doc_id, rrf_score) tuples sorted by RRF score
+        """
+        rrf_scores = defaultdict(float)
+        for ranking in rankings:
+            for rank, doc_id in enumerate(ranking, start=1):
+                rrf_scores[doc_id] += 1.0 / (k + rank)
+
+        return sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
+
     @staticmethod
     def weighted_score_fusion(
         bm25_results: List[Tuple[str, float]],
@@ -391,6 +1391,9 @@ def create_bm25_index(
     """
     Create and fit a BM25 index from documents.
 
+    Returns an :class:`InvertedIndexBM25`, which scores identically to
+    :class:`BM25` but only touches documents containing query terms.
+
     Args:
         documents: List of document dictionaries
         content_field: Field name containing document text
@@ -404,7 +1407,7 @@ def create_bm25_index(
     corpus = [doc[content_field] for doc in documents]
     doc_ids = [doc[id_field] for doc in documents]
 
-    bm25 = BM25(k1=k1, b=b)
+    bm25 = InvertedIndexBM25(k1=k1, b=b)
     bm25.fit(corpus, doc_ids)
 
     return bm25
@@ -0,0 +1,173 @@
+"""
+CPU inference backends for the sentence-transformers models.
+
+The embedding model and the cross-encoder re-ranker can run as:
+- "torch": full-precision PyTorch (default)
+- "onnx": ONNX Runtime through sentence-transformers' backend support
+  (needs ``pip install "sentence-transformers[onnx]"``; sentence-transformers
+  3.2+ for embeddings, 4.1+ for the cross-encoder)
+- "int8": PyTorch with dynamic int8 quantization of all Linear layers
+
+A backend that cannot be loaded falls back to "torch" with a warning, so a
+misconfigured instance still serves requests; the loaders return the
+backend that was actually used. Use
+scripts/benchmark_inference_backends.py to check accuracy against the fp32
+model and measure throughput before switching a deployment.
+"""
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import structlog
+from sentence_transformers import CrossEncoder, SentenceTransformer
+
+logger = structlog.get_logger(__name__)
+
+TORCH_BACKEND = "torch"
+ONNX_BACKEND = "onnx"
+INT8_BACKEND = "int8"
+
+BACKENDS = (TORCH_BACKEND, ONNX_BACKEND, INT8_BACKEND)
+
+
+def validate_backend(backend: str) -> str:
+    """
+    Normalize a backend name.
+
+    Args:
+        backend: One of BACKENDS (case-insensitive).
+
+    Returns:
+        The normalized backend name.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    normalized = backend.strip().lower()
+    if normalized not in BACKENDS:
+        raise ValueError(f"Unknown inference backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+    return normalized
+
+
+def quantize_int8(module: Any) -> Any:
+    """
+    Apply dynamic int8 quantization to the Linear layers of a model in place.
+
+    Dynamic quantization only runs on CPU; models on other devices are
+    returned unchanged.
+
+    Args:
+        module: torch.nn.Module to quantize.
+
+    Returns:
+        The (quantized) module.
+    """
+    import torch
+
+    device = next(module.parameters()).device
+    if device.type != "cpu":
+        logger.warning("int8 quantization needs a CPU model, keeping full precision", device=str(device))
+        return module
+
+    return torch.quantization.quantize_dynamic(
+        module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
+def _load(model_cls: Any, model_name: str, backend: str, **kwargs: Any) -> Tuple[Any, str]:
+    """Load a sentence-transformers model class, returning it and the backend used."""
+    backend = validate_backend(backend)
+
+    if backend == ONNX_BACKEND:
+        try:
+            return model_cls(model_name, backend=ONNX_BACKEND, **kwargs), ONNX_BACKEND
+        except Exception as e:
+            # Missing runtime (ImportError), sentence-transformers too old for the
+            # backend argument (TypeError), or a failed export/load from optimum
+            logger.warning(
+                "ONNX backend unavailable, falling back to torch",
+                model=model_name,
+                error=str(e),
+            )
+            backend = TORCH_BACKEND
+
+    return model_cls(model_name, **kwargs), backend
+
+
+def _quantize_or_keep(module: Any, model_name: str) -> str:
+    """Quantize a loaded model to int8, returning the backend it ends up on."""
+    try:
+        quantize_int8(module)
+        return INT8_BACKEND
+    except Exception as e:
+        # e.g. no quantization engine on this CPU
+        logger.warning("int8 quantization failed, keeping torch", model=model_name, error=str(e))
+        return TORCH_BACKEND
+
+
+def load_sentence_transformer(
+    model_name: str, backend: str = TORCH_BACKEND, **kwargs: Any
+) -> Tuple[SentenceTransformer, str]:
+    """
+    Load an embedding model on the given inference backend.
+
+    Args:
+        model_name: Model name or path.
+        backend: One of BACKENDS.
+        **kwargs: Passed to SentenceTransformer.
+
+    Returns:
+        Loaded SentenceTransformer and the backend used (after any fallback).
+    """
+    model, backend = _load(SentenceTransformer, model_name, backend, **kwargs)
+    if backend == INT8_BACKEND:
+        backend = _quantize_or_keep(model, model_name)
+    return model, backend
+
+
+def load_cross_encoder(
+    model_name: str, backend: str = TORCH_BACKEND, **kwargs: Any
+) -> Tuple[CrossEncoder, str]:
+    """
+    Load a cross-encoder on the given inference backend.
+
+    Args:
+        model_name: Model name or path.
+        backend: One of BACKENDS.
+        **kwargs: Passed to CrossEncoder.
+
+    Returns:
+        Loaded CrossEncoder and the backend used (after any fallback).
+    """
+    model, backend = _load(CrossEncoder, model_name, backend, **kwargs)
+    if backend == INT8_BACKEND:
+        # The transformer is wrapped in .model (CrossEncoder itself is not a Module)
+        backend = _quantize_or_keep(model.model, model_name)
+    return model, backend
+
+
+def embedding_agreement(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """
+    Compare embeddings of the same texts from two backends.
+
+    Args:
+        reference: (n, dim) embeddings from the fp32 model.
+        candidate: (n, dim) embeddings from the backend under test.
+
+    Returns:
+        Mean, minimum and 5th-percentile row-wise cosine similarity.
+    """
+    reference = np.asarray(reference, dtype=np.float32)
+    candidate = np.asarray(candidate, dtype=np.float32)
+    if reference.shape != candidate.shape:
+        raise ValueError(f"Shape mismatch: {reference.shape} vs {candidate.shape}")
+
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    norms[norms == 0] = 1.0
+    cosines = np.einsum("ij,ij->i", reference, candidate) / norms
+
+    return {
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "p5_cosine": float(np.percentile(cosines, 5)),
+    }
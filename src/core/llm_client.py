@@ -5,10 +5,21 @@ Supports Ollama (local) and Groq (cloud) providers with:
 - Retry with exponential backoff
 - Request timeouts (via client-side HTTP timeout)
 - Comprehensive error handling
+- Native async calls over pooled keep-alive HTTP connections
+- Response cache for repeated low-temperature calls
 """
 
-from typing import AsyncGenerator, Generator, Literal, Optional
-
+import asyncio
+import hashlib
+import importlib.util
+import json
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Literal, Optional, Tuple
+
+import httpx
 import structlog
 from tenacity import (
     retry,
@@ -19,6 +30,7 @@ from tenacity import (
 )
 
 from src.config import settings
+from src.core.cache import get_llm_response_cache, get_llm_semantic_cache
 from src.core.circuit_breaker import llm_circuit_breaker
 from src.core.exceptions import (
     LLMConnectionError,
@@ -27,15 +39,91 @@ from src.core.exceptions import (
     LLMCircuitBreakerOpen,
     is_retryable_error,
 )
+from src.core.executors import QUERY_POOL, run_in_executor
 
 logger = structlog.get_logger(__name__)
 
+# Retry transient failures (shared by the sync and async paths)
+_llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type((LLMConnectionError, LLMTimeoutError)),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
+# ============================================================================
+# Pooled async HTTP clients
+# ============================================================================
+
+# httpx connections belong to the event loop that opened them, so the shared
+# async clients are kept per loop: the API server reuses one pool for every
+# request, while each asyncio.run() (CLI, tests) gets its own.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Connection pool options for the async Groq and Ollama HTTP clients."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.llm_http_max_connections,
+            max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+            keepalive_expiry=settings.llm_http_keepalive_expiry,
+        ),
+        # HTTP/2 needs the optional h2 package
+        "http2": settings.llm_http2 and importlib.util.find_spec("h2") is not None,
+    }
+
+
+def _shared_async_client(key: str, factory: Callable[[], Any]) -> Any:
+    """Get or create an async client shared on the running event loop."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = factory()
+    return client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the pooled keep-alive HTTP client of the running event loop."""
+    return _shared_async_client("http", lambda: httpx.AsyncClient(**_http_client_options()))
+
+
+async def aclose_async_clients() -> None:
+    """Close the pooled async clients of the running event loop (call on shutdown)."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        # Provider clients wrap their httpx client in ._client
+        http_client = client if isinstance(client, httpx.AsyncClient) else getattr(client, "_client", None)
+        if isinstance(http_client, httpx.AsyncClient):
+            await http_client.aclose()
+
+
+async def _aclose_stream(stream: Any) -> None:
+    """Release the connection held by a provider stream."""
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is not None:
+        await close()
+
 
 # ============================================================================
 # LLM Client
 # ============================================================================
 
 
+@dataclass
+class _CacheLookup:
+    """Where a call's response is cached (see LLMClient._cache_lookup())."""
+
+    key: str
+    scope: str
+    prompt: str
+    embedding: Optional[Any] = None
+
+
 class LLMClient:
     """
     Unified LLM client supporting local (Ollama) and cloud (Groq) models.
@@ -48,6 +136,7 @@ class LLMClient:
     - Request timeouts
     - Comprehensive error handling
     - Conversation history management
+    - Exact and (optional) semantic response cache
     """
 
     def __init__(
@@ -78,6 +167,7 @@ class LLMClient:
 
         self._ollama_client = None
         self._groq_client = None
+        self._embedding_service = None
 
         logger.info(
             "llm_client_initialized",
@@ -107,13 +197,51 @@ class LLMClient:
                 raise
         return self._groq_client
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((LLMConnectionError, LLMTimeoutError)),
-        before_sleep=before_sleep_log(logger, "warning"),
-        reraise=True,
-    )
+    @property
+    def async_ollama_client(self):
+        """Get the Ollama async client shared on the running event loop."""
+        def create():
+            import ollama
+            return ollama.AsyncClient(host=self.base_url, **_http_client_options())
+
+        return _shared_async_client(f"ollama:{self.base_url}", create)
+
+    @property
+    def async_groq_client(self):
+        """Get the Groq async client on the pooled HTTP client of the running event loop."""
+        def create():
+            try:
+                from groq import AsyncGroq
+            except ImportError:
+                logger.error("Groq package not installed. Run: pip install groq")
+                raise
+            if not settings.groq_api_key:
+                raise ValueError("GROQ_API_KEY not set in environment")
+            return AsyncGroq(api_key=settings.groq_api_key, http_client=get_async_http_client())
+
+        return _shared_async_client("groq", create)
+
+    def _to_llm_error(self, error: Exception) -> Exception:
+        """Convert a provider exception to the matching LLM exception type."""
+        error_msg = str(error).lower()
+        details = {"provider": self.provider, "model": self.model}
+
+        if (
+            isinstance(error, (asyncio.TimeoutError, httpx.TimeoutException))
+            or "timeout" in error_msg
+            or "timed out" in error_msg
+        ):
+            return LLMTimeoutError(f"LLM request timed out: {str(error)}", details=details)
+        elif (
+            isinstance(error, httpx.TransportError)
+            or "connection" in error_msg
+            or "network" in error_msg
+            or "unreachable" in error_msg
+        ):
+            return LLMConnectionError(f"Failed to connect to LLM: {str(error)}", details=details)
+        else:
+            return LLMResponseError(f"LLM generation failed: {str(error)}", details=details)
+
     def generate(
         self,
         prompt: str,
@@ -121,6 +249,7 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 2048,
         timeout_seconds: int = 120,
+        use_cache: Optional[bool] = None,
     ) -> str:
         """
         Generate a response from the LLM with circuit breaker protection.
@@ -131,6 +260,9 @@ class LLMClient:
             temperature: Sampling temperature (0-2).
             max_tokens: Maximum tokens in response.
             timeout_seconds: Request timeout in seconds (default: 120).
+            use_cache: Consult and fill the response cache. None (default) caches
+                calls at or below settings.llm_cache_max_temperature; True also
+                caches hotter calls whose output is safe to reuse; False opts out.
 
         Returns:
             Generated text response.
@@ -154,6 +286,19 @@ class LLMClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
+        return self._call_cached(
+            self._generate_uncached, messages, temperature, max_tokens, timeout_seconds, use_cache
+        )
+
+    @_llm_retry
+    def _generate_uncached(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+    ) -> str:
+        """Run one call through the circuit breaker, retrying transient failures."""
         try:
             # Use circuit breaker to protect the call
             result = llm_circuit_breaker.call(
@@ -179,27 +324,7 @@ class LLMClient:
 
         except Exception as e:
             # Convert unknown exceptions to our exception types
-            error_msg = str(e).lower()
-
-            if "timeout" in error_msg or "timed out" in error_msg:
-                raise LLMTimeoutError(
-                    f"LLM request timed out: {str(e)}",
-                    details={"provider": self.provider, "model": self.model},
-                ) from e
-            elif (
-                "connection" in error_msg
-                or "network" in error_msg
-                or "unreachable" in error_msg
-            ):
-                raise LLMConnectionError(
-                    f"Failed to connect to LLM: {str(e)}",
-                    details={"provider": self.provider, "model": self.model},
-                ) from e
-            else:
-                raise LLMResponseError(
-                    f"LLM generation failed: {str(e)}",
-                    details={"provider": self.provider, "model": self.model},
-                ) from e
+            raise self._to_llm_error(e) from e
 
     def _generate_with_timeout(
         self,
@@ -283,6 +408,7 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 2048,
         timeout_seconds: int = 120,
+        use_cache: Optional[bool] = None,
     ) -> str:
         """
         Chat with conversation history.
@@ -292,10 +418,23 @@ class LLMClient:
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
             timeout_seconds: Request timeout in seconds.
+            use_cache: Consult and fill the response cache (see generate()).
 
         Returns:
             Assistant's response.
         """
+        return self._call_cached(
+            self._chat_uncached, messages, temperature, max_tokens, timeout_seconds, use_cache
+        )
+
+    def _chat_uncached(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+    ) -> str:
+        """Run one chat request on the provider's client."""
         try:
             if self.provider == "groq":
                 return self._generate_with_groq(messages, temperature, max_tokens, timeout_seconds)
@@ -333,6 +472,420 @@ class LLMClient:
             logger.error("Chat streaming failed", error=str(e), provider=self.provider)
             raise
 
+    # ------------------------------------------------------------------
+    # Response cache
+    # ------------------------------------------------------------------
+
+    @property
+    def embedding_service(self):
+        """Get the embedding service used by the semantic response cache."""
+        if self._embedding_service is None:
+            from src.core.embeddings import get_embedding_service
+            self._embedding_service = get_embedding_service()
+        return self._embedding_service
+
+    def _should_cache(self, temperature: float, use_cache: Optional[bool]) -> bool:
+        """Whether a call's response is read from and written to the cache."""
+        if not settings.llm_cache_enabled or use_cache is False:
+            return False
+        return bool(use_cache) or temperature <= settings.llm_cache_max_temperature
+
+    def _cache_lookup(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Tuple[Optional[str], _CacheLookup]:
+        """
+        Look up the cached response for a call.
+
+        The exact tier is keyed on provider, model, temperature, max_tokens and
+        the full messages. With settings.llm_cache_semantic, a miss falls back
+        to calls whose last message is near-identical by embedding and whose
+        parameters and earlier messages match exactly.
+
+        Returns:
+            The cached response (None on a miss) and the lookup to pass to _cache_store().
+        """
+        params = json.dumps([self.provider, self.model, temperature, max_tokens])
+        key = hashlib.sha256(f"{params}\n{json.dumps(messages, sort_keys=True)}".encode()).hexdigest()
+        scope = hashlib.sha256(f"{params}\n{json.dumps(messages[:-1], sort_keys=True)}".encode()).hexdigest()
+        lookup = _CacheLookup(key=key, scope=scope, prompt=messages[-1]["content"] if messages else "")
+
+        response_cache = get_llm_response_cache()
+        cached = response_cache.get(key)
+        if cached is not None:
+            logger.debug("llm_cache_hit", provider=self.provider, model=self.model)
+            return cached, lookup
+
+        if settings.llm_cache_semantic and lookup.prompt:
+            try:
+                lookup.embedding = self.embedding_service.embed_query_np(lookup.prompt)
+            except Exception as e:
+                # The cache is an optimization: never fail the call over it
+                logger.warning("llm_cache_embedding_failed", error=str(e))
+                return None, lookup
+
+            cached = get_llm_semantic_cache().get(lookup.prompt, lookup.embedding, scope=scope)
+            if cached is not None:
+                response_cache.put(key, cached)
+                return cached, lookup
+
+        return None, lookup
+
+    def _cache_store(self, lookup: _CacheLookup, response: str) -> None:
+        """Cache a response under a lookup from _cache_lookup()."""
+        if not response:
+            return
+        get_llm_response_cache().put(lookup.key, response)
+        if lookup.embedding is not None:
+            get_llm_semantic_cache().put(lookup.prompt, lookup.embedding, response, scope=lookup.scope)
+
+    def _call_cached(
+        self,
+        call: Callable[..., str],
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+        use_cache: Optional[bool],
+    ) -> str:
+        """Serve a call from the response cache, or run it and cache the response."""
+        if not self._should_cache(temperature, use_cache):
+            return call(messages, temperature, max_tokens, timeout_seconds)
+
+        cached, lookup = self._cache_lookup(messages, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        response = call(messages, temperature, max_tokens, timeout_seconds)
+        self._cache_store(lookup, response)
+        return response
+
+    async def _acall_cached(
+        self,
+        call: Callable[..., Any],
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+        use_cache: Optional[bool],
+    ) -> str:
+        """Async _call_cached(); the semantic tier embeds the prompt on the query pool."""
+        if not self._should_cache(temperature, use_cache):
+            return await call(messages, temperature, max_tokens, timeout_seconds)
+
+        if settings.llm_cache_semantic:
+            cached, lookup = await run_in_executor(
+                QUERY_POOL, self._cache_lookup, messages, temperature, max_tokens
+            )
+        else:
+            cached, lookup = self._cache_lookup(messages, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        response = await call(messages, temperature, max_tokens, timeout_seconds)
+        self._cache_store(lookup, response)
+        return response
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        timeout_seconds: int = 120,
+        use_cache: Optional[bool] = None,
+    ) -> str:
+        """
+        Generate a response without blocking the event loop.
+
+        Async counterpart of generate(), with the same circuit breaker,
+        retries, response cache and exceptions.
+
+        Args:
+            prompt: User prompt.
+            system_prompt: Optional system prompt for context.
+            temperature: Sampling temperature (0-2).
+            max_tokens: Maximum tokens in response.
+            timeout_seconds: Request timeout in seconds (default: 120).
+            use_cache: Consult and fill the response cache (see generate()).
+
+        Returns:
+            Generated text response.
+        """
+        logger.debug(
+            "llm_agenerate_request",
+            provider=self.provider,
+            model=self.model,
+            prompt_length=len(prompt),
+            timeout=timeout_seconds,
+        )
+
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return await self.achat(messages, temperature, max_tokens, timeout_seconds, use_cache)
+
+    async def achat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+        timeout_seconds: int = 120,
+        use_cache: Optional[bool] = None,
+    ) -> str:
+        """
+        Chat with conversation history without blocking the event loop.
+
+        Uses the providers' native async clients over the pooled HTTP
+        connections, protected by the LLM circuit breaker and retried on
+        connection errors and timeouts.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in response.
+            timeout_seconds: Request timeout in seconds (enforced).
+            use_cache: Consult and fill the response cache (see generate()).
+
+        Returns:
+            Assistant's response.
+
+        Raises:
+            LLMCircuitBreakerOpen: If circuit breaker is open
+            LLMTimeoutError: If request times out
+            LLMConnectionError: If connection fails
+            LLMResponseError: If response is invalid
+        """
+        return await self._acall_cached(
+            self._achat_uncached, messages, temperature, max_tokens, timeout_seconds, use_cache
+        )
+
+    @_llm_retry
+    async def _achat_uncached(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+    ) -> str:
+        """Run one async call through the circuit breaker, retrying transient failures."""
+        try:
+            return await llm_circuit_breaker.acall(
+                self._achat_with_timeout,
+                messages,
+                temperature,
+                max_tokens,
+                timeout_seconds,
+            )
+
+        except LLMCircuitBreakerOpen:
+            logger.warning(
+                "llm_circuit_breaker_blocking",
+                provider=self.provider,
+            )
+            raise
+
+        except (LLMTimeoutError, LLMConnectionError, LLMResponseError):
+            raise
+
+        except Exception as e:
+            raise self._to_llm_error(e) from e
+
+    async def _achat_with_timeout(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int,
+    ) -> str:
+        """Run one async chat request, cancelling it after timeout_seconds."""
+        if self.provider == "groq":
+            request = self._agenerate_with_groq(messages, temperature, max_tokens, timeout_seconds)
+        else:
+            request = self._agenerate_with_ollama(messages, temperature, max_tokens)
+
+        try:
+            return await asyncio.wait_for(request, timeout=timeout_seconds)
+        except asyncio.TimeoutError as e:
+            raise LLMTimeoutError(
+                f"LLM request timed out after {timeout_seconds} seconds",
+                details={"timeout_seconds": timeout_seconds},
+            ) from e
+
+    async def achat_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2048,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Streaming chat with conversation history without blocking the event loop.
+
+        The circuit breaker and retries cover opening the stream up to the
+        first chunk; chunks already yielded are never retried. Closing the
+        generator early closes the provider stream and its connection.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in response.
+
+        Yields:
+            Text chunks as they are generated.
+        """
+        try:
+            first, chunks = await llm_circuit_breaker.acall(
+                self._aopen_stream, messages, temperature, max_tokens
+            )
+        except LLMCircuitBreakerOpen:
+            logger.warning("llm_circuit_breaker_blocking", provider=self.provider)
+            raise
+
+        if first is None:
+            return
+
+        try:
+            yield first
+            async for chunk in chunks:
+                yield chunk
+
+        except Exception as e:
+            logger.error("Chat streaming failed", error=str(e), provider=self.provider)
+            raise
+
+        finally:
+            await chunks.aclose()
+
+    @_llm_retry
+    async def _aopen_stream(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> Tuple[Optional[str], AsyncGenerator[str, None]]:
+        """
+        Start a streaming request and wait for its first chunk.
+
+        Returns:
+            The first chunk (None for an empty response) and the generator
+            producing the remaining chunks.
+        """
+        if self.provider == "groq":
+            chunks = self._agenerate_stream_with_groq(messages, temperature, max_tokens)
+        else:
+            chunks = self._agenerate_stream_with_ollama(messages, temperature, max_tokens)
+
+        try:
+            return await chunks.__anext__(), chunks
+
+        except StopAsyncIteration:
+            return None, chunks
+
+        except BaseException as e:
+            # Also on cancellation: release the provider connection
+            await chunks.aclose()
+            if isinstance(e, Exception) and not isinstance(
+                e, (LLMTimeoutError, LLMConnectionError, LLMResponseError)
+            ):
+                raise self._to_llm_error(e) from e
+            raise
+
+    async def _agenerate_with_ollama(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Generate using the async Ollama client."""
+        response = await self.async_ollama_client.chat(
+            model=self.model,
+            messages=messages,
+            options={
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        )
+        content = response["message"]["content"]
+        logger.debug("Ollama response generated", response_length=len(content))
+        return content
+
+    async def _agenerate_stream_with_ollama(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncGenerator[str, None]:
+        """Generate a streaming response using the async Ollama client."""
+        stream = await self.async_ollama_client.chat(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            options={
+                "temperature": temperature,
+                "num_predict": max_tokens,
+            },
+        )
+
+        try:
+            async for chunk in stream:
+                if "message" in chunk and chunk["message"]["content"]:
+                    yield chunk["message"]["content"]
+        finally:
+            await _aclose_stream(stream)
+
+    async def _agenerate_with_groq(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        timeout_seconds: int = 120,
+    ) -> str:
+        """Generate using the async Groq client."""
+        response = await self.async_groq_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            timeout=timeout_seconds,
+        )
+        content = response.choices[0].message.content
+        logger.debug("Groq response generated", response_length=len(content))
+        return content
+
+    async def _agenerate_stream_with_groq(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncGenerator[str, None]:
+        """Generate a streaming response using the async Groq client."""
+        stream = await self.async_groq_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await _aclose_stream(stream)
+
+    # ------------------------------------------------------------------
+    # Provider implementations (sync)
+    # ------------------------------------------------------------------
+
     def _generate_with_ollama(
         self,
         messages: list[dict[str, str]],
@@ -476,17 +1029,24 @@ class LLMClient:
             return {"provider": self.provider, "name": self.model, "error": str(e)}
 
 
+# Process-wide registry of shared LLMClient instances.
+# Keyed by (provider, model) so agents and chat requests reuse one client and
+# its HTTP connections instead of building a new client per request.
+_llm_clients: Dict[Tuple[str, str], LLMClient] = {}
+_llm_clients_lock = threading.Lock()
+
+
 # Convenience functions
 def get_llm_client(agent_type: Optional[str] = None) -> LLMClient:
     """
-    Get an LLM client instance configured for the current provider.
+    Get the shared LLM client configured for the current provider.
 
     Args:
         agent_type: Type of agent ("reasoning", "code", "general").
                    Used to select appropriate model when provider is Groq.
 
     Returns:
-        Configured LLMClient instance.
+        Shared LLMClient instance for the (provider, model) pair.
     """
     provider = settings.llm_provider
 
@@ -498,11 +1058,23 @@ def get_llm_client(agent_type: Optional[str] = None) -> LLMClient:
             model = settings.groq_code_model
         else:
             model = settings.groq_general_model
-
-        return LLMClient(provider="groq", model=model)
     else:
         # Ollama uses the same model for all agents
-        return LLMClient(provider="ollama", model=settings.ollama_model)
+        provider = "ollama"
+        model = settings.ollama_model
+
+    key = (provider, model)
+    with _llm_clients_lock:
+        client = _llm_clients.get(key)
+        if client is None:
+            client = _llm_clients[key] = LLMClient(provider=provider, model=model)
+    return client
+
+
+def reset_llm_clients() -> None:
+    """Drop all shared LLMClient instances (mainly for tests)."""
+    with _llm_clients_lock:
+        _llm_clients.clear()
 
 
 def create_reasoning_client() -> LLMClient:
@@ -0,0 +1,459 @@
+"""
+Columnar metadata index for filter pre-selection.
+
+Keeps every metadata field as a dictionary-encoded column over the
+documents of a collection, so ChromaDB-style where clauses and ``Filter``
+objects compile to a boolean row mask before any scoring happens:
+
+- Equality / membership: compare the column's value codes (numpy)
+- Ranges: compare a parallel float column (numpy)
+- String operators (contains, regex, ...): evaluate once per distinct
+  value, then select rows by code
+
+Both retrieval legs use the resulting ``CandidateSet``: BM25 only scores
+allowed documents and the vector leg gets an ID allow-list (or an
+over-fetch factor when the filter is broad).
+
+Per-value bitmaps were not used: a bitmap costs one bit per document per
+distinct value, which does not scale to high-cardinality fields such as
+endpoint paths, while value codes cost four bytes per document per field.
+"""
+
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+from src.core.advanced_filtering import (
+    CombinedFilter,
+    Filter,
+    FilterOperator,
+    MetadataFilter,
+)
+
+logger = structlog.get_logger(__name__)
+
+_MISSING = -1  # Value code of documents without the field
+
+_RANGE_OPERATORS: Dict[str, Callable[[np.ndarray, float], np.ndarray]] = {
+    "$gt": np.greater,
+    "$gte": np.greater_equal,
+    "$lt": np.less,
+    "$lte": np.less_equal,
+}
+
+_FILTER_RANGE_OPERATORS = {
+    FilterOperator.GT: "$gt",
+    FilterOperator.GTE: "$gte",
+    FilterOperator.LT: "$lt",
+    FilterOperator.LTE: "$lte",
+}
+
+
+def _value_key(value: Any) -> Tuple[bool, Any]:
+    """
+    Dictionary key of a metadata value.
+
+    Matches ChromaDB equality: 1 and 1.0 are equal, True and 1 are not.
+    """
+    if isinstance(value, list):
+        value = tuple(value)
+    return (isinstance(value, bool), value)
+
+
+def _is_number(value: Any) -> bool:
+    """Check for an int/float that is not a bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _Column:
+    """Dictionary-encoded values of one metadata field."""
+
+    def __init__(self, capacity: int):
+        self.codes = np.full(capacity, _MISSING, dtype=np.int32)
+        self.numbers = np.full(capacity, np.nan, dtype=np.float64)  # Bools as 0/1
+        self.bools = np.zeros(capacity, dtype=bool)
+        self.keys: Dict[Tuple[bool, Any], int] = {}  # Value key -> code
+        self.values: List[Any] = []  # Code -> value
+
+    def resize(self, capacity: int) -> None:
+        """Grow or shrink the per-row arrays."""
+        size = min(capacity, len(self.codes))
+        codes = np.full(capacity, _MISSING, dtype=np.int32)
+        numbers = np.full(capacity, np.nan, dtype=np.float64)
+        bools = np.zeros(capacity, dtype=bool)
+        codes[:size] = self.codes[:size]
+        numbers[:size] = self.numbers[:size]
+        bools[:size] = self.bools[:size]
+        self.codes, self.numbers, self.bools = codes, numbers, bools
+
+    def set(self, row: int, value: Any) -> None:
+        """Store a value for a row."""
+        key = _value_key(value)
+        code = self.keys.get(key)
+        if code is None:
+            code = len(self.values)
+            self.keys[key] = code
+            self.values.append(value)
+
+        self.codes[row] = code
+        if isinstance(value, bool):
+            self.numbers[row] = float(value)
+            self.bools[row] = True
+        elif _is_number(value):
+            self.numbers[row] = float(value)
+
+    def take(self, rows: np.ndarray) -> None:
+        """Keep only the given rows, in order (compaction)."""
+        self.codes = self.codes[rows]
+        self.numbers = self.numbers[rows]
+        self.bools = self.bools[rows]
+
+    def rows_with_codes(self, codes: Iterable[int], size: int) -> np.ndarray:
+        """Mask of rows whose value code is in codes."""
+        codes = list(codes)
+        if not codes:
+            return np.zeros(size, dtype=bool)
+        if len(codes) == 1:
+            return self.codes[:size] == codes[0]
+        return np.isin(self.codes[:size], codes)
+
+
+class CandidateSet:
+    """
+    Documents allowed by a metadata filter.
+
+    A snapshot: documents added after it was created are not members,
+    documents removed since are dropped on lookup.
+    """
+
+    def __init__(
+        self,
+        mask: np.ndarray,
+        doc_ids: List[str],
+        rows: Dict[str, int],
+        total: int,
+        exact: bool,
+    ):
+        self._mask = mask
+        self._doc_ids = doc_ids
+        self._rows = rows
+        self.count = int(mask.sum())
+        self.total = total  # Live documents in the collection
+        self.exact = exact  # False if parts of the filter could not be indexed
+
+    def __contains__(self, doc_id: str) -> bool:
+        row = self._rows.get(doc_id)
+        return row is not None and row < len(self._mask) and bool(self._mask[row])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def ids(self, limit: Optional[int] = None) -> Optional[List[str]]:
+        """
+        Materialize the allowed document IDs.
+
+        Returns:
+            List of IDs, or None if there are more than limit
+        """
+        if limit is not None and self.count > limit:
+            return None
+        return [self._doc_ids[row] for row in np.flatnonzero(self._mask).tolist()]
+
+    def overfetch_factor(self, max_factor: int) -> int:
+        """How many times more results to fetch so enough survive the filter."""
+        if self.count == 0:
+            return 1
+        return max(1, min(max_factor, math.ceil(self.total / self.count)))
+
+
+class MetadataIndex:
+    """
+    In-memory columnar index over document metadata.
+
+    Rows are appended on add and tombstoned on remove; the arrays are
+    compacted once a quarter of the rows are dead.
+    """
+
+    _COMPACT_DEAD_RATIO = 0.25
+    _COMPACT_MIN_DEAD = 1_000
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.doc_ids: List[str] = []  # Row -> document ID
+        self._rows: Dict[str, int] = {}  # Document ID -> row (live only)
+        self._alive = np.zeros(0, dtype=bool)
+        self._columns: Dict[str, _Column] = {}
+        self._size = 0  # Rows in use (live + dead)
+        self._capacity = 0
+
+    @classmethod
+    def build(
+        cls,
+        doc_ids: List[str],
+        metadatas: List[Optional[Dict[str, Any]]],
+    ) -> "MetadataIndex":
+        """Build an index from parallel ID and metadata lists."""
+        index = cls()
+        index._ensure_capacity(len(doc_ids))
+        for doc_id, metadata in zip(doc_ids, metadatas):
+            index.add(doc_id, metadata)
+
+        logger.info(
+            "Metadata index built",
+            num_docs=len(index),
+            fields=len(index._columns),
+        )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, doc_id: str, metadata: Optional[Dict[str, Any]]) -> None:
+        """Add a document (replacing its metadata if it is already indexed)."""
+        if doc_id in self._rows:
+            self.remove(doc_id)
+
+        self._ensure_capacity(self._size + 1)
+        row = self._size
+        self._size += 1
+
+        self.doc_ids.append(doc_id)
+        self._rows[doc_id] = row
+        self._alive[row] = True
+
+        for field, value in (metadata or {}).items():
+            if value is None:
+                continue
+            column = self._columns.get(field)
+            if column is None:
+                column = self._columns[field] = _Column(self._capacity)
+            column.set(row, value)
+
+    def remove(self, doc_id: str) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if the document was indexed
+        """
+        row = self._rows.pop(doc_id, None)
+        if row is None:
+            return False
+
+        self._alive[row] = False
+        self._maybe_compact()
+        return True
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Grow the per-row arrays (by doubling) to hold size rows."""
+        if size <= self._capacity:
+            return
+
+        capacity = max(size, 2 * self._capacity, 64)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]
+        self._alive = alive
+        for column in self._columns.values():
+            column.resize(capacity)
+        self._capacity = capacity
+
+    def _maybe_compact(self) -> None:
+        """Drop dead rows once they make up a large share of the index."""
+        dead = self._size - len(self._rows)
+        if dead >= self._COMPACT_MIN_DEAD and dead > self._COMPACT_DEAD_RATIO * self._size:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrite the arrays without dead rows.
+
+        Row lists and maps are replaced rather than mutated, so existing
+        CandidateSets keep a consistent view.
+        """
+        live = np.flatnonzero(self._alive[: self._size])
+
+        self.doc_ids = [self.doc_ids[row] for row in live.tolist()]
+        self._rows = {doc_id: row for row, doc_id in enumerate(self.doc_ids)}
+        self._size = len(live)
+        self._capacity = self._size
+        self._alive = np.ones(self._size, dtype=bool)
+        for column in self._columns.values():
+            column.take(live)
+
+        logger.debug("Metadata index compacted", num_docs=self._size)
+
+    # ------------------------------------------------------------------
+    # Filter compilation
+    # ------------------------------------------------------------------
+
+    def select(self, where: Any) -> Optional[CandidateSet]:
+        """
+        Compile a where clause or Filter into the set of matching documents.
+
+        Where dicts follow ChromaDB semantics; Filter objects follow
+        ``Filter.matches``. Parts that cannot be answered from metadata
+        (content filters, unknown operators) make the result a superset
+        (``exact=False``) or, where that is not possible, None.
+
+        Args:
+            where: ChromaDB where dict or Filter
+
+        Returns:
+            CandidateSet, or None if the filter cannot be pre-selected
+        """
+        if isinstance(where, Filter):
+            compiled = self._compile_filter(where)
+        elif isinstance(where, dict):
+            mask = self._compile_where(where)
+            compiled = (mask, True) if mask is not None else None
+        else:
+            compiled = None
+
+        if compiled is None:
+            return None
+
+        mask, exact = compiled
+        mask &= self._alive[: self._size]
+        return CandidateSet(mask, self.doc_ids, self._rows, len(self._rows), exact)
+
+    def _all_rows(self) -> np.ndarray:
+        return np.ones(self._size, dtype=bool)
+
+    def _no_rows(self) -> np.ndarray:
+        return np.zeros(self._size, dtype=bool)
+
+    def _compile_where(self, where: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Compile a ChromaDB where dict (exactly, or None if unsupported)."""
+        mask = self._all_rows()
+        for field, condition in where.items():
+            if field in ("$and", "$or"):
+                parts = [self._compile_where(c) for c in condition]
+                if not parts or any(p is None for p in parts):
+                    return None
+                combined = parts[0]
+                for part in parts[1:]:
+                    combined = combined & part if field == "$and" else combined | part
+                mask &= combined
+                continue
+
+            if field.startswith("$"):
+                return None
+
+            conditions = condition if isinstance(condition, dict) else {"$eq": condition}
+            for op, value in conditions.items():
+                part = self._compile_where_condition(field, op, value)
+                if part is None:
+                    return None
+                mask &= part
+
+        return mask
+
+    def _compile_where_condition(self, field: str, op: str, value: Any) -> Optional[np.ndarray]:
+        """Compile one field operator with ChromaDB semantics."""
+        column = self._columns.get(field)
+
+        if op in ("$eq", "$in"):
+            values = [value] if op == "$eq" else value
+            if column is None:
+                return self._no_rows()
+            codes = [column.keys[k] for k in map(_value_key, values) if k in column.keys]
+            return column.rows_with_codes(codes, self._size)
+
+        if op in ("$ne", "$nin"):
+            # Documents without the field match in ChromaDB
+            values = [value] if op == "$ne" else value
+            if column is None:
+                return self._all_rows()
+            codes = [column.keys[k] for k in map(_value_key, values) if k in column.keys]
+            return ~column.rows_with_codes(codes, self._size)
+
+        if op in _RANGE_OPERATORS and _is_number(value):
+            # ChromaDB ranges only apply to numbers, never to bools
+            if column is None:
+                return self._no_rows()
+            numbers = column.numbers[: self._size]
+            with np.errstate(invalid="ignore"):
+                matches = _RANGE_OPERATORS[op](numbers, value)
+            return matches & ~column.bools[: self._size]
+
+        return None
+
+    def _compile_filter(self, filter: Filter) -> Optional[Tuple[np.ndarray, bool]]:
+        """
+        Compile a Filter into (mask, exact).
+
+        A non-exact mask is a superset of the matching documents.
+        """
+        if isinstance(filter, MetadataFilter):
+            mask = self._compile_metadata_filter(filter)
+            return (mask, True) if mask is not None else None
+
+        if isinstance(filter, CombinedFilter):
+            parts = [self._compile_filter(f) for f in filter.filters]
+
+            if filter.operator == FilterOperator.AND:
+                known = [p for p in parts if p is not None]
+                if not known:
+                    return None
+                mask = known[0][0]
+                for part, _ in known[1:]:
+                    mask = mask & part
+                return mask, len(known) == len(parts) and all(e for _, e in known)
+
+            if filter.operator == FilterOperator.OR:
+                if any(p is None for p in parts):
+                    return None
+                mask = parts[0][0]
+                for part, _ in parts[1:]:
+                    mask = mask | part
+                return mask, all(e for _, e in parts)
+
+            if filter.operator == FilterOperator.NOT:
+                part = parts[0]
+                if part is None or not part[1]:
+                    return None  # The complement of a superset is not a superset
+                return ~part[0], True
+
+        # Content filters are not indexed
+        return None
+
+    def _compile_metadata_filter(self, filter: MetadataFilter) -> Optional[np.ndarray]:
+        """Compile a MetadataFilter with the semantics of its matches()."""
+        column = self._columns.get(filter.field)
+        if column is None:
+            return self._no_rows()  # matches() is False without the field
+
+        if filter.operator in _FILTER_RANGE_OPERATORS and _is_number(filter.value):
+            # Python comparisons: bools compare as 0/1, strings never match
+            numbers = column.numbers[: self._size]
+            with np.errstate(invalid="ignore"):
+                return _RANGE_OPERATORS[_FILTER_RANGE_OPERATORS[filter.operator]](
+                    numbers, filter.value
+                )
+
+        # Evaluate the compiled filter once per distinct value, then select rows by code
+        predicate = filter.compile()
+        codes = []
+        for code, value in enumerate(column.values):
+            try:
+                if predicate({filter.field: value}, ""):
+                    codes.append(code)
+            except TypeError:
+                continue  # Incomparable types never match
+
+        return column.rows_with_codes(codes, self._size)
+
+
+__all__ = [
+    "CandidateSet",
+    "MetadataIndex",
+]
@@ -5,6 +5,8 @@ Features:
 - Performance profiling with timing decorators
 - Query response time tracking
 - Cache hit/miss metrics
+- Achieved batch sizes for micro-batched work
+- Work cancelled because the client disconnected
 - Bottleneck identification
 - Performance reporting
 """
@@ -112,6 +114,62 @@ class CacheMetrics:
         }
 
 
+@dataclass
+class BatchMetrics:
+    """Metrics for work that is coalesced into batches."""
+
+    batch_name: str
+    batches: int = 0
+    items: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        """Calculate average number of items per batch."""
+        return self.items / self.batches if self.batches > 0 else 0.0
+
+    def record(self, size: int) -> None:
+        """Record a single batch."""
+        self.batches += 1
+        self.items += size
+        self.max_batch_size = max(self.max_batch_size, size)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "batch": self.batch_name,
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.avg_batch_size, 2),
+            "max_batch_size": self.max_batch_size,
+        }
+
+
+@dataclass
+class CancellationMetrics:
+    """Metrics for requests abandoned because the client disconnected."""
+
+    operation_name: str
+    count: int = 0
+    wasted_time: float = 0.0  # Seconds spent before the work was cancelled
+    stages: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, stage: str, elapsed: float) -> None:
+        """Record a single cancellation."""
+        self.count += 1
+        self.wasted_time += elapsed
+        self.stages[stage] = self.stages.get(stage, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for reporting."""
+        return {
+            "operation": self.operation_name,
+            "cancelled": self.count,
+            "wasted_time_s": round(self.wasted_time, 3),
+            "by_stage": dict(self.stages),
+        }
+
+
 # ============================================================================
 # Performance Monitor Singleton
 # ============================================================================
@@ -137,6 +195,8 @@ class PerformanceMonitor:
                 lambda: OperationMetrics(operation_name="unknown")
             )
             self.caches: Dict[str, CacheMetrics] = {}
+            self.batches: Dict[str, BatchMetrics] = {}
+            self.cancellations: Dict[str, CancellationMetrics] = {}
             self.start_time = datetime.now()
             PerformanceMonitor._initialized = True
 
@@ -214,6 +274,39 @@ class PerformanceMonitor:
         if cache_name in self.caches:
             self.caches[cache_name].size = size
 
+    def record_batch(self, batch_name: str, size: int) -> None:
+        """
+        Record a batch of coalesced work items.
+
+        Args:
+            batch_name: Name of the batcher
+            size: Number of items in the batch
+        """
+        if batch_name not in self.batches:
+            self.batches[batch_name] = BatchMetrics(batch_name=batch_name)
+
+        self.batches[batch_name].record(size)
+
+    def record_cancellation(self, operation_name: str, stage: str, elapsed: float) -> None:
+        """
+        Record work stopped because the client disconnected.
+
+        Args:
+            operation_name: Name of the cancelled operation
+            stage: Stage that was running or about to run
+            elapsed: Seconds spent on the operation before it was cancelled
+        """
+        if operation_name not in self.cancellations:
+            self.cancellations[operation_name] = CancellationMetrics(operation_name=operation_name)
+
+        self.cancellations[operation_name].record(stage, elapsed)
+        logger.info(
+            "operation_cancelled",
+            operation=operation_name,
+            stage=stage,
+            elapsed_s=round(elapsed, 3),
+        )
+
     def get_report(self) -> Dict[str, Any]:
         """
         Get performance report.
@@ -239,10 +332,15 @@ class PerformanceMonitor:
             )
         ]
 
+        batches_report = [metrics.to_dict() for metrics in self.batches.values()]
+        cancellations_report = [metrics.to_dict() for metrics in self.cancellations.values()]
+
         return {
             "uptime_seconds": uptime.total_seconds(),
             "operations": operations_report,
             "caches": caches_report,
+            "batches": batches_report,
+            "cancellations": cancellations_report,
             "summary": {
                 "total_operations": sum(op.count for op in self.operations.values()),
                 "total_time_s": sum(op.total_time for op in self.operations.values()),
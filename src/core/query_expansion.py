@@ -257,6 +257,7 @@ Generate {max_variations} alternative queries, one per line, without numbering o
                 prompt=prompt,
                 max_tokens=150,
                 temperature=0.7,
+                use_cache=True,  # Any good set of variations can be reused
             )
 
             # Parse response into variations
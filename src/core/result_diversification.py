@@ -20,7 +20,7 @@ Date: 2025-12-27
 
 import numpy as np
 import structlog
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 logger = structlog.get_logger(__name__)
 
@@ -61,7 +61,7 @@ class ResultDiversifier:
         self,
         results: List[Dict[str, Any]],
         top_k: int,
-        embeddings: Optional[List[np.ndarray]] = None,
+        embeddings: Optional[Union[np.ndarray, List[np.ndarray]]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Diversify search results using MMR algorithm.
@@ -69,7 +69,8 @@ class ResultDiversifier:
         Args:
             results: List of search results with 'score' field
             top_k: Number of diverse results to return
-            embeddings: Optional pre-computed embeddings for each result
+            embeddings: Optional pre-computed embeddings for each result,
+                       ideally one float32 (n, dim) matrix
                        If None, will use content similarity
 
         Returns:
@@ -102,66 +103,56 @@ class ResultDiversifier:
         self,
         results: List[Dict[str, Any]],
         top_k: int,
-        embeddings: List[np.ndarray],
+        embeddings: Union[np.ndarray, List[np.ndarray]],
     ) -> List[Dict[str, Any]]:
         """
         Diversify using embedding-based similarity.
 
         This is the most accurate method as it uses semantic embeddings.
+        A float32 (n, dim) matrix is used without copying; each MMR step
+        is one matrix-vector product that updates the running maximum
+        similarity of every candidate to the selected set.
         """
         if len(embeddings) != len(results):
             raise ValueError("Number of embeddings must match number of results")
 
-        # Convert to numpy arrays
-        embeddings_array = np.array(embeddings)
+        embeddings_array = np.asarray(embeddings, dtype=np.float32)
 
         # Normalize embeddings for cosine similarity
         norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
         norms[norms == 0] = 1  # Avoid division by zero
         normalized_embeddings = embeddings_array / norms
 
-        # Track selected indices
-        selected_indices = []
-        remaining_indices = list(range(len(results)))
+        relevance = np.array(
+            [result.get('score', 0.0) for result in results], dtype=np.float32
+        )
 
         # Select first document (highest relevance)
         first_idx = 0  # Results are already sorted by relevance
-        selected_indices.append(first_idx)
-        remaining_indices.remove(first_idx)
+        selected_indices = [first_idx]
+        selected_mask = np.zeros(len(results), dtype=bool)
+        selected_mask[first_idx] = True
 
-        # Select remaining documents using MMR
-        while len(selected_indices) < top_k and remaining_indices:
-            best_idx = None
-            best_score = float('-inf')
-
-            for idx in remaining_indices:
-                # Relevance score (from original ranking)
-                relevance = results[idx].get('score', 0.0)
-
-                # Max similarity to already selected documents
-                if selected_indices:
-                    # Compute cosine similarity to all selected documents
-                    similarities = np.dot(
-                        normalized_embeddings[idx],
-                        normalized_embeddings[selected_indices].T
-                    )
-                    max_similarity = np.max(similarities)
-                else:
-                    max_similarity = 0.0
+        # Max similarity of every document to the selected set so far
+        max_similarity = normalized_embeddings @ normalized_embeddings[first_idx]
 
-                # MMR score
-                mmr_score = (
-                    self.lambda_param * relevance -
-                    (1 - self.lambda_param) * max_similarity
-                )
-
-                if mmr_score > best_score:
-                    best_score = mmr_score
-                    best_idx = idx
-
-            if best_idx is not None:
-                selected_indices.append(best_idx)
-                remaining_indices.remove(best_idx)
+        # Select remaining documents using MMR
+        while len(selected_indices) < min(top_k, len(results)):
+            mmr_scores = (
+                self.lambda_param * relevance -
+                (1 - self.lambda_param) * max_similarity
+            )
+            mmr_scores[selected_mask] = -np.inf
+
+            # argmax keeps the first (highest-ranked) document on ties
+            best_idx = int(np.argmax(mmr_scores))
+            selected_indices.append(best_idx)
+            selected_mask[best_idx] = True
+            np.maximum(
+                max_similarity,
+                normalized_embeddings @ normalized_embeddings[best_idx],
+                out=max_similarity,
+            )
 
         # Return selected results in order
         diversified = [results[idx] for idx in selected_indices]
@@ -317,7 +308,7 @@ def diversify_results(
     results: List[Dict[str, Any]],
     top_k: int,
     lambda_param: float = 0.5,
-    embeddings: Optional[List[np.ndarray]] = None,
+    embeddings: Optional[Union[np.ndarray, List[np.ndarray]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Quick helper to diversify search results.
@@ -4,11 +4,19 @@ Provides semantic search capabilities for API documentation.
 Includes performance monitoring and hybrid search (BM25 + Vector).
 """
 
+import contextvars
+import copy
 import hashlib
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import chromadb
+import numpy as np
 import structlog
 from chromadb.config import Settings as ChromaSettings
 
@@ -18,20 +26,54 @@ from src.core.advanced_filtering import (
     FacetedSearch,
     Filter,
 )
+from src.core.cache import get_query_cache, get_search_result_cache
 from src.core.cross_encoder import CrossEncoderReranker
 from src.core.embeddings import EmbeddingService, get_embedding_service
+from src.core.executors import (
+    INGEST_POOL,
+    QUERY_POOL,
+    SEARCH_LEG_POOL,
+    get_executor,
+    release_workers,
+    run_in_executor,
+    try_reserve_workers,
+)
 from src.core.hybrid_search import (
     BM25,
     HybridSearch,
+    InvertedIndexBM25,
     SearchResult,
     create_bm25_index,
     get_hybrid_search,
 )
+from src.core.metadata_index import CandidateSet, MetadataIndex
 from src.core.performance import monitor_performance
 
 logger = structlog.get_logger(__name__)
 
 
+def _chroma_version() -> Tuple[int, ...]:
+    """Get the installed ChromaDB version as a tuple of ints."""
+    parts = []
+    for part in chromadb.__version__.split(".")[:3]:
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+# ChromaDB 0.6+ accepts (and internally stores) embeddings as numpy arrays;
+# older releases only validate lists of Python floats
+_CHROMA_ACCEPTS_NUMPY = _chroma_version() >= (0, 6)
+
+# Collection.query() takes an ID allow-list from ChromaDB 1.0.8
+_CHROMA_QUERY_ACCEPTS_IDS = _chroma_version() >= (1, 0, 8)
+
+
+def _to_chroma_embeddings(embeddings: np.ndarray) -> Union[np.ndarray, List[List[float]]]:
+    """Pass an embedding matrix to ChromaDB, converting to lists only if required."""
+    return embeddings if _CHROMA_ACCEPTS_NUMPY else embeddings.tolist()
+
+
 class VectorStore:
     """
     ChromaDB-based vector store for API documentation.
@@ -44,8 +86,22 @@ class VectorStore:
     - Hybrid search (BM25 + Vector with RRF fusion)
     - Cross-encoder re-ranking for improved accuracy
     - Duplicate detection via content hashing
+    - BM25 index persisted next to the ChromaDB data and memory-mapped at startup
+    - Columnar metadata index that pre-selects candidates for filtered searches
     """
 
+    # Collection metadata key holding a token that changes on every write;
+    # a persisted BM25 index is only reused if it was saved at the same token
+    GENERATION_METADATA_KEY = "generation"
+
+    # Filters matching at most this many documents are passed to the
+    # retrieval legs as an ID allow-list; broader filters over-fetch instead
+    MAX_ALLOWED_IDS = 10_000
+    MAX_OVERFETCH_FACTOR = 10
+
+    # IDs per existence check / delete call (keeps ChromaDB queries bounded)
+    ID_LOOKUP_BATCH_SIZE = 5_000
+
     def __init__(
         self,
         collection_name: Optional[str] = None,
@@ -72,14 +128,24 @@ class VectorStore:
         self.enable_hybrid_search = enable_hybrid_search
         self.enable_reranker = enable_reranker
         self.reranker_model = reranker_model
+        # Time budget per hybrid search leg (None = wait for both legs)
+        self.hybrid_leg_timeout: Optional[float] = (
+            settings.hybrid_leg_timeout_ms / 1000 if settings.hybrid_leg_timeout_ms > 0 else None
+        )
 
         self._client: Optional[chromadb.PersistentClient] = None
         self._collection: Optional[chromadb.Collection] = None
         self._bm25: Optional[BM25] = None  # BM25 index for keyword search
         self._hybrid_search: Optional[HybridSearch] = None  # Hybrid search strategy
         self._reranker: Optional[CrossEncoderReranker] = None  # Cross-encoder re-ranker
-        self._documents_cache: List[Dict[str, Any]] = []  # Cache for BM25 indexing
+        self._reranker_lock = threading.Lock()  # Loads the re-ranker once under concurrency
         self._bm25_dirty = False  # Track if BM25 index needs rebuild (lazy rebuild optimization)
+        self._metadata_index: Optional[MetadataIndex] = None  # Built on first filtered search
+        self._index_lock = threading.RLock()  # Guards index state when the store is shared
+        # Search result cache keys include this instance's namespace and a
+        # counter bumped after every write, so writes invalidate cached results
+        self._result_cache_namespace = uuid.uuid4().hex
+        self._result_generation = 0
 
     @property
     def client(self) -> chromadb.PersistentClient:
@@ -116,6 +182,176 @@ class VectorStore:
         """Generate a hash for content deduplication."""
         return hashlib.md5(content.encode()).hexdigest()
 
+    @property
+    def bm25_index_path(self) -> Path:
+        """File the BM25 index is persisted to (inside the ChromaDB directory)."""
+        return Path(self.persist_directory) / f"bm25_{self.collection_name}.idx"
+
+    def _collection_generation(self) -> Optional[str]:
+        """Get the collection's write generation token (None if never written)."""
+        return (self.collection.metadata or {}).get(self.GENERATION_METADATA_KEY)
+
+    def _bump_generation(self) -> None:
+        """Record a write, invalidating any persisted BM25 index."""
+        try:
+            metadata = dict(self.collection.metadata or {})
+            metadata[self.GENERATION_METADATA_KEY] = uuid.uuid4().hex
+            self.collection.modify(metadata=metadata)
+        except Exception as e:
+            logger.warning("Failed to update collection generation", error=str(e))
+
+    def _invalidate_search_results(self) -> None:
+        """
+        Invalidate cached search results after a write.
+
+        Called once the write is visible in ChromaDB and the indexes, so a
+        search racing with the write can only cache under the old generation.
+        """
+        with self._index_lock:
+            self._result_generation += 1
+
+    def _result_cache_scope(
+        self,
+        n_results: int,
+        where: Optional[Union[dict[str, Any], Filter]],
+        where_document: Optional[dict[str, Any]],
+        use_hybrid: bool,
+        use_reranker: bool,
+        rerank_top_k: Optional[int],
+        min_score: float,
+    ) -> str:
+        """Build the part of a search cache key that is independent of the query text."""
+        if isinstance(where, Filter):
+            where_key = where.fingerprint()
+        else:
+            where_key = json.dumps(where, sort_keys=True, default=str)
+
+        return "|".join([
+            self._result_cache_namespace,
+            str(self._result_generation),
+            f"hybrid={use_hybrid and self.enable_hybrid_search}",
+            f"rerank={use_reranker and self.enable_reranker}",
+            f"n={n_results}",
+            f"rerank_top_k={rerank_top_k}",
+            f"min_score={min_score}",
+            f"where={where_key}",
+            f"where_document={json.dumps(where_document, sort_keys=True, default=str)}",
+        ])
+
+    def _load_bm25_index(self) -> bool:
+        """
+        Load the persisted BM25 index if it matches the collection.
+
+        The file is reused only if its generation token, document count and
+        BM25 parameters match; otherwise the caller rebuilds from ChromaDB.
+
+        Returns:
+            True if the index was loaded
+        """
+        path = self.bm25_index_path
+        if not path.exists():
+            return False
+
+        try:
+            header = InvertedIndexBM25.read_header(path)
+            expected = InvertedIndexBM25()
+            stale = (
+                header["metadata"].get("generation") != self._collection_generation()
+                or header["num_docs"] != self.collection.count()
+                or header["k1"] != expected.k1
+                or header["b"] != expected.b
+            )
+            if stale:
+                logger.info("Persisted BM25 index is stale, rebuilding", path=str(path))
+                return False
+
+            self._bm25 = InvertedIndexBM25.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Failed to load persisted BM25 index", path=str(path), error=str(e))
+            return False
+
+        self._hybrid_search = get_hybrid_search()
+        return True
+
+    def save_bm25_index(self) -> bool:
+        """
+        Persist the BM25 index so the next process start can memory-map it.
+
+        Called after full rebuilds and on application shutdown (incremental
+        writes change the collection generation, so the file is otherwise
+        stale until the next save).
+
+        Returns:
+            True if the index was written
+        """
+        if not self.enable_hybrid_search:
+            return False
+
+        with self._index_lock:
+            if not isinstance(self._bm25, InvertedIndexBM25) or self._bm25_dirty:
+                return False
+
+            try:
+                self._bm25.save(
+                    self.bm25_index_path,
+                    metadata={"generation": self._collection_generation()},
+                )
+            except OSError as e:
+                logger.warning(
+                    "Failed to persist BM25 index", path=str(self.bm25_index_path), error=str(e)
+                )
+                return False
+
+        return True
+
+    def _get_documents_by_ids(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get content and metadata for documents with one batched ChromaDB get().
+
+        Document text is not kept in memory; search results are hydrated
+        from ChromaDB once the final top-n is known.
+
+        Returns:
+            Dict mapping document ID to {"id", "content", "metadata"}
+            (IDs that no longer exist are omitted)
+        """
+        if not doc_ids:
+            return {}
+
+        result = self.collection.get(ids=doc_ids, include=["documents", "metadatas"])
+        return {
+            doc_id: {
+                "id": doc_id,
+                "content": result["documents"][i],
+                "metadata": result["metadatas"][i],
+            }
+            for i, doc_id in enumerate(result["ids"])
+        }
+
+    def _filter_ids(
+        self,
+        doc_ids: List[str],
+        where: Optional[dict[str, Any]] = None,
+        where_document: Optional[dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Keep the IDs whose documents match the filters, preserving order.
+
+        The filters are evaluated by ChromaDB in one batched get() that
+        returns IDs only, so no content or metadata is transferred.
+        """
+        if not doc_ids or not (where or where_document):
+            return doc_ids
+
+        result = self.collection.get(
+            ids=doc_ids,
+            where=where,
+            where_document=where_document,
+            include=[],
+        )
+        matching = set(result["ids"])
+        return [doc_id for doc_id in doc_ids if doc_id in matching]
+
     def _rebuild_bm25_index(self):
         """Rebuild BM25 index from all documents in the collection."""
         if not self.enable_hybrid_search:
@@ -126,26 +362,65 @@ class VectorStore:
         # Get all documents from ChromaDB
         all_docs = self.collection.get(include=["documents", "metadatas"])
 
+        # The metadata index comes for free with the full scan
+        self._metadata_index = MetadataIndex.build(all_docs["ids"], all_docs["metadatas"])
+
         if not all_docs["ids"]:
             logger.warning("No documents found, BM25 index empty")
             self._bm25 = None
-            self._documents_cache = []
             return
 
-        # Build documents cache
-        self._documents_cache = []
-        for i, doc_id in enumerate(all_docs["ids"]):
-            self._documents_cache.append({
-                "id": doc_id,
-                "content": all_docs["documents"][i],
-                "metadata": all_docs["metadatas"][i],
-            })
-
-        # Create and fit BM25 index
-        self._bm25 = create_bm25_index(self._documents_cache)
+        # Create and fit BM25 index (document text is not retained)
+        self._bm25 = create_bm25_index([
+            {"id": doc_id, "content": content}
+            for doc_id, content in zip(all_docs["ids"], all_docs["documents"])
+        ])
         self._hybrid_search = get_hybrid_search()
 
-        logger.info("BM25 index rebuilt", document_count=len(self._documents_cache))
+        logger.info("BM25 index rebuilt", document_count=len(all_docs["ids"]))
+
+        # Persist so the next process start can skip the rebuild
+        self._bm25_dirty = False
+        self.save_bm25_index()
+
+    def _ensure_metadata_index(self) -> MetadataIndex:
+        """Get the metadata index, building it from ChromaDB on first use."""
+        index = self._metadata_index
+        if index is not None:
+            return index
+
+        with self._index_lock:
+            if self._metadata_index is None:
+                all_docs = self.collection.get(include=["metadatas"])
+                self._metadata_index = MetadataIndex.build(all_docs["ids"], all_docs["metadatas"])
+            return self._metadata_index
+
+    def _select_candidates(
+        self,
+        where: Optional[Union[dict[str, Any], Filter]],
+    ) -> Optional[CandidateSet]:
+        """
+        Pre-select the documents allowed by a metadata filter.
+
+        Returns:
+            CandidateSet, or None if there is no filter or it cannot be
+            answered from the metadata index
+        """
+        if not where:
+            return None
+
+        index = self._ensure_metadata_index()
+        with self._index_lock:
+            candidates = index.select(where)
+
+        if candidates is not None:
+            logger.debug(
+                "Metadata pre-filter applied",
+                candidates=candidates.count,
+                total=candidates.total,
+                exact=candidates.exact,
+            )
+        return candidates
 
     def _ensure_bm25_index(self):
         """
@@ -157,17 +432,85 @@ class VectorStore:
         if not self.enable_hybrid_search:
             return
 
-        # Rebuild only if needed
-        if self._bm25 is None or self._bm25_dirty:
-            logger.info(
-                "BM25 index needs rebuild",
-                reason="not_built" if self._bm25 is None else "dirty_flag_set"
-            )
-            self._rebuild_bm25_index()
-            self._bm25_dirty = False  # Clear dirty flag
-            logger.debug("BM25 index is now up-to-date")
-        else:
+        # Fast path: no lock needed when the index is already current
+        if self._bm25 is not None and not self._bm25_dirty:
             logger.debug("BM25 index is up-to-date, skipping rebuild")
+            return
+
+        with self._index_lock:
+            # Re-check under the lock: another request may have rebuilt it
+            if self._bm25 is None and not self._bm25_dirty and self._load_bm25_index():
+                logger.debug("BM25 index loaded from disk")
+            elif self._bm25 is None or self._bm25_dirty:
+                logger.info(
+                    "BM25 index needs rebuild",
+                    reason="not_built" if self._bm25 is None else "dirty_flag_set"
+                )
+                self._rebuild_bm25_index()
+                self._bm25_dirty = False  # Clear dirty flag
+                logger.debug("BM25 index is now up-to-date")
+
+    def _index_documents(
+        self,
+        doc_ids: List[str],
+        contents: List[str],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Apply newly stored documents to the BM25 and metadata indexes incrementally.
+
+        Costs O(size of the new documents). If an index has not been built
+        yet (or is already stale), it is built from scratch on first use, so
+        nothing needs to be done for it here.
+        """
+        self._bump_generation()
+        with self._index_lock:
+            if self._metadata_index is not None:
+                for doc_id, metadata in zip(doc_ids, metadatas):
+                    self._metadata_index.add(doc_id, metadata)
+
+        if not self.enable_hybrid_search:
+            return
+
+        with self._index_lock:
+            if self._bm25 is None or self._bm25_dirty:
+                return
+
+            if not isinstance(self._bm25, InvertedIndexBM25):
+                # Index type without incremental updates: rebuild lazily
+                self._bm25_dirty = True
+                logger.debug("BM25 index marked as dirty, will rebuild on next search")
+                return
+
+            for doc_id, content in zip(doc_ids, contents):
+                self._bm25.add(doc_id, content)
+
+        logger.debug("BM25 index updated incrementally", added=len(doc_ids))
+
+    def _unindex_documents(self, doc_ids: List[str]) -> None:
+        """Remove deleted documents from the BM25 and metadata indexes incrementally."""
+        self._bump_generation()
+        with self._index_lock:
+            if self._metadata_index is not None:
+                for doc_id in doc_ids:
+                    self._metadata_index.remove(doc_id)
+
+        if not self.enable_hybrid_search:
+            return
+
+        with self._index_lock:
+            if self._bm25 is None or self._bm25_dirty:
+                return
+
+            if not isinstance(self._bm25, InvertedIndexBM25):
+                self._bm25_dirty = True
+                logger.debug("BM25 index marked as dirty, will rebuild on next search")
+                return
+
+            for doc_id in doc_ids:
+                self._bm25.remove(doc_id)
+
+        logger.debug("BM25 index updated incrementally", removed=len(doc_ids))
 
     def add_document(
         self,
@@ -200,20 +543,19 @@ class VectorStore:
             return doc_id
 
         # Generate embedding
-        embedding = self.embedding_service.embed_text(content)
+        embeddings = self.embedding_service.embed_texts_np([content])
 
         # Add to collection
         self.collection.add(
             ids=[doc_id],
-            embeddings=[embedding],
+            embeddings=_to_chroma_embeddings(embeddings),
             documents=[content],
             metadatas=[metadata],
         )
 
-        # Mark BM25 index as dirty (will rebuild lazily on next search)
-        if self.enable_hybrid_search:
-            self._bm25_dirty = True
-            logger.debug("BM25 index marked as dirty, will rebuild on next search")
+        # Keep the BM25 index current without a full rebuild
+        self._index_documents([doc_id], [content], [metadata])
+        self._invalidate_search_results()
 
         logger.debug("Added document", doc_id=doc_id, metadata=metadata)
         return doc_id
@@ -231,11 +573,24 @@ class VectorStore:
             documents: List of dicts with 'content' and 'metadata' keys.
             batch_size: Number of documents to process at once.
 
+        Existing IDs are resolved before embedding, so re-adding unchanged
+        documents costs only the ID lookups.
+
         Returns:
-            Dictionary with document_ids (all IDs), new_count, and skipped_count.
+            Dictionary with document_ids (all IDs), new_count, skipped_count,
+            and timings_ms (milliseconds per ingestion stage).
         """
+        timings: Dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        def finish_stage(name: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            timings[name] = round((now - stage_start) * 1000, 2)
+            stage_start = now
+
         if not documents:
-            return {"document_ids": [], "new_count": 0, "skipped_count": 0}
+            return {"document_ids": [], "new_count": 0, "skipped_count": 0, "timings_ms": timings}
 
         logger.info("Adding documents to vector store", count=len(documents))
 
@@ -267,15 +622,12 @@ class VectorStore:
                 duplicates=batch_duplicates,
                 unique_documents=len(doc_ids)
             )
+        finish_stage("prepare")
 
-        # Generate embeddings in batch
-        embeddings = self.embedding_service.embed_texts(contents, batch_size=batch_size)
-
-        # Filter out existing documents
-        existing = self.collection.get(ids=doc_ids)
-        existing_ids = set(existing["ids"])
-
+        # Filter out existing documents before doing any embedding work
+        existing_ids = self._existing_ids(doc_ids)
         new_indices = [i for i, doc_id in enumerate(doc_ids) if doc_id not in existing_ids]
+        finish_stage("lookup")
 
         if not new_indices:
             logger.info("All documents already exist, skipping")
@@ -283,23 +635,32 @@ class VectorStore:
                 "document_ids": doc_ids,
                 "new_count": 0,
                 "skipped_count": len(doc_ids) + batch_duplicates,
+                "timings_ms": timings,
             }
 
-        # Add only new documents
         new_ids = [doc_ids[i] for i in new_indices]
-        new_embeddings = [embeddings[i] for i in new_indices]
         new_contents = [contents[i] for i in new_indices]
         new_metadatas = [metadatas[i] for i in new_indices]
 
-        # Add in batches
+        # Generate embeddings for new documents only, as one float32 matrix
+        new_embeddings = self.embedding_service.embed_texts_np(new_contents, batch_size=batch_size)
+        finish_stage("embed")
+
+        # Add in batches (row slices are views, not copies)
         for i in range(0, len(new_ids), batch_size):
             batch_end = min(i + batch_size, len(new_ids))
             self.collection.add(
                 ids=new_ids[i:batch_end],
-                embeddings=new_embeddings[i:batch_end],
+                embeddings=_to_chroma_embeddings(new_embeddings[i:batch_end]),
                 documents=new_contents[i:batch_end],
                 metadatas=new_metadatas[i:batch_end],
             )
+        finish_stage("write")
+
+        # Keep the BM25 index current without a full rebuild
+        self._index_documents(new_ids, new_contents, new_metadatas)
+        self._invalidate_search_results()
+        finish_stage("index")
 
         # Calculate total skipped: existing docs + batch duplicates
         total_skipped = (len(doc_ids) - len(new_ids)) + batch_duplicates
@@ -310,19 +671,24 @@ class VectorStore:
             skipped_existing=len(doc_ids) - len(new_ids),
             skipped_batch_duplicates=batch_duplicates,
             total_skipped=total_skipped,
+            timings_ms=timings,
         )
 
-        # Mark BM25 index as dirty (will rebuild lazily on next search)
-        if self.enable_hybrid_search:
-            self._bm25_dirty = True
-            logger.debug("BM25 index marked as dirty after batch add, will rebuild on next search")
-
         return {
             "document_ids": doc_ids,
             "new_count": len(new_ids),
             "skipped_count": total_skipped,
+            "timings_ms": timings,
         }
 
+    def _existing_ids(self, doc_ids: List[str]) -> set:
+        """Get the subset of IDs already stored, looked up in bounded batches."""
+        existing = set()
+        for i in range(0, len(doc_ids), self.ID_LOOKUP_BATCH_SIZE):
+            batch = doc_ids[i:i + self.ID_LOOKUP_BATCH_SIZE]
+            existing.update(self.collection.get(ids=batch, include=[])["ids"])
+        return existing
+
     @monitor_performance("vector_store_search")
     def search(
         self,
@@ -334,10 +700,18 @@ class VectorStore:
         use_reranker: bool = False,
         rerank_top_k: Optional[int] = None,
         min_score: float = 0.0,
+        use_cache: bool = True,
     ) -> list[dict[str, Any]]:
         """
         Search for similar documents with performance monitoring.
 
+        Results are cached per (query, mode, filters, n_results, reranker flag)
+        until the next write to the collection. A hit on the normalized query
+        text skips embedding, retrieval and re-ranking entirely. Opting in to
+        settings.search_cache_semantic also serves near-identical queries (by
+        embedding) the cached results, which are approximate: BM25 ranked them
+        on the cached query's terms.
+
         Supports multiple search modes:
         1. Vector-only search (use_hybrid=False)
         2. Hybrid search (use_hybrid=True) - BM25 + Vector with RRF
@@ -358,10 +732,57 @@ class VectorStore:
             use_reranker: Use cross-encoder re-ranking (default: False).
             rerank_top_k: Number of candidates to retrieve before re-ranking (default: n_results * 3).
             min_score: Minimum relevance score threshold (0.0-1.0). Results below this are filtered out (default: 0.0 - disabled).
+            use_cache: Consult and fill the search result cache (default: True).
 
         Returns:
             List of search results with content, metadata, and similarity score (filtered by min_score).
         """
+        search_args = (
+            n_results, where, where_document, use_hybrid, use_reranker, rerank_top_k, min_score
+        )
+        if not (use_cache and settings.search_cache_enabled):
+            return self._search_uncached(query, *search_args)
+
+        scope = self._result_cache_scope(*search_args)
+        normalized_query = " ".join(query.split())
+        key = hashlib.sha256(f"{scope}\n{normalized_query}".encode()).hexdigest()
+
+        result_cache = get_search_result_cache()
+        cached = result_cache.get(key)
+        if cached is not None:
+            logger.debug("Search result cache hit", query=query[:50])
+            return copy.deepcopy(cached)
+
+        query_embedding = None
+        if settings.search_cache_semantic:
+            # Embedding is cached, so the search below does not pay for it again
+            query_embedding = self.embedding_service.embed_query_np(query)
+            cached = get_query_cache().get(query, query_embedding, scope=scope)
+            if cached is not None:
+                result_cache.put(key, cached)
+                return copy.deepcopy(cached)
+
+        results = self._search_uncached(query, *search_args)
+
+        snapshot = copy.deepcopy(results)
+        result_cache.put(key, snapshot)
+        if query_embedding is not None:
+            get_query_cache().put(query, query_embedding, snapshot, scope=scope)
+
+        return results
+
+    def _search_uncached(
+        self,
+        query: str,
+        n_results: int,
+        where: Optional[Union[dict[str, Any], Filter]],
+        where_document: Optional[dict[str, Any]],
+        use_hybrid: bool,
+        use_reranker: bool,
+        rerank_top_k: Optional[int],
+        min_score: float,
+    ) -> list[dict[str, Any]]:
+        """Run a search without the result cache (see search())."""
         # Ensure BM25 index is up-to-date (lazy rebuild if dirty)
         self._ensure_bm25_index()
 
@@ -371,6 +792,17 @@ class VectorStore:
         # Convert Filter object to dict if needed
         where_dict, where_doc_dict = self._process_filters(where, where_document)
 
+        # Pre-select the documents the metadata filter allows
+        candidates = self._select_candidates(where)
+        if candidates is not None and candidates.count == 0:
+            logger.debug("No documents match the metadata filter")
+            return []
+
+        # Plain where dicts are enforced by ChromaDB itself; Filter objects
+        # may only be partly convertible, so the vector leg is restricted to
+        # the candidates too (otherwise client-side filtering starves results)
+        vector_candidates = candidates if original_filter else None
+
         # Determine if we should use re-ranking
         use_reranker_mode = use_reranker and self.enable_reranker
 
@@ -383,19 +815,24 @@ class VectorStore:
             use_hybrid_mode = use_hybrid and self.enable_hybrid_search and self._bm25 is not None
 
             if use_hybrid_mode:
-                candidates = self._hybrid_search_impl(query, rerank_top_k, where_dict, where_doc_dict)
+                retrieved = self._hybrid_search_impl(
+                    query, rerank_top_k, where_dict, where_doc_dict,
+                    candidates=candidates, vector_candidates=vector_candidates,
+                )
             else:
-                candidates = self._vector_search_impl(query, rerank_top_k, where_dict, where_doc_dict)
+                retrieved = self._vector_search_impl(
+                    query, rerank_top_k, where_dict, where_doc_dict, candidates=vector_candidates
+                )
 
             # Apply client-side filtering if we have an original filter
             # This catches filters that couldn't be converted to ChromaDB format
             # (e.g., CONTAINS, REGEX, etc.) even if some parts were converted
             if original_filter:
                 from src.core.advanced_filtering import FacetedSearch
-                candidates = FacetedSearch.apply_client_side_filter(candidates, original_filter)
+                retrieved = FacetedSearch.apply_client_side_filter(retrieved, original_filter)
 
             # Re-rank with cross-encoder
-            results = self._rerank_results(query, candidates, n_results)
+            results = self._rerank_results(query, retrieved, n_results)
 
             # Filter by minimum score threshold
             filtered_results = [r for r in results if r.get("score", 0) >= min_score]
@@ -411,9 +848,14 @@ class VectorStore:
             use_hybrid_mode = use_hybrid and self.enable_hybrid_search and self._bm25 is not None
 
             if use_hybrid_mode:
-                results = self._hybrid_search_impl(query, n_results, where_dict, where_doc_dict)
+                results = self._hybrid_search_impl(
+                    query, n_results, where_dict, where_doc_dict,
+                    candidates=candidates, vector_candidates=vector_candidates,
+                )
             else:
-                results = self._vector_search_impl(query, n_results, where_dict, where_doc_dict)
+                results = self._vector_search_impl(
+                    query, n_results, where_dict, where_doc_dict, candidates=vector_candidates
+                )
 
             # Apply client-side filtering if we have an original filter
             # This catches filters that couldn't be converted to ChromaDB format
@@ -432,44 +874,225 @@ class VectorStore:
             )
             return filtered_results
 
+    @monitor_performance("vector_store_search_many")
+    def search_many(
+        self,
+        queries: List[str],
+        n_results: int = 5,
+        where: Optional[Union[dict[str, Any], Filter]] = None,
+        where_document: Optional[dict[str, Any]] = None,
+        use_hybrid: bool = True,
+        min_score: float = 0.0,
+        fuse: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Search for several queries (e.g. query expansions) at once.
+
+        Equivalent to calling search() per query, but all queries are
+        embedded in one batch, sent to ChromaDB in one query() call and
+        scored by BM25 in one pass. Re-ranking is not supported here.
+
+        Args:
+            queries: The search queries.
+            n_results: Maximum number of results per query.
+            where: Metadata filter conditions (dict or Filter object).
+            where_document: Document content filter conditions.
+            use_hybrid: Use hybrid search if available (default: True).
+            min_score: Minimum relevance score threshold for per-query results.
+            fuse: Also return the per-query results merged with RRF.
+
+        Returns:
+            Dict with "results" (one result list per query, in query order)
+            and, if fuse=True, "fused" (top n_results across all queries,
+            scored by RRF over the per-query ranks).
+        """
+        per_query: List[list[dict[str, Any]]] = [[] for _ in queries]
+
+        if queries:
+            self._ensure_bm25_index()
+
+            original_filter = where if isinstance(where, Filter) else None
+            where_dict, where_doc_dict = self._process_filters(where, where_document)
+
+            candidates = self._select_candidates(where)
+            if candidates is None or candidates.count > 0:
+                vector_candidates = candidates if original_filter else None
+                use_hybrid_mode = use_hybrid and self.enable_hybrid_search and self._bm25 is not None
+
+                if use_hybrid_mode:
+                    per_query = self._hybrid_search_many(
+                        queries, n_results, where_dict, where_doc_dict,
+                        candidates=candidates, vector_candidates=vector_candidates,
+                    )
+                else:
+                    per_query = self._vector_search_many(
+                        queries, n_results, where_dict, where_doc_dict,
+                        candidates=vector_candidates,
+                    )
+
+                if original_filter:
+                    per_query = [
+                        FacetedSearch.apply_client_side_filter(results, original_filter)
+                        for results in per_query
+                    ]
+
+                per_query = [
+                    [r for r in results if r.get("score", 0) >= min_score]
+                    for results in per_query
+                ]
+
+        response: Dict[str, Any] = {"results": per_query}
+        if fuse:
+            if not self._hybrid_search:
+                self._hybrid_search = get_hybrid_search()
+
+            by_id = {}
+            for results in per_query:
+                for result in results:
+                    by_id.setdefault(result["id"], result)
+
+            fused = self._hybrid_search.fuse_rankings(
+                [[r["id"] for r in results] for results in per_query]
+            )[:n_results]
+            response["fused"] = [
+                {**by_id[doc_id], "score": rrf_score, "method": "multi_query"}
+                for doc_id, rrf_score in fused
+            ]
+
+        logger.debug(
+            "Multi-query search completed",
+            queries=len(queries),
+            result_counts=[len(r) for r in per_query],
+        )
+        return response
+
     def _vector_search_impl(
         self,
         query: str,
         n_results: int,
         where: Optional[dict[str, Any]] = None,
         where_document: Optional[dict[str, Any]] = None,
+        candidates: Optional[CandidateSet] = None,
     ) -> list[dict[str, Any]]:
-        """Pure vector similarity search."""
-        logger.debug("Vector search", query=query[:50], n_results=n_results)
+        """Pure vector similarity search (see _vector_search_many())."""
+        return self._vector_search_many(
+            [query], n_results, where, where_document, candidates=candidates
+        )[0]
 
-        # Generate query embedding (cached)
-        query_embedding = self.embedding_service.embed_query(query)
+    def _vector_search_many(
+        self,
+        queries: List[str],
+        n_results: int,
+        where: Optional[dict[str, Any]] = None,
+        where_document: Optional[dict[str, Any]] = None,
+        candidates: Optional[CandidateSet] = None,
+    ) -> List[list[dict[str, Any]]]:
+        """
+        Pure vector similarity search for one or more queries.
+
+        All queries are embedded in one batch and sent to ChromaDB in one
+        query() call.
+
+        If candidates are given, results are restricted to them: small sets
+        are passed to ChromaDB as an ID allow-list (where supported), large
+        ones are handled by over-fetching and dropping non-candidates.
+        """
+        logger.debug("Vector search", queries=len(queries), n_results=n_results)
+
+        # Generate query embeddings (cached)
+        if len(queries) == 1:
+            query_embeddings = self.embedding_service.embed_query_np(queries[0])[np.newaxis, :]
+        else:
+            query_embeddings = self.embedding_service.embed_queries_np(queries)
+
+        query_kwargs: Dict[str, Any] = {}
+        requested = n_results
+        post_filter = False
+        if candidates is not None:
+            allowed_ids = (
+                candidates.ids(limit=self.MAX_ALLOWED_IDS) if _CHROMA_QUERY_ACCEPTS_IDS else None
+            )
+            if allowed_ids is not None:
+                query_kwargs["ids"] = allowed_ids
+            else:
+                requested = n_results * candidates.overfetch_factor(self.MAX_OVERFETCH_FACTOR)
+                post_filter = True
 
         # Search ChromaDB
         results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
+            query_embeddings=_to_chroma_embeddings(query_embeddings),
+            n_results=requested,
             where=where,
             where_document=where_document,
             include=["documents", "metadatas", "distances"],
+            **query_kwargs,
         )
 
         # Format results
-        formatted_results = []
-        if results["ids"] and results["ids"][0]:
-            for i, doc_id in enumerate(results["ids"][0]):
+        all_results = []
+        for q in range(len(queries)):
+            formatted_results = []
+            ids = results["ids"][q] if results["ids"] else []
+            for i, doc_id in enumerate(ids):
+                if post_filter and doc_id not in candidates:
+                    continue
+                distance = results["distances"][q][i]
                 formatted_results.append({
                     "id": doc_id,
-                    "content": results["documents"][0][i],
-                    "metadata": results["metadatas"][0][i],
-                    "distance": results["distances"][0][i],
+                    "content": results["documents"][q][i],
+                    "metadata": results["metadatas"][q][i],
+                    "distance": distance,
                     # Convert distance to similarity score (1 - normalized distance)
-                    "score": 1 - (results["distances"][0][i] / 2),
+                    "score": 1 - (distance / 2),
                     "method": "vector",
                 })
+                if len(formatted_results) == n_results:
+                    break
+            all_results.append(formatted_results)
 
-        logger.debug("Vector search completed", result_count=len(formatted_results))
-        return formatted_results
+        logger.debug(
+            "Vector search completed",
+            result_counts=[len(r) for r in all_results],
+        )
+        return all_results
+
+    def _bm25_search_many(
+        self,
+        queries: List[str],
+        top_k: int,
+        where: Optional[dict[str, Any]] = None,
+        where_document: Optional[dict[str, Any]] = None,
+        candidates: Optional[CandidateSet] = None,
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        BM25 keyword search (IDs and scores only) for one or more queries.
+
+        If metadata candidates are given, BM25 only scores those documents
+        and the where clause is not re-checked. Remaining filters are applied
+        to the hits of all queries in one batched ID-only lookup.
+        """
+        if not self._bm25:
+            return [[] for _ in queries]
+
+        allowed_ids = None
+        fetch_k = top_k
+        if candidates is not None:
+            allowed_ids = candidates.ids(limit=self.MAX_ALLOWED_IDS)
+            if allowed_ids is None:
+                # Broad filter: over-fetch and drop non-candidates
+                fetch_k = top_k * candidates.overfetch_factor(self.MAX_OVERFETCH_FACTOR)
+
+        with self._index_lock:
+            # Selective filters score only the allowed documents
+            raw_lists = self._bm25.search_many(queries, top_k=fetch_k, allowed_ids=allowed_ids)
+
+        if candidates is not None:
+            raw_lists = [[(d, s) for d, s in raw if d in candidates][:top_k] for raw in raw_lists]
+            where = None  # Enforced by the candidates (or client-side for Filters)
+
+        hit_ids = list(dict.fromkeys(doc_id for raw in raw_lists for doc_id, _ in raw))
+        allowed = set(self._filter_ids(hit_ids, where=where, where_document=where_document))
+        return [[(d, s) for d, s in raw if d in allowed] for raw in raw_lists]
 
     def _hybrid_search_impl(
         self,
@@ -477,111 +1100,268 @@ class VectorStore:
         n_results: int,
         where: Optional[dict[str, Any]] = None,
         where_document: Optional[dict[str, Any]] = None,
+        candidates: Optional[CandidateSet] = None,
+        vector_candidates: Optional[CandidateSet] = None,
     ) -> list[dict[str, Any]]:
+        """Hybrid BM25 + vector search (see _hybrid_search_many())."""
+        return self._hybrid_search_many(
+            [query], n_results, where, where_document,
+            candidates=candidates, vector_candidates=vector_candidates,
+        )[0]
+
+    def _run_hybrid_legs(
+        self,
+        vector_leg: Callable[[], Any],
+        bm25_leg: Callable[[], Any],
+    ) -> Tuple[Optional[Any], Optional[Any]]:
         """
-        Hybrid search combining BM25 keyword search and vector similarity search.
+        Run the vector and BM25 legs of a hybrid search concurrently.
+
+        Both legs share a time budget of hybrid_leg_timeout seconds. A leg
+        that fails or exceeds it is dropped (degraded mode) and returned as
+        None, so the caller fuses the other leg alone. If no leg succeeds in
+        time, the first one to succeed is used; if both fail, the vector
+        leg's error is raised.
 
-        Uses Reciprocal Rank Fusion (RRF) to merge results.
+        The budget bounds the response time, not the work: a ChromaDB query
+        or BM25 pass cannot be interrupted, so a dropped leg keeps its pool
+        worker until it finishes. Legs therefore reserve their workers up
+        front; while abandoned legs hold too many of them, both legs run
+        one after the other on the calling thread (without a budget) instead
+        of queueing behind the stuck ones.
+
+        Returns:
+            Tuple of (vector leg result, BM25 leg result)
         """
-        logger.debug("Hybrid search", query=query[:50], n_results=n_results)
+        legs = {"vector": vector_leg, "bm25": bm25_leg}
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+
+        if try_reserve_workers(SEARCH_LEG_POOL, len(legs)):
+            self._run_legs_concurrently(legs, results, errors)
+        else:
+            logger.warning("Search leg pool is busy, running hybrid legs inline")
+            for name, leg in legs.items():
+                try:
+                    results[name] = leg()
+                except Exception as e:
+                    errors[name] = e
+                    logger.warning(
+                        "Hybrid search leg failed, returning degraded results",
+                        leg=name,
+                        error=str(e),
+                    )
+
+        if not results:
+            raise errors.get("vector") or errors["bm25"]
+
+        return results.get("vector"), results.get("bm25")
+
+    def _run_legs_concurrently(
+        self,
+        legs: Dict[str, Callable[[], Any]],
+        results: Dict[str, Any],
+        errors: Dict[str, BaseException],
+    ) -> None:
+        """Run legs on reserved search leg workers within the time budget (see _run_hybrid_legs())."""
+
+        def reserved(leg: Callable[[], Any]) -> Callable[[], Any]:
+            def run() -> Any:
+                try:
+                    return leg()
+                finally:
+                    release_workers(SEARCH_LEG_POOL)
+            return run
+
+        executor = get_executor(SEARCH_LEG_POOL)
+        futures = {
+            # Each leg needs its own context copy (a Context cannot be entered twice)
+            name: executor.submit(contextvars.copy_context().run, reserved(leg))
+            for name, leg in legs.items()
+        }
 
-        # 1. Get vector search results
-        vector_results = self._vector_search_impl(
-            query, n_results=n_results * 2, where=where, where_document=where_document
+        done, pending = wait(futures.values(), timeout=self.hybrid_leg_timeout)
+        while pending and all(future.exception() is not None for future in done):
+            # No result within budget: take whichever leg succeeds first
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            done |= finished
+
+        for name, future in futures.items():
+            if future in pending:
+                if future.cancel():
+                    # Never started, so its reservation is not released by run()
+                    release_workers(SEARCH_LEG_POOL)
+                logger.warning(
+                    "Hybrid search leg exceeded its time budget, returning degraded results",
+                    leg=name,
+                    timeout_s=self.hybrid_leg_timeout,
+                )
+            elif future.exception() is not None:
+                errors[name] = future.exception()
+                logger.warning(
+                    "Hybrid search leg failed, returning degraded results",
+                    leg=name,
+                    error=str(errors[name]),
+                )
+            else:
+                results[name] = future.result()
+
+    def _hybrid_search_many(
+        self,
+        queries: List[str],
+        n_results: int,
+        where: Optional[dict[str, Any]] = None,
+        where_document: Optional[dict[str, Any]] = None,
+        candidates: Optional[CandidateSet] = None,
+        vector_candidates: Optional[CandidateSet] = None,
+    ) -> List[list[dict[str, Any]]]:
+        """
+        Hybrid search combining BM25 keyword search and vector similarity search.
+
+        Uses Reciprocal Rank Fusion (RRF) to merge results per query. Both
+        legs run once for all queries, concurrently (see _run_hybrid_legs()),
+        and BM25-only hits of every query are hydrated in one batch.
+        """
+        logger.debug("Hybrid search", queries=len(queries), n_results=n_results)
+
+        # 1. Run the vector and BM25 (IDs and scores only) legs in parallel
+        vector_lists, bm25_lists = self._run_hybrid_legs(
+            lambda: self._vector_search_many(
+                queries,
+                n_results=n_results * 2,
+                where=where,
+                where_document=where_document,
+                candidates=vector_candidates,
+            ),
+            lambda: self._bm25_search_many(
+                queries, n_results * 2, where=where, where_document=where_document,
+                candidates=candidates,
+            ),
         )
+        if vector_lists is None:
+            vector_lists = [[] for _ in queries]
+        if bm25_lists is None:
+            bm25_lists = [[] for _ in queries]
 
         # Convert to SearchResult objects
-        vector_search_results = [
-            SearchResult(
-                doc_id=r["id"],
-                content=r["content"],
-                metadata=r["metadata"],
-                score=r["score"],
-                method="vector",
-            )
-            for r in vector_results
+        vector_search_lists = [
+            [
+                SearchResult(
+                    doc_id=r["id"],
+                    content=r["content"],
+                    metadata=r["metadata"],
+                    score=r["score"],
+                    method="vector",
+                )
+                for r in vector_results
+            ]
+            for vector_results in vector_lists
         ]
 
-        # 2. Get BM25 search results
-        bm25_results = []
-        if self._bm25:
-            bm25_raw = self._bm25.search(query, top_k=n_results * 2)
-
-            # Apply client-side filtering to BM25 results if filters are specified
-            if where or where_document:
-                from src.core.advanced_filtering import FacetedSearch, FilterBuilder
-
-                filtered_bm25 = []
-                for doc_id, score in bm25_raw:
-                    # Get document metadata and content
-                    doc = next((d for d in self._documents_cache if d["id"] == doc_id), None)
-                    if doc:
-                        # Apply metadata filter
-                        if where:
-                            # Convert ChromaDB where clause to filter matches
-                            if not self._matches_where_clause(doc["metadata"], where):
-                                continue
-
-                        # Apply document filter
-                        if where_document:
-                            if not self._matches_where_document_clause(doc["content"], where_document):
-                                continue
-
-                        filtered_bm25.append((doc_id, score))
-
-                bm25_results = filtered_bm25
-            else:
-                bm25_results = [(doc_id, score) for doc_id, score in bm25_raw]
-
-        # 3. Merge using Reciprocal Rank Fusion
+        # 2. Merge using Reciprocal Rank Fusion
         if not self._hybrid_search:
             self._hybrid_search = get_hybrid_search()
 
-        merged = self._hybrid_search.reciprocal_rank_fusion(
-            bm25_results=bm25_results,
-            vector_results=vector_search_results,
-            k=60,
-        )
+        merged_lists = [
+            self._hybrid_search.reciprocal_rank_fusion(
+                bm25_results=bm25_results,
+                vector_results=vector_search_results,
+                k=60,
+            )[:n_results]
+            for bm25_results, vector_search_results in zip(bm25_lists, vector_search_lists)
+        ]
 
-        # 4. Format final results
-        formatted_results = []
-        doc_map = {r.doc_id: r for r in vector_search_results}
-
-        # Add BM25-only results to map
-        for doc_id, _ in bm25_results:
-            if doc_id not in doc_map:
-                # Get document from cache
-                for cached_doc in self._documents_cache:
-                    if cached_doc["id"] == doc_id:
-                        doc_map[doc_id] = SearchResult(
-                            doc_id=doc_id,
-                            content=cached_doc["content"],
-                            metadata=cached_doc["metadata"],
-                            score=0.0,  # Will use RRF score
-                            method="bm25",
-                        )
-                        break
-
-        for doc_id, rrf_score in merged[:n_results]:
-            if doc_id in doc_map:
-                result = doc_map[doc_id]
-                formatted_results.append({
-                    "id": result.doc_id,
-                    "content": result.content,
-                    "metadata": result.metadata,
-                    "score": rrf_score,  # Use RRF score
-                    "method": "hybrid",
-                    "original_method": result.method,
-                })
+        # 3. Hydrate the final top-n: vector hits carry their content already,
+        # BM25-only hits are fetched in one batch
+        doc_map = {r.doc_id: r for results in vector_search_lists for r in results}
+        bm25_only = list(dict.fromkeys(
+            doc_id for merged in merged_lists for doc_id, _ in merged if doc_id not in doc_map
+        ))
+        for doc_id, doc in self._get_documents_by_ids(bm25_only).items():
+            doc_map[doc_id] = SearchResult(
+                doc_id=doc_id,
+                content=doc["content"],
+                metadata=doc["metadata"],
+                score=0.0,  # Will use RRF score
+                method="bm25",
+            )
+
+        all_results = []
+        for merged in merged_lists:
+            formatted_results = []
+            for doc_id, rrf_score in merged:
+                if doc_id in doc_map:
+                    result = doc_map[doc_id]
+                    formatted_results.append({
+                        "id": result.doc_id,
+                        "content": result.content,
+                        "metadata": result.metadata,
+                        "score": rrf_score,  # Use RRF score
+                        "method": "hybrid",
+                        "original_method": result.method,
+                    })
+            all_results.append(formatted_results)
 
         logger.debug(
             "Hybrid search completed",
-            result_count=len(formatted_results),
-            bm25_count=len(bm25_results),
-            vector_count=len(vector_search_results),
+            result_counts=[len(r) for r in all_results],
+            bm25_counts=[len(r) for r in bm25_lists],
+            vector_counts=[len(r) for r in vector_search_lists],
         )
 
-        return formatted_results
+        return all_results
+
+    def _ensure_reranker(self) -> CrossEncoderReranker:
+        """Get the cross-encoder re-ranker, loading it on first use."""
+        reranker = self._reranker
+        if reranker is not None:
+            return reranker
+
+        with self._reranker_lock:
+            if self._reranker is None:
+                logger.info(
+                    "Initializing cross-encoder re-ranker",
+                    model=self.reranker_model,
+                )
+                self._reranker = CrossEncoderReranker(
+                    model_name=self.reranker_model,
+                    use_cache=True,
+                )
+            return self._reranker
+
+    def warmup(self, on_stage: Optional[Callable[[str, float], None]] = None) -> Dict[str, float]:
+        """
+        Load everything the first search would otherwise initialize lazily.
+
+        Stages: the embedding model (plus one dummy encode), the ChromaDB
+        collection, the BM25 and metadata indexes, and, if re-ranking is
+        enabled, the cross-encoder (plus one dummy prediction).
+
+        Args:
+            on_stage: Called with (stage name, milliseconds) after each stage.
+
+        Returns:
+            Milliseconds per stage.
+        """
+        stages: List[Tuple[str, Callable[[], Any]]] = [
+            ("embedding_model", self.embedding_service.warmup),
+            ("vector_store", lambda: self.collection.count()),
+            ("keyword_index", self._ensure_bm25_index),
+            ("metadata_index", self._ensure_metadata_index),
+        ]
+        if self.enable_reranker:
+            stages.append(("reranker", lambda: self._ensure_reranker().warmup()))
+
+        timings: Dict[str, float] = {}
+        for name, run in stages:
+            start = time.perf_counter()
+            run()
+            timings[name] = round((time.perf_counter() - start) * 1000, 2)
+            logger.info("Warmup stage complete", stage=name, duration_ms=timings[name])
+            if on_stage is not None:
+                on_stage(name, timings[name])
+
+        return timings
 
     def _rerank_results(
         self,
@@ -603,19 +1383,8 @@ class VectorStore:
         if not candidates:
             return []
 
-        # Lazy load cross-encoder
-        if self._reranker is None:
-            logger.info(
-                "Initializing cross-encoder re-ranker",
-                model=self.reranker_model,
-            )
-            self._reranker = CrossEncoderReranker(
-                model_name=self.reranker_model,
-                use_cache=True,
-            )
-
         # Re-rank
-        rerank_results = self._reranker.rerank(query, candidates, top_k)
+        rerank_results = self._ensure_reranker().rerank(query, candidates, top_k)
 
         # Convert to dict format
         formatted_results = []
@@ -667,107 +1436,6 @@ class VectorStore:
 
         return where_dict, where_doc_dict
 
-    def _matches_where_clause(
-        self,
-        metadata: Dict[str, Any],
-        where: Dict[str, Any],
-    ) -> bool:
-        """
-        Check if metadata matches a ChromaDB where clause.
-
-        Args:
-            metadata: Document metadata
-            where: ChromaDB where clause
-
-        Returns:
-            True if metadata matches the where clause
-        """
-        for field, condition in where.items():
-            # Handle logical operators
-            if field == "$and":
-                return all(self._matches_where_clause(metadata, c) for c in condition)
-            elif field == "$or":
-                return any(self._matches_where_clause(metadata, c) for c in condition)
-            elif field == "$not":
-                return not self._matches_where_clause(metadata, condition)
-
-            # Handle field conditions
-            if field not in metadata:
-                return False
-
-            field_value = metadata[field]
-
-            if isinstance(condition, dict):
-                # Operator-based condition
-                for op, value in condition.items():
-                    if op == "$eq":
-                        if field_value != value:
-                            return False
-                    elif op == "$ne":
-                        if field_value == value:
-                            return False
-                    elif op == "$gt":
-                        if not (field_value > value):
-                            return False
-                    elif op == "$gte":
-                        if not (field_value >= value):
-                            return False
-                    elif op == "$lt":
-                        if not (field_value < value):
-                            return False
-                    elif op == "$lte":
-                        if not (field_value <= value):
-                            return False
-                    elif op == "$in":
-                        if field_value not in value:
-                            return False
-                    elif op == "$nin":
-                        if field_value in value:
-                            return False
-                    elif op == "$contains":
-                        if value not in str(field_value):
-                            return False
-                    elif op == "$not_contains":
-                        if value in str(field_value):
-                            return False
-            else:
-                # Direct equality
-                if field_value != condition:
-                    return False
-
-        return True
-
-    def _matches_where_document_clause(
-        self,
-        content: str,
-        where_document: Dict[str, Any],
-    ) -> bool:
-        """
-        Check if document content matches a where_document clause.
-
-        Args:
-            content: Document content
-            where_document: ChromaDB where_document clause
-
-        Returns:
-            True if content matches the where_document clause
-        """
-        for op, value in where_document.items():
-            if op == "$contains":
-                if value not in content:
-                    return False
-            elif op == "$not_contains":
-                if value in content:
-                    return False
-            elif op == "$and":
-                return all(self._matches_where_document_clause(content, c) for c in value)
-            elif op == "$or":
-                return any(self._matches_where_document_clause(content, c) for c in value)
-            elif op == "$not":
-                return not self._matches_where_document_clause(content, value)
-
-        return True
-
     def search_with_facets(
         self,
         query: str,
@@ -884,26 +1552,108 @@ class VectorStore:
         Returns:
             True if deleted, False if not found.
         """
-        existing = self.collection.get(ids=[doc_id])
-        if not existing["ids"]:
-            return False
+        return bool(self.delete_documents([doc_id]))
 
-        self.collection.delete(ids=[doc_id])
-        logger.debug("Deleted document", doc_id=doc_id)
+    def delete_documents(self, doc_ids: List[str]) -> List[str]:
+        """
+        Delete documents by ID with batched ChromaDB calls and one index update.
 
-        # Rebuild BM25 index
-        if self.enable_hybrid_search:
-            self._rebuild_bm25_index()
+        Args:
+            doc_ids: The document IDs (unknown IDs are ignored).
 
-        return True
+        Returns:
+            IDs that existed and were deleted, in request order.
+        """
+        unique_ids = list(dict.fromkeys(doc_ids))
+        existing_ids = self._existing_ids(unique_ids)
+        deleted = [doc_id for doc_id in unique_ids if doc_id in existing_ids]
+
+        self._delete_ids(deleted)
+        return deleted
+
+    def delete_where(
+        self,
+        where: Union[dict[str, Any], Filter],
+        where_document: Optional[dict[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Delete all documents matching a metadata filter.
+
+        Args:
+            where: Metadata filter (dict or Filter object); must not be empty.
+            where_document: Optional document content filter.
+
+        Returns:
+            IDs of the deleted documents.
+
+        Raises:
+            ValueError: If no filter is given (use clear() to delete everything).
+        """
+        if not where:
+            raise ValueError("delete_where requires a filter; use clear() to delete everything")
+
+        if isinstance(where, Filter):
+            matching = self._ids_matching_filter(where, where_document)
+        else:
+            matching = self.collection.get(
+                where=where, where_document=where_document, include=[]
+            )["ids"]
+
+        self._delete_ids(matching)
+        return matching
+
+    def _ids_matching_filter(
+        self,
+        where: Filter,
+        where_document: Optional[dict[str, Any]],
+    ) -> List[str]:
+        """Resolve the IDs matching a Filter, including client-side-only operators."""
+        candidates = self._select_candidates(where)
+        if candidates is not None and candidates.exact and not where_document:
+            return candidates.ids()
+
+        where_dict, where_doc_dict = self._process_filters(where, where_document)
+        result = self.collection.get(
+            where=where_dict,
+            where_document=where_doc_dict,
+            include=["documents", "metadatas"],
+        )
+        matches = where.compile()
+        return [
+            doc_id
+            for doc_id, content, metadata in zip(
+                result["ids"], result["documents"], result["metadatas"]
+            )
+            if (candidates is None or doc_id in candidates) and matches(metadata or {}, content)
+        ]
+
+    def _delete_ids(self, doc_ids: List[str]) -> None:
+        """Delete existing documents and update the indexes once."""
+        if not doc_ids:
+            return
+
+        for i in range(0, len(doc_ids), self.ID_LOOKUP_BATCH_SIZE):
+            self.collection.delete(ids=doc_ids[i:i + self.ID_LOOKUP_BATCH_SIZE])
+        logger.debug("Deleted documents", count=len(doc_ids))
+
+        # Update BM25 and metadata indexes incrementally
+        self._unindex_documents(doc_ids)
+        self._invalidate_search_results()
 
     def clear(self) -> None:
         """Delete all documents from the collection."""
         logger.warning("Clearing all documents from collection", name=self.collection_name)
         self.client.delete_collection(self.collection_name)
-        self._collection = None
-        self._bm25 = None
-        self._documents_cache = []
+        with self._index_lock:
+            self._collection = None
+            if isinstance(self._bm25, InvertedIndexBM25):
+                # Unmap before deleting the file (Windows refuses while mapped)
+                self._bm25.close()
+            self._bm25 = None
+            self._bm25_dirty = False
+            self._metadata_index = None
+            self.bm25_index_path.unlink(missing_ok=True)
+        self._invalidate_search_results()
 
     def get_stats(self) -> dict[str, Any]:
         """Get collection statistics."""
@@ -916,7 +1666,7 @@ class VectorStore:
         }
 
         if self.enable_hybrid_search and self._bm25:
-            stats["bm25_indexed_documents"] = len(self._documents_cache)
+            stats["bm25_indexed_documents"] = self._bm25.num_docs
 
         if self.enable_reranker:
             stats["reranker_model"] = self.reranker_model
@@ -929,22 +1679,182 @@ class VectorStore:
         return stats
 
 
-# Convenience function
+class AsyncVectorStore:
+    """
+    Async facade over a VectorStore for use from async code (e.g. FastAPI endpoints).
+
+    Every call runs the blocking VectorStore method on a bounded executor so
+    the event loop is never blocked: searches and lookups use the query pool,
+    writes (which embed documents and update indexes) use the ingest pool.
+    Searches embed the query first from the event loop (through the embedding
+    batcher), so requests waiting for a batch do not hold query pool threads;
+    the search then finds the embedding in the cache. Arguments are the same
+    as for the wrapped VectorStore methods.
+    """
+
+    def __init__(self, store: VectorStore):
+        """
+        Initialize the facade.
+
+        Args:
+            store: The VectorStore to wrap (usually the shared instance).
+        """
+        self.store = store
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the wrapped collection."""
+        return self.store.collection_name
+
+    @property
+    def embedding_service(self) -> EmbeddingService:
+        """Embedding service of the wrapped store."""
+        return self.store.embedding_service
+
+    # Query pool
+
+    async def search(self, query: str, *args: Any, **kwargs: Any) -> list[dict[str, Any]]:
+        """Search for similar documents (see VectorStore.search())."""
+        await self.embedding_service.aembed_query_np(query)
+        return await run_in_executor(QUERY_POOL, self.store.search, query, *args, **kwargs)
+
+    async def search_many(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Search for several queries at once (see VectorStore.search_many())."""
+        return await run_in_executor(QUERY_POOL, self.store.search_many, *args, **kwargs)
+
+    async def search_with_facets(
+        self, query: str, *args: Any, **kwargs: Any
+    ) -> tuple[list[dict[str, Any]], Dict[str, FacetResult]]:
+        """Search with faceted aggregation (see VectorStore.search_with_facets())."""
+        await self.embedding_service.aembed_query_np(query)
+        return await run_in_executor(QUERY_POOL, self.store.search_with_facets, query, *args, **kwargs)
+
+    async def get_document(self, doc_id: str) -> Optional[dict[str, Any]]:
+        """Get a document by ID (see VectorStore.get_document())."""
+        return await run_in_executor(QUERY_POOL, self.store.get_document, doc_id)
+
+    async def get_all_documents(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Get all documents (see VectorStore.get_all_documents())."""
+        return await run_in_executor(QUERY_POOL, self.store.get_all_documents, limit)
+
+    async def count(self) -> int:
+        """Get the number of documents in the collection."""
+        return await run_in_executor(QUERY_POOL, lambda: self.store.collection.count())
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Get collection statistics (see VectorStore.get_stats())."""
+        return await run_in_executor(QUERY_POOL, self.store.get_stats)
+
+    # Ingest pool
+
+    async def add_document(self, *args: Any, **kwargs: Any) -> str:
+        """Add a single document (see VectorStore.add_document())."""
+        return await run_in_executor(INGEST_POOL, self.store.add_document, *args, **kwargs)
+
+    async def add_documents(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Add multiple documents (see VectorStore.add_documents())."""
+        return await run_in_executor(INGEST_POOL, self.store.add_documents, *args, **kwargs)
+
+    async def delete_document(self, doc_id: str) -> bool:
+        """Delete a document by ID (see VectorStore.delete_document())."""
+        return await run_in_executor(INGEST_POOL, self.store.delete_document, doc_id)
+
+    async def delete_documents(self, doc_ids: List[str]) -> List[str]:
+        """Delete documents by ID (see VectorStore.delete_documents())."""
+        return await run_in_executor(INGEST_POOL, self.store.delete_documents, doc_ids)
+
+    async def delete_where(self, *args: Any, **kwargs: Any) -> List[str]:
+        """Delete documents matching a filter (see VectorStore.delete_where())."""
+        return await run_in_executor(INGEST_POOL, self.store.delete_where, *args, **kwargs)
+
+    async def save_bm25_index(self) -> bool:
+        """Persist the BM25 index (see VectorStore.save_bm25_index())."""
+        return await run_in_executor(INGEST_POOL, self.store.save_bm25_index)
+
+    async def warmup(self, *args: Any, **kwargs: Any) -> Dict[str, float]:
+        """Load models and build indexes ahead of traffic (see VectorStore.warmup())."""
+        return await run_in_executor(INGEST_POOL, self.store.warmup, *args, **kwargs)
+
+
+# Process-wide registry of shared VectorStore instances.
+# Keyed by (collection_name, persist_directory) so every caller that talks to the
+# same collection shares one ChromaDB client and one BM25 index.
+_vector_stores: Dict[Tuple[str, str], VectorStore] = {}
+_vector_stores_lock = threading.Lock()
+
+
 def get_vector_store(
     enable_hybrid_search: bool = True,
     enable_reranker: bool = False,
+    collection_name: Optional[str] = None,
+    persist_directory: Optional[str] = None,
 ) -> VectorStore:
     """
-    Get a VectorStore instance with default settings.
+    Get the shared VectorStore for a collection.
+
+    Instances are cached per (collection, persist directory), so the API app,
+    chat service, agents and health checks reuse the same index state instead
+    of rebuilding BM25 on their first search. The feature flags are set by
+    the call that creates the instance and are not changed by later calls;
+    callers choose features per search with use_hybrid/use_reranker, within
+    what the shared instance has enabled.
 
     Args:
         enable_hybrid_search: Enable BM25 + Vector hybrid search (default: True).
+            Only used when creating the instance.
         enable_reranker: Enable cross-encoder re-ranking (default: False).
+            Only used when creating the instance.
+        collection_name: Collection name (default: settings.chroma_collection_name).
+        persist_directory: Persist directory (default: settings.chroma_persist_dir).
 
     Returns:
-        VectorStore instance.
+        Shared VectorStore instance.
     """
-    return VectorStore(
-        enable_hybrid_search=enable_hybrid_search,
-        enable_reranker=enable_reranker,
+    key = (
+        collection_name or settings.chroma_collection_name,
+        str(Path(persist_directory or settings.chroma_persist_dir).resolve()),
+    )
+
+    with _vector_stores_lock:
+        store = _vector_stores.get(key)
+        if store is None:
+            logger.info("Creating shared vector store", collection=key[0], persist_dir=key[1])
+            store = VectorStore(
+                collection_name=key[0],
+                persist_directory=persist_directory,
+                enable_hybrid_search=enable_hybrid_search,
+                enable_reranker=enable_reranker,
+            )
+            _vector_stores[key] = store
+
+    return store
+
+
+def reset_vector_stores() -> None:
+    """Drop all shared VectorStore instances (mainly for testing)."""
+    with _vector_stores_lock:
+        _vector_stores.clear()
+
+
+def get_async_vector_store(
+    enable_hybrid_search: bool = True,
+    enable_reranker: bool = False,
+    collection_name: Optional[str] = None,
+    persist_directory: Optional[str] = None,
+) -> AsyncVectorStore:
+    """
+    Get an async facade over the shared VectorStore for a collection.
+
+    Arguments are the same as for get_vector_store().
+
+    Returns:
+        AsyncVectorStore wrapping the shared instance.
+    """
+    return AsyncVectorStore(
+        get_vector_store(
+            enable_hybrid_search=enable_hybrid_search,
+            enable_reranker=enable_reranker,
+            collection_name=collection_name,
+            persist_directory=persist_directory,
+        )
     )
@@ -8,7 +8,6 @@ from typing import Any, Optional
 
 import structlog
 import yaml
-from prance import ResolvingParser
 
 from src.parsers.base_parser import (
     BaseParser,
@@ -115,6 +114,10 @@ class OpenAPIParser(BaseParser):
         import tempfile
         import os
 
+        # Imported here: prance pulls in the OpenAPI validators, which most
+        # CLI commands never need
+        from prance import ResolvingParser
+
         # Determine file extension
         ext = ".yaml"
         try:
@@ -5,14 +5,23 @@ This package contains service modules for:
 - Web search (DuckDuckGo)
 - URL scraping and content extraction
 - Conversation memory management
+
+Exports are loaded lazily (PEP 562), so using one service does not
+import the others' dependencies.
 """
 
-from src.services.web_search import WebSearchService, get_web_search_service
-from src.services.url_scraper import URLScraperService, get_url_scraper_service
-from src.services.conversation_memory import (
-    ConversationMemoryService,
-    get_conversation_memory_service,
-)
+import importlib
+from typing import Any
+
+# Exported name -> submodule that defines it (imported on first access)
+_EXPORTS = {
+    "WebSearchService": "web_search",
+    "get_web_search_service": "web_search",
+    "URLScraperService": "url_scraper",
+    "get_url_scraper_service": "url_scraper",
+    "ConversationMemoryService": "conversation_memory",
+    "get_conversation_memory_service": "conversation_memory",
+}
 
 __all__ = [
     "WebSearchService",
@@ -22,3 +31,18 @@ __all__ = [
     "ConversationMemoryService",
     "get_conversation_memory_service",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list:
+    """List exported names alongside the module's own attributes."""
+    return sorted(set(globals()) | set(_EXPORTS))
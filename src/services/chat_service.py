@@ -10,13 +10,19 @@ This service provides a complete AI chat assistant that can:
 - Generate code examples
 """
 
-from typing import List, Dict, Optional
+import time
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, List, Dict, Optional
 from datetime import datetime, timezone
 
 import structlog
 
+from src.config import settings
+from src.core.cancellation import DisconnectCheck, check_disconnected, run_until_disconnected
+from src.core.exceptions import RequestCancelledError
+from src.core.executors import INGEST_POOL, run_in_executor
 from src.core.llm_client import get_llm_client
-from src.core.vector_store import get_vector_store
+from src.core.vector_store import AsyncVectorStore, get_vector_store
 from src.services.url_scraper import get_url_scraper_service
 from src.services.conversation_memory import get_conversation_memory_service
 
@@ -72,7 +78,8 @@ class ChatService:
         user_message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None,
         session_id: Optional[str] = None,
-    ) -> Dict[str, any]:
+        is_disconnected: Optional[DisconnectCheck] = None,
+    ) -> Dict[str, Any]:
         """
         Generate an AI response to a user message.
 
@@ -87,9 +94,14 @@ class ChatService:
             user_message: User's message
             conversation_history: Previous conversation messages
             session_id: Optional session identifier
+            is_disconnected: Optional client disconnect check; checked between
+                stages and while scraping and generating
 
         Returns:
             Dict with 'response', 'sources', 'scraped_urls', 'indexed_docs'
+
+        Raises:
+            RequestCancelledError: If the client disconnected
         """
         try:
             logger.info(
@@ -98,89 +110,20 @@ class ChatService:
                 session_id=session_id,
             )
 
-            # Step 1: Extract and scrape URLs
-            scraped_content = []
-            indexed_count = 0
-            extracted_urls = []
-            failed_urls = []
-
-            if self.enable_url_scraping:
-                extracted_urls = self.url_scraper.extract_urls(user_message)
-
-                if extracted_urls:
-                    logger.info("chat_extracting_urls", url_count=len(extracted_urls))
-                    scraped_content = self.url_scraper.scrape_urls(extracted_urls)
-
-                    # Track failed URLs
-                    scraped_urls = {sc["url"] for sc in scraped_content}
-                    failed_urls = [url for url in extracted_urls if url not in scraped_urls]
-
-                    if failed_urls:
-                        logger.warning(
-                            "chat_url_scraping_partial_failure",
-                            failed_count=len(failed_urls),
-                            total_urls=len(extracted_urls),
-                            failed_urls=failed_urls,
-                        )
-
-                    # Step 2: Dynamically index scraped content
-                    if self.enable_auto_indexing and scraped_content:
-                        for content in scraped_content:
-                            success = self.memory_service.embed_url_content(
-                                url_content=content,
-                                query=user_message,
-                                session_id=session_id,
-                            )
-                            if success:
-                                indexed_count += 1
-
-                        logger.info(
-                            "chat_indexed_urls",
-                            indexed=indexed_count,
-                            total=len(scraped_content),
-                        )
-
-            # Step 3: Search vector store for relevant context
-            # Detect if user is asking for API listing/comprehensive overview
-            listing_keywords = ["list", "available", "what apis", "all apis", "all endpoints", "show me apis", "what endpoints"]
-            is_listing_query = any(keyword in user_message.lower() for keyword in listing_keywords)
-
-            # Increase context for listing queries to ensure comprehensive results
-            context_limit = min(50, self.max_context_results * 2) if is_listing_query else self.max_context_results
-
-            search_results = self.vector_store.search(
-                query=user_message,
-                n_results=context_limit,
-            )
-
-            logger.info("chat_search_complete", results=len(search_results), is_listing_query=is_listing_query)
-
-            # Step 4: Build context for LLM
-            context = self._build_context(search_results, scraped_content)
-
-            # Step 5: Generate LLM response
-            system_prompt = self._build_system_prompt(context)
-
-            # Build messages for chat with full conversation history
-            messages = []
-
-            # Add system prompt first
-            messages.append({"role": "system", "content": system_prompt})
-
-            # Add conversation history if provided (last 10 messages for context)
-            if conversation_history:
-                messages.extend(conversation_history[-10:])
-
-            # Add current user message
-            user_prompt = self._build_user_prompt(user_message, context)
-            messages.append({"role": "user", "content": user_prompt})
-
-            # Generate response using chat() which properly handles conversation history
-            response_text = self.llm_client.chat(
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2048,
-                timeout_seconds=120,
+            retrieval = await self._retrieve(user_message, conversation_history, session_id, is_disconnected)
+
+            # Generate response using achat() which properly handles conversation history
+            # without blocking the event loop for the length of the generation
+            await check_disconnected(is_disconnected, "generation")
+            response_text = await run_until_disconnected(
+                self.llm_client.achat(
+                    messages=retrieval["messages"],
+                    temperature=0.7,
+                    max_tokens=2048,
+                    timeout_seconds=120,
+                ),
+                is_disconnected,
+                stage="generation",
             )
 
             logger.info(
@@ -189,32 +132,99 @@ class ChatService:
                 session_id=session_id,
             )
 
-            # Step 6: Format sources
-            sources = self._format_sources(search_results, scraped_content)
-
             # Add note about failed URLs if any
-            if failed_urls:
-                response_text += f"\n\n**Note:** Unable to scrape {len(failed_urls)} URL(s) due to network/DNS errors. This may be due to connectivity issues or firewall restrictions. The response is based on {len(scraped_content)} successfully scraped URLs and existing indexed content."
+            if retrieval["failed_urls"]:
+                response_text += self._failed_urls_note(retrieval)
 
             return {
                 "response": response_text,
-                "sources": sources,
-                "scraped_urls": [c["url"] for c in scraped_content],
-                "failed_urls": failed_urls,
-                "indexed_docs": indexed_count,
-                "context_results": len(search_results),
+                **self._retrieval_summary(retrieval),
             }
 
+        except RequestCancelledError as e:
+            logger.info("chat_generation_cancelled", stage=e.details.get("stage"), session_id=session_id)
+            raise
+
         except Exception as e:
             logger.error("chat_generation_failed", error=str(e), exc_info=e)
             raise
 
+    async def generate_response_events(
+        self,
+        user_message: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None,
+        session_id: Optional[str] = None,
+        is_disconnected: Optional[DisconnectCheck] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Generate a streaming AI response as a sequence of events.
+
+        Yields dicts with 'event' and 'data':
+        - "retrieval" once context is ready: 'sources', 'scraped_urls',
+          'failed_urls', 'indexed_docs', 'context_results'
+        - "token" per generated chunk: 'content'
+        - "done" after the last chunk: 'response' (the full text)
+
+        Closing the generator early stops the LLM generation. With
+        is_disconnected, the client is also checked between stages and every
+        settings.disconnect_poll_interval seconds while tokens stream, raising
+        RequestCancelledError once it is gone.
+        """
+        try:
+            retrieval = await self._retrieve(user_message, conversation_history, session_id, is_disconnected)
+            yield {"event": "retrieval", "data": self._retrieval_summary(retrieval)}
+
+            await check_disconnected(is_disconnected, "generation")
+            parts = []
+            last_check = time.monotonic()
+            # Stream response using achat_stream() which properly handles conversation history
+            async with aclosing(
+                self.llm_client.achat_stream(
+                    messages=retrieval["messages"],
+                    temperature=0.7,
+                    max_tokens=2048,
+                )
+            ) as chunks:
+                async for chunk in chunks:
+                    if (
+                        is_disconnected is not None
+                        and time.monotonic() - last_check >= settings.disconnect_poll_interval
+                    ):
+                        # Leaving the block closes the LLM stream
+                        await check_disconnected(is_disconnected, "generation")
+                        last_check = time.monotonic()
+
+                    parts.append(chunk)
+                    yield {"event": "token", "data": {"content": chunk}}
+
+            if retrieval["failed_urls"]:
+                note = self._failed_urls_note(retrieval)
+                parts.append(note)
+                yield {"event": "token", "data": {"content": note}}
+
+            response_text = "".join(parts)
+            logger.info(
+                "chat_stream_completed",
+                response_length=len(response_text),
+                session_id=session_id,
+            )
+            yield {"event": "done", "data": {"response": response_text}}
+
+        except RequestCancelledError as e:
+            logger.info("chat_streaming_cancelled", stage=e.details.get("stage"), session_id=session_id)
+            raise
+
+        except Exception as e:
+            logger.error("chat_streaming_failed", error=str(e))
+            raise
+
     async def generate_response_stream(
         self,
         user_message: str,
         conversation_history: Optional[List[Dict[str, str]]] = None,
         session_id: Optional[str] = None,
-    ):
+        is_disconnected: Optional[DisconnectCheck] = None,
+    ) -> AsyncGenerator[str, None]:
         """
         Generate a streaming AI response.
 
@@ -223,60 +233,133 @@ class ChatService:
         Yields:
             Chunks of response text
         """
-        try:
-            # Same URL scraping and indexing as non-streaming
-            scraped_content = []
-            if self.enable_url_scraping:
-                urls = self.url_scraper.extract_urls(user_message)
-                if urls:
-                    scraped_content = self.url_scraper.scrape_urls(urls)
-                    if self.enable_auto_indexing:
-                        for content in scraped_content:
-                            self.memory_service.embed_url_content(
-                                url_content=content,
-                                query=user_message,
-                                session_id=session_id,
-                            )
-
-            # Search for context with smart query detection
-            listing_keywords = ["list", "available", "what apis", "all apis", "all endpoints", "show me apis", "what endpoints"]
-            is_listing_query = any(keyword in user_message.lower() for keyword in listing_keywords)
-            context_limit = min(50, self.max_context_results * 2) if is_listing_query else self.max_context_results
-
-            search_results = self.vector_store.search(
-                query=user_message,
-                n_results=context_limit,
-            )
-
-            # Build prompts
-            context = self._build_context(search_results, scraped_content)
-            system_prompt = self._build_system_prompt(context)
-            user_prompt = self._build_user_prompt(user_message, context)
-
-            # Build messages for chat with full conversation history
-            messages = []
-
-            # Add system prompt first
-            messages.append({"role": "system", "content": system_prompt})
-
-            # Add conversation history if provided (last 10 messages for context)
-            if conversation_history:
-                messages.extend(conversation_history[-10:])
+        async with aclosing(
+            self.generate_response_events(user_message, conversation_history, session_id, is_disconnected)
+        ) as events:
+            async for event in events:
+                if event["event"] == "token":
+                    yield event["data"]["content"]
+
+    async def _retrieve(
+        self,
+        user_message: str,
+        conversation_history: Optional[List[Dict[str, str]]],
+        session_id: Optional[str],
+        is_disconnected: Optional[DisconnectCheck] = None,
+    ) -> Dict[str, Any]:
+        """
+        Gather context and build the LLM messages for a user message.
 
-            # Add current user message
-            messages.append({"role": "user", "content": user_prompt})
+        Shared by the blocking and streaming paths: scrapes and indexes URLs
+        from the message, searches the vector store and assembles the prompt.
+        Blocking work runs on the executor pools; each stage first checks
+        that the client is still connected.
 
-            # Stream response using chat_stream() which properly handles conversation history
-            for chunk in self.llm_client.chat_stream(
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2048,
-            ):
-                yield chunk
+        Returns:
+            Dict with 'messages', 'search_results', 'scraped_content',
+            'failed_urls' and 'indexed_docs'
+        """
+        # Step 1: Extract and scrape URLs
+        scraped_content = []
+        indexed_count = 0
+        extracted_urls = []
+        failed_urls = []
+
+        if self.enable_url_scraping:
+            extracted_urls = self.url_scraper.extract_urls(user_message)
+
+            if extracted_urls:
+                logger.info("chat_extracting_urls", url_count=len(extracted_urls))
+                await check_disconnected(is_disconnected, "url_scraping")
+                scraped_content = await self.url_scraper.ascrape_urls(extracted_urls, is_disconnected)
+
+                # Track failed URLs
+                scraped_urls = {sc["url"] for sc in scraped_content}
+                failed_urls = [url for url in extracted_urls if url not in scraped_urls]
+
+                if failed_urls:
+                    logger.warning(
+                        "chat_url_scraping_partial_failure",
+                        failed_count=len(failed_urls),
+                        total_urls=len(extracted_urls),
+                        failed_urls=failed_urls,
+                    )
+
+                # Step 2: Dynamically index scraped content
+                if self.enable_auto_indexing and scraped_content:
+                    for content in scraped_content:
+                        await check_disconnected(is_disconnected, "indexing")
+                        success = await run_in_executor(
+                            INGEST_POOL,
+                            self.memory_service.embed_url_content,
+                            url_content=content,
+                            query=user_message,
+                            session_id=session_id,
+                        )
+                        if success:
+                            indexed_count += 1
+
+                    logger.info(
+                        "chat_indexed_urls",
+                        indexed=indexed_count,
+                        total=len(scraped_content),
+                    )
+
+        # Step 3: Search vector store for relevant context
+        # Detect if user is asking for API listing/comprehensive overview
+        listing_keywords = ["list", "available", "what apis", "all apis", "all endpoints", "show me apis", "what endpoints"]
+        is_listing_query = any(keyword in user_message.lower() for keyword in listing_keywords)
+
+        # Increase context for listing queries to ensure comprehensive results
+        context_limit = min(50, self.max_context_results * 2) if is_listing_query else self.max_context_results
+
+        await check_disconnected(is_disconnected, "search")
+        search_results = await AsyncVectorStore(self.vector_store).search(
+            query=user_message,
+            n_results=context_limit,
+        )
 
-        except Exception as e:
-            logger.error("chat_streaming_failed", error=str(e))
-            raise
+        logger.info("chat_search_complete", results=len(search_results), is_listing_query=is_listing_query)
+
+        # Step 4: Build context and prompts for LLM
+        context = self._build_context(search_results, scraped_content)
+        system_prompt = self._build_system_prompt(context)
+
+        # Build messages for chat with full conversation history
+        messages = []
+
+        # Add system prompt first
+        messages.append({"role": "system", "content": system_prompt})
+
+        # Add conversation history if provided (last 10 messages for context)
+        if conversation_history:
+            messages.extend(conversation_history[-10:])
+
+        # Add current user message
+        user_prompt = self._build_user_prompt(user_message, context)
+        messages.append({"role": "user", "content": user_prompt})
+
+        return {
+            "messages": messages,
+            "search_results": search_results,
+            "scraped_content": scraped_content,
+            "failed_urls": failed_urls,
+            "indexed_docs": indexed_count,
+        }
+
+    def _retrieval_summary(self, retrieval: Dict[str, Any]) -> Dict[str, Any]:
+        """Response metadata (sources and counts) for a retrieval result."""
+        return {
+            "sources": self._format_sources(retrieval["search_results"], retrieval["scraped_content"]),
+            "scraped_urls": [c["url"] for c in retrieval["scraped_content"]],
+            "failed_urls": retrieval["failed_urls"],
+            "indexed_docs": retrieval["indexed_docs"],
+            "context_results": len(retrieval["search_results"]),
+        }
+
+    def _failed_urls_note(self, retrieval: Dict[str, Any]) -> str:
+        """Note appended to the response when some URLs could not be scraped."""
+        return f"\n\n**Note:** Unable to scrape {len(retrieval['failed_urls'])} URL(s) due to network/DNS errors. This may be due to connectivity issues or firewall restrictions. The response is based on {len(retrieval['scraped_content'])} successfully scraped URLs and existing indexed content."
 
     def _build_context(
         self,
@@ -261,6 +261,38 @@ class ConversationMemoryService:
             logger.error("Failed to search conversation history", error=str(e))
             return []
 
+    def delete_session_documents(self, session_ids: List[str]) -> int:
+        """
+        Delete everything embedded for the given sessions.
+
+        Uses one filtered delete for all sessions, so expiring many sessions
+        costs a single index update.
+
+        Args:
+            session_ids: Session identifiers.
+
+        Returns:
+            Number of documents deleted.
+        """
+        if not session_ids:
+            return 0
+
+        try:
+            deleted = self._vector_store.delete_where(
+                {"session_id": {"$in": list(session_ids)}}
+            )
+            if deleted:
+                logger.info(
+                    "Deleted session documents",
+                    sessions=len(session_ids),
+                    documents=len(deleted),
+                )
+            return len(deleted)
+
+        except Exception as e:
+            logger.error("Failed to delete session documents", error=str(e))
+            return 0
+
 
 def get_conversation_memory_service() -> ConversationMemoryService:
     """
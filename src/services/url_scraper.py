@@ -5,7 +5,9 @@ This module provides functionality to extract URLs from user messages
 and scrape their content for use in RAG retrieval.
 """
 
+import asyncio
 import re
+import threading
 import time
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
@@ -14,6 +16,9 @@ import structlog
 import httpx
 from bs4 import BeautifulSoup
 
+from src.core.cancellation import DisconnectCheck, run_until_disconnected
+from src.core.executors import SCRAPE_POOL, run_in_executor
+
 logger = structlog.get_logger(__name__)
 
 
@@ -78,12 +83,13 @@ class URLScraperService:
         logger.info("Extracted URLs from text", num_urls=len(unique_urls))
         return unique_urls
 
-    def scrape_url(self, url: str) -> Optional[Dict[str, str]]:
+    def scrape_url(self, url: str, cancelled: Optional[threading.Event] = None) -> Optional[Dict[str, str]]:
         """
         Scrape content from a URL with retry logic for network errors.
 
         Args:
             url: URL to scrape.
+            cancelled: Optional event; once set, no further attempts are made.
 
         Returns:
             Dict with 'title', 'content', 'url' keys, or None if failed.
@@ -96,6 +102,10 @@ class URLScraperService:
 
         # Retry logic for DNS and network errors
         for attempt in range(self.max_retries):
+            if cancelled is not None and cancelled.is_set():
+                logger.info("URL scraping cancelled", url=url)
+                return None
+
             try:
                 logger.info("Scraping URL", url=url, attempt=attempt + 1)
 
@@ -173,7 +183,7 @@ class URLScraperService:
                     error=str(e),
                 )
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff: 1s, 2s, 4s
+                    self._backoff(2 ** attempt, cancelled)  # Exponential backoff: 1s, 2s, 4s
                     continue
                 else:
                     logger.error("URL scraping failed after retries (timeout)", url=url)
@@ -196,7 +206,7 @@ class URLScraperService:
                 if attempt < self.max_retries - 1:
                     backoff = 2 ** attempt
                     logger.info(f"Retrying in {backoff} seconds...", url=url)
-                    time.sleep(backoff)  # Exponential backoff: 1s, 2s, 4s
+                    self._backoff(backoff, cancelled)  # Exponential backoff: 1s, 2s, 4s
                     continue
                 else:
                     logger.error(
@@ -217,6 +227,14 @@ class URLScraperService:
 
         return None  # All retries failed
 
+    @staticmethod
+    def _backoff(seconds: float, cancelled: Optional[threading.Event]) -> None:
+        """Sleep before a retry, waking early if cancelled."""
+        if cancelled is None:
+            time.sleep(seconds)
+        else:
+            cancelled.wait(seconds)
+
     def scrape_urls(self, urls: List[str]) -> List[Dict[str, str]]:
         """
         Scrape content from multiple URLs.
@@ -236,6 +254,40 @@ class URLScraperService:
         logger.info("Scraped multiple URLs", total=len(urls), successful=len(results))
         return results
 
+    async def ascrape_urls(
+        self,
+        urls: List[str],
+        is_disconnected: Optional[DisconnectCheck] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Scrape multiple URLs concurrently on the scrape pool.
+
+        If the client disconnects, queued scrapes are dropped and running
+        ones stop before their next attempt.
+
+        Args:
+            urls: List of URLs to scrape.
+            is_disconnected: Optional client disconnect check.
+
+        Returns:
+            List of scraped content dicts in URL order (excludes failed scrapes).
+
+        Raises:
+            RequestCancelledError: If the client disconnected.
+        """
+        cancelled = threading.Event()
+        scrapes = asyncio.gather(
+            *(run_in_executor(SCRAPE_POOL, self.scrape_url, url, cancelled) for url in urls)
+        )
+        try:
+            scraped = await run_until_disconnected(scrapes, is_disconnected, stage="url_scraping")
+        finally:
+            cancelled.set()
+
+        results = [result for result in scraped if result]
+        logger.info("Scraped multiple URLs", total=len(urls), successful=len(results))
+        return results
+
     def extract_and_scrape(self, text: str) -> List[Dict[str, str]]:
         """
         Extract URLs from text and scrape their content.
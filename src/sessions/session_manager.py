@@ -21,7 +21,7 @@ import os
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Hashable, List, Optional
 from enum import Enum
 
 logger = structlog.get_logger(__name__)
@@ -233,6 +233,7 @@ class SessionManager:
         self.cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
         self.lock = threading.RLock()
         self.last_cleanup = datetime.now()
+        self._removal_listeners: Dict[Hashable, Callable[[List[str]], Any]] = {}
 
         # Set sessions file path
         if sessions_file is None:
@@ -434,6 +435,36 @@ class SessionManager:
 
             return session
 
+    def add_removal_listener(
+        self,
+        listener: Callable[[List[str]], Any],
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """
+        Register a callback for removed sessions.
+
+        The callback receives the IDs of sessions removed by delete_session()
+        or cleanup_expired_sessions(), e.g. to delete their stored documents.
+        Registering again under the same key replaces the earlier listener,
+        so callers that re-register (e.g. each create_app()) don't pile up.
+
+        Args:
+            listener: Callable taking a list of session IDs
+            key: Identifies the listener (default: the listener itself)
+        """
+        with self.lock:
+            self._removal_listeners[listener if key is None else key] = listener
+
+    def _notify_removed(self, session_ids: List[str]) -> None:
+        """Call removal listeners (errors are logged, not raised)."""
+        with self.lock:
+            listeners = list(self._removal_listeners.values())
+        for listener in listeners:
+            try:
+                listener(session_ids)
+            except Exception as e:
+                logger.error("Session removal listener failed", error=str(e))
+
     def delete_session(self, session_id: str) -> bool:
         """
         Delete a session.
@@ -451,10 +482,11 @@ class SessionManager:
 
                 # Persist to file
                 self._save_sessions()
+            else:
+                return False
 
-                return True
-
-            return False
+        self._notify_removed([session_id])
+        return True
 
     def list_sessions(
         self,
@@ -516,7 +548,10 @@ class SessionManager:
 
             self.last_cleanup = datetime.now()
 
-            return len(expired_ids)
+        if expired_ids:
+            self._notify_removed(expired_ids)
+
+        return len(expired_ids)
 
     def auto_cleanup(self):
         """Automatically cleanup if interval has passed."""
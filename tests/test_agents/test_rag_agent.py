@@ -25,8 +25,12 @@ class TestRAGAgent:
 
     @pytest.fixture
     def mock_vector_store(self):
-        """Create a mock vector store."""
-        return Mock(spec=VectorStore)
+        """Create a mock vector store (search_many returns search() per query)."""
+        store = Mock(spec=VectorStore)
+        store.search_many.side_effect = lambda queries, **kwargs: {
+            "results": [store.search(query=q, **kwargs) for q in queries]
+        }
+        return store
 
     @pytest.fixture
     def mock_llm_client(self):
@@ -151,8 +155,9 @@ Bearer token authentication"""
         state = create_initial_state("How to authenticate?")
         result = rag_agent.process(state)
 
-        # Verify search was called multiple times (once per query variation)
-        assert mock_vector_store.search.call_count > 1
+        # Verify all query variations were searched in one batched call
+        mock_vector_store.search_many.assert_called_once()
+        assert len(mock_vector_store.search_many.call_args.kwargs["queries"]) > 1
 
     def test_query_expansion_with_intent_keywords(self, rag_agent, mock_vector_store, mock_llm_client):
         """Test query expansion uses intent keywords."""
@@ -171,8 +176,8 @@ Bearer token authentication"""
         result = rag_agent.process(state)
 
         # Should have used keywords in query expansion
-        search_calls = mock_vector_store.search.call_args_list
-        assert len(search_calls) > 1
+        queries = mock_vector_store.search_many.call_args.kwargs["queries"]
+        assert "authenticate api token bearer" in queries
 
     def test_relevance_score_filtering(self, rag_agent, mock_vector_store, mock_llm_client):
         """Test that low-relevance documents are filtered out."""
@@ -9,12 +9,25 @@ Tests all API endpoints including:
 - Filtering
 - Query expansion
 - Result diversification
+- Streaming chat (Server-Sent Events)
 """
 
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from fastapi.testclient import TestClient
 
 from src.api.app import create_app
+from src.api.auth import verify_api_key
+from src.core.exceptions import RequestCancelledError
+from src.config import get_settings
+from src.core.executors import INGEST_POOL
+from src.core.performance import PerformanceMonitor
+from src.core.vector_store import AsyncVectorStore
+from src.sessions import get_session_manager
 from src.api.models import (
     AddDocumentsRequest,
     BulkDeleteRequest,
@@ -90,6 +103,46 @@ class TestHealthEndpoints:
         assert "total_documents" in data["collection"]
         assert "collection_name" in data["collection"]
 
+    def test_liveness(self, client):
+        """Test that the liveness probe answers during and after warmup."""
+        response = client.get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_readiness_after_warmup(self, client):
+        """Test that the readiness probe turns ready once warmup finishes."""
+        deadline = time.monotonic() + 120
+        response = client.get("/health/ready")
+        while response.status_code == 503 and time.monotonic() < deadline:
+            assert response.json()["ready"] is False
+            time.sleep(0.5)
+            response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ready"] is True
+        assert data["error"] is None
+        assert "embedding_model" in data["stages"]
+        assert "keyword_index" in data["stages"]
+
+    def test_readiness_recovers_after_failed_warmup(self, monkeypatch):
+        """Test that a failed warmup is retried and the instance turns ready."""
+        monkeypatch.setattr(get_settings(), "warmup_retry_initial_s", 0.05)
+        warmup = AsyncMock(side_effect=[RuntimeError("model download failed"), {}])
+        app = create_app(enable_hybrid=True, enable_reranker=False, enable_cors=True)
+
+        with patch.object(AsyncVectorStore, "warmup", warmup), TestClient(app) as test_client:
+            deadline = time.monotonic() + 10
+            response = test_client.get("/health/ready")
+            while response.status_code == 503 and time.monotonic() < deadline:
+                time.sleep(0.05)
+                response = test_client.get("/health/ready")
+
+            assert response.status_code == 200
+            assert response.json()["error"] is None
+            assert warmup.await_count == 2
+
 
 class TestDocumentManagement:
     """Test document management endpoints."""
@@ -637,3 +690,128 @@ class TestErrorHandling:
 
         # Should fail validation
         assert response.status_code == 422
+
+
+class FakeChatService:
+    """Chat service that streams fixed events without retrieval or an LLM."""
+
+    def __init__(self, tokens, error=None):
+        self.tokens = tokens
+        self.error = error
+        self.is_disconnected = None
+
+    async def generate_response_events(
+        self, user_message, conversation_history=None, session_id=None, is_disconnected=None
+    ):
+        self.is_disconnected = is_disconnected
+        yield {
+            "event": "retrieval",
+            "data": {
+                "sources": [{"type": "indexed_doc", "title": "GET /users", "score": 0.9}],
+                "scraped_urls": [],
+                "failed_urls": [],
+                "indexed_docs": 0,
+                "context_results": 1,
+            },
+        }
+        for token in self.tokens:
+            yield {"event": "token", "data": {"content": token}}
+        if self.error is not None:
+            raise self.error
+        yield {"event": "done", "data": {"response": "".join(self.tokens)}}
+
+
+def parse_sse(body):
+    """Split a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestChatStream:
+    """Test the Server-Sent Events chat endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def no_auth(self, client):
+        """Bypass API key checks."""
+        client.app.dependency_overrides[verify_api_key] = lambda: "test"
+        yield
+        client.app.dependency_overrides.pop(verify_api_key, None)
+
+    def stream(self, client, service, **form):
+        """POST /chat/stream with a fake chat service and parse the events."""
+        with patch("src.services.chat_service.get_chat_service", return_value=service):
+            response = client.post("/chat/stream", data={"message": "list users", **form})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        return parse_sse(response.text)
+
+    def test_event_sequence(self, client):
+        """Test that retrieval, token and done events are emitted in order."""
+        service = FakeChatService(["Use ", "GET /users"])
+        events = self.stream(client, service)
+
+        assert service.is_disconnected is not None
+        assert [name for name, _ in events] == ["retrieval", "token", "token", "done"]
+        assert events[0][1]["sources"][0]["title"] == "GET /users"
+        assert [data["content"] for name, data in events if name == "token"] == ["Use ", "GET /users"]
+
+        done = events[-1][1]
+        assert done["response_length"] == len("Use GET /users")
+        assert done["time_to_first_token_ms"] <= done["total_ms"]
+
+    def test_saves_turn_to_session(self, client):
+        """Test that the streamed answer is saved to the session history."""
+        session_id = client.post("/sessions", json={}).json()["session"]["session_id"]
+
+        self.stream(client, FakeChatService(["Hello", " there"]), session_id=session_id)
+
+        history = client.get(f"/sessions/{session_id}").json()["conversation_history"]
+        assert [m["role"] for m in history] == ["user", "assistant"]
+        assert history[1]["content"] == "Hello there"
+
+    def test_error_event(self, client):
+        """Test that a failure mid-stream is reported as an error event."""
+        events = self.stream(client, FakeChatService(["partial"], error=RuntimeError("LLM down")))
+
+        assert [name for name, _ in events] == ["retrieval", "token", "error"]
+        assert "LLM down" in events[-1][1]["detail"]
+
+    def test_disconnect_stops_stream_and_records_cancellation(self, client):
+        """Test that a detected disconnect ends the stream without an error event."""
+        PerformanceMonitor.reset()
+        cancelled = RequestCancelledError("Client disconnected", details={"stage": "generation"})
+
+        events = self.stream(client, FakeChatService(["partial"], error=cancelled))
+
+        assert [name for name, _ in events] == ["retrieval", "token"]
+        cancellations = PerformanceMonitor.get_instance().cancellations["chat_stream"]
+        assert cancellations.stages == {"generation": 1}
+
+
+class TestSessionEndpoints:
+    """Test session management endpoints."""
+
+    def test_delete_session_runs_listeners_off_the_event_loop(self, client):
+        """Test that session removal (and its document cleanup) runs on a worker thread."""
+        client.app.dependency_overrides[verify_api_key] = lambda: "test"
+        session_id = client.post("/sessions", json={}).json()["session"]["session_id"]
+        threads = []
+
+        def listener(session_ids):
+            threads.append(threading.current_thread().name)
+
+        get_session_manager().add_removal_listener(listener)
+
+        try:
+            response = client.delete(f"/sessions/{session_id}")
+        finally:
+            get_session_manager()._removal_listeners.pop(listener, None)
+            client.app.dependency_overrides.pop(verify_api_key, None)
+
+        assert response.status_code == 200
+        assert client.get(f"/sessions/{session_id}").status_code == 404
+        assert len(threads) == 1 and threads[0].startswith(f"{INGEST_POOL}-worker")
@@ -0,0 +1,83 @@
+"""
+Import-time regression tests for the CLI entry point.
+
+Runs ``python -X importtime`` in a fresh interpreter and checks that
+starting the CLI does not import the embedding model, vector store or LLM
+stacks, and that the import stays within a time budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Packages that only specific commands need
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "chromadb",
+    "langchain_core",
+    "langgraph",
+    "groq",
+    "ollama",
+    "prance",
+]
+
+# Generous budget: the CLI imports in well under a second without the
+# heavy packages, while importing torch alone takes several seconds
+CLI_IMPORT_BUDGET_S = 3.0
+
+
+def import_profile(statement: str) -> Dict[str, int]:
+    """
+    Run a statement under ``-X importtime``.
+
+    Returns:
+        Cumulative import time in microseconds per imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        profile[module.strip()] = int(cumulative)
+    return profile
+
+
+class TestCLIImportTime:
+    """Test that CLI startup stays light."""
+
+    @pytest.fixture(scope="class")
+    def cli_profile(self):
+        """Import profile of the CLI entry point module."""
+        return import_profile("import api_assistant_cli")
+
+    def test_heavy_modules_not_imported(self, cli_profile):
+        """Test that the CLI does not import model, database or LLM packages."""
+        imported = {module for module in cli_profile if module.split(".")[0] in HEAVY_MODULES}
+        assert not imported
+
+    def test_core_package_is_lazy(self):
+        """Test that importing a light src.core module skips the heavy ones."""
+        profile = import_profile("import src.core.exceptions")
+
+        assert "src.core.exceptions" in profile
+        assert "src.core.vector_store" not in profile
+        assert "src.core.embeddings" not in profile
+
+    def test_import_within_budget(self, cli_profile):
+        """Test that importing the CLI stays within the time budget."""
+        assert cli_profile["api_assistant_cli"] / 1_000_000 < CLI_IMPORT_BUDGET_S
@@ -12,6 +12,8 @@ Tests filtering functionality including:
 - Edge cases
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from src.core.advanced_filtering import (
@@ -723,3 +725,69 @@ class TestIntegrationScenarios:
         # Version facet
         assert facets["version"].values["v1"] == 3
         assert facets["version"].values["v2"] == 1
+
+
+class TestFilterCompilation:
+    """Test compiled filter predicates."""
+
+    def test_compiled_predicate_is_cached(self):
+        """Test that a filter is compiled once."""
+        f = FilterBuilder.and_filters(
+            FilterBuilder.eq("method", "GET"),
+            FilterBuilder.metadata("path", FilterOperator.REGEX, r"^/users"),
+        )
+
+        with patch("src.core.advanced_filtering.re.compile", wraps=__import__("re").compile) as compile_:
+            for _ in range(100):
+                f.matches({"method": "GET", "path": "/users/1"})
+
+        assert compile_.call_count == 1
+        assert f.compile() is f.compile()
+
+    def test_and_evaluates_selective_branch_first(self):
+        """Test that AND short-circuits on the most selective cheap branch."""
+
+        class RecordingDict(dict):
+            accessed = []
+
+            def get(self, key, default=None):
+                self.accessed.append(key)
+                return super().get(key, default)
+
+        f = FilterBuilder.and_filters(
+            FilterBuilder.ne("status", "deprecated"),
+            FilterBuilder.eq("method", "POST"),
+        )
+
+        assert not f.matches(RecordingDict(method="GET", status="active"))
+        assert RecordingDict.accessed == ["method"]
+
+    def test_in_list_with_unhashable_values(self):
+        """Test that membership keeps list semantics for unhashable items."""
+        f = FilterBuilder.in_list("tags", [["a", "b"], "c"])
+
+        assert f.matches({"tags": ["a", "b"]})
+        assert f.matches({"tags": "c"})
+        assert not f.matches({"tags": "a"})
+
+    def test_invalid_regex_never_matches(self):
+        """Test that an invalid pattern compiles to a predicate that is always False."""
+        f = FilterBuilder.metadata("path", FilterOperator.REGEX, "[unclosed")
+
+        assert f.matches({"path": "[unclosed"}) is False
+
+    def test_fingerprint_identifies_semantics(self):
+        """Test that equal filters share a fingerprint and different ones do not."""
+        def build(value):
+            return FilterBuilder.and_filters(
+                FilterBuilder.eq("method", value),
+                FilterBuilder.content_contains("user"),
+            )
+
+        compiled = build("GET")
+        compiled.matches({"method": "GET"}, "user")
+
+        assert compiled.fingerprint() == build("GET").fingerprint()
+        assert build("GET").fingerprint() != build("POST").fingerprint()
+        assert FilterBuilder.in_list("tag", ["a"]).fingerprint() != FilterBuilder.eq("tag", "a").fingerprint()
+
@@ -0,0 +1,108 @@
+"""
+Tests for request-scoped cancellation helpers.
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.cancellation import check_disconnected, run_until_disconnected
+from src.core.exceptions import RequestCancelledError
+
+
+class FakeClient:
+    """Disconnect check that reports a disconnect after a number of calls."""
+
+    def __init__(self, disconnect_after=None):
+        self.calls = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self):
+        self.calls += 1
+        return self.disconnect_after is not None and self.calls > self.disconnect_after
+
+
+class TestCheckDisconnected:
+    """Test the between-stage check."""
+
+    @pytest.mark.asyncio
+    async def test_connected_client_passes(self):
+        """Test that nothing happens while the client is connected."""
+        await check_disconnected(FakeClient().is_disconnected, "search")
+        await check_disconnected(None, "search")
+
+    @pytest.mark.asyncio
+    async def test_disconnected_client_raises(self):
+        """Test that a disconnect raises with the stage name."""
+        with pytest.raises(RequestCancelledError) as exc_info:
+            await check_disconnected(FakeClient(disconnect_after=0).is_disconnected, "search")
+
+        assert exc_info.value.details["stage"] == "search"
+
+
+class TestRunUntilDisconnected:
+    """Test cancelling a running stage on disconnect."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Test that a stage finishing first returns its result."""
+        async def stage():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        result = await run_until_disconnected(stage(), FakeClient().is_disconnected, "generation", poll_interval=0.001)
+
+        assert result == "done"
+
+    @pytest.mark.asyncio
+    async def test_stage_errors_propagate(self):
+        """Test that a failing stage raises its own error."""
+        async def stage():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            await run_until_disconnected(stage(), FakeClient().is_disconnected, "generation")
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_stage(self):
+        """Test that the stage is cancelled once the client disconnects."""
+        cancelled = asyncio.Event()
+
+        async def stage():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client = FakeClient(disconnect_after=2)
+        with pytest.raises(RequestCancelledError) as exc_info:
+            await run_until_disconnected(stage(), client.is_disconnected, "generation", poll_interval=0.001)
+
+        assert exc_info.value.details["stage"] == "generation"
+        assert cancelled.is_set()
+        assert client.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_outer_cancellation_cancels_stage(self):
+        """Test that cancelling the caller does not leave the stage running."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def stage():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(
+            run_until_disconnected(stage(), FakeClient().is_disconnected, "generation", poll_interval=0.001)
+        )
+        await started.wait()
+        caller.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert cancelled.is_set()
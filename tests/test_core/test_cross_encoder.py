@@ -9,6 +9,8 @@ Tests cross-encoder based re-ranking functionality including:
 - Integration with different models
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from src.core.cross_encoder import (
@@ -105,6 +107,16 @@ class TestCrossEncoderRerankerInit:
         # Model should be able to make predictions
         assert hasattr(reranker.model, "predict")
 
+    def test_backend_reports_fallback(self):
+        """Test that the backend attribute reflects the backend that loaded."""
+        with patch(
+            "src.core.cross_encoder.load_cross_encoder",
+            return_value=(MagicMock(), "torch"),
+        ):
+            reranker = CrossEncoderReranker(backend="onnx", use_cache=False)
+
+        assert reranker.backend == "torch"
+
 
 class TestCrossEncoderReranking:
     """Test cross-encoder re-ranking functionality."""
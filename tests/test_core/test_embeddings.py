@@ -0,0 +1,262 @@
+"""
+Tests for the embedding micro-batcher and multi-process bulk embedding.
+"""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.core.cache import EmbeddingCache
+from src.core.embeddings import EmbeddingBatcher, EmbeddingService
+from src.core.performance import PerformanceMonitor
+
+
+class RecordingEncoder:
+    """Encoder that records each batch and blocks until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, texts):
+        self.entered.set()
+        self.release.wait()
+        self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def fresh_monitor():
+    """Start every test with empty metrics."""
+    PerformanceMonitor.reset()
+    yield
+    PerformanceMonitor.reset()
+
+
+@pytest.fixture
+def encoder():
+    """Encoder that does not block unless a test clears its release event."""
+    return RecordingEncoder()
+
+
+class TestEmbeddingBatcher:
+    """Test coalescing of concurrent embedding requests."""
+
+    def test_single_request(self, encoder):
+        """Test that a lone request is encoded and returned."""
+        batcher = EmbeddingBatcher(encoder, max_wait_ms=1)
+
+        embedding = batcher.embed("abc")
+        batcher.close()
+
+        assert np.array_equal(embedding, [3.0, 1.0])
+        assert encoder.batches == [["abc"]]
+
+    def test_concurrent_requests_share_a_batch(self, encoder):
+        """Test that requests queued during an encode form one batch."""
+        batcher = EmbeddingBatcher(encoder, max_batch_size=8, max_wait_ms=1)
+        encoder.release.clear()
+        first = batcher.submit("x")
+        assert encoder.entered.wait(timeout=5)
+
+        # Queue more texts while the first encode is blocked
+        futures = [batcher.submit("y" * n) for n in range(1, 6)]
+        encoder.release.set()
+
+        assert np.array_equal(first.result(timeout=5), [1.0, 1.0])
+        assert [f.result(timeout=5)[0] for f in futures] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        batcher.close()
+
+        assert len(encoder.batches) == 2
+        assert encoder.batches[1] == ["y" * n for n in range(1, 6)]
+
+        metrics = PerformanceMonitor.get_instance().batches["query_embedding"]
+        assert metrics.batches == 2
+        assert metrics.max_batch_size == 5
+
+    def test_max_batch_size_respected(self, encoder):
+        """Test that a batch never exceeds max_batch_size."""
+        batcher = EmbeddingBatcher(encoder, max_batch_size=3, max_wait_ms=50)
+        encoder.release.clear()
+        futures = [batcher.submit(str(i)) for i in range(7)]
+        encoder.release.set()
+
+        for future in futures:
+            future.result(timeout=5)
+        batcher.close()
+
+        assert all(len(batch) <= 3 for batch in encoder.batches)
+        assert sum(len(batch) for batch in encoder.batches) == 7
+
+    def test_duplicate_texts_encoded_once(self, encoder):
+        """Test that identical queued texts share one encoded row."""
+        batcher = EmbeddingBatcher(encoder, max_wait_ms=1)
+        encoder.release.clear()
+        batcher.submit("warm")
+        assert encoder.entered.wait(timeout=5)
+        futures = [batcher.submit("same") for _ in range(4)]
+        encoder.release.set()
+
+        results = [f.result(timeout=5) for f in futures]
+        batcher.close()
+
+        assert encoder.batches[1] == ["same"]
+        assert all(np.array_equal(r, [4.0, 1.0]) for r in results)
+
+    def test_encode_error_propagates(self):
+        """Test that an encode failure is raised to every waiting caller."""
+        def failing(texts):
+            raise RuntimeError("model failed")
+
+        batcher = EmbeddingBatcher(failing, max_wait_ms=1)
+
+        with pytest.raises(RuntimeError, match="model failed"):
+            batcher.embed("abc")
+        batcher.close()
+
+    def test_closed_batcher_rejects_requests(self, encoder):
+        """Test that submitting after close raises."""
+        batcher = EmbeddingBatcher(encoder)
+        batcher.close()
+
+        with pytest.raises(RuntimeError):
+            batcher.submit("abc")
+
+    @pytest.mark.asyncio
+    async def test_aembed(self, encoder):
+        """Test that concurrent async callers are coalesced."""
+        batcher = EmbeddingBatcher(encoder, max_batch_size=16, max_wait_ms=20)
+
+        results = await asyncio.gather(*(batcher.aembed("t" * n) for n in range(1, 5)))
+        batcher.close()
+
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0, 4.0]
+        assert len(encoder.batches) < 4
+
+    @pytest.mark.asyncio
+    async def test_async_queries_share_a_batch_beyond_pool_size(self, encoder):
+        """Test that more concurrent async queries than query pool workers form one batch."""
+        service = object.__new__(EmbeddingService)
+        service._cache = EmbeddingCache()
+        service._batcher = EmbeddingBatcher(encoder, max_batch_size=64, max_wait_ms=1)
+        callers = settings.query_executor_workers * 3
+        encoder.release.clear()
+
+        first = asyncio.ensure_future(service.aembed_query_np("x"))
+        assert await asyncio.to_thread(encoder.entered.wait, 5)
+
+        # Queue the rest while the first encode is blocked
+        rest = [asyncio.ensure_future(service.aembed_query_np("y" * n)) for n in range(1, callers + 1)]
+        await asyncio.sleep(0.05)
+        encoder.release.set()
+        results = await asyncio.gather(first, *rest)
+        service._batcher.close()
+
+        assert [r[0] for r in results[1:]] == [float(n) for n in range(1, callers + 1)]
+        metrics = PerformanceMonitor.get_instance().batches["query_embedding"]
+        assert metrics.max_batch_size == callers
+
+        # Results are cached for the synchronous path
+        assert service.embed_query_np("yy")[0] == 2.0
+        assert len(encoder.batches) == 2
+
+
+@pytest.fixture
+def bulk_service(monkeypatch):
+    """EmbeddingService with a mock model and a 4-process pool above 10 texts."""
+    monkeypatch.setattr(settings, "embedding_process_pool_workers", 4)
+    monkeypatch.setattr(settings, "embedding_process_pool_threshold", 10)
+    monkeypatch.setattr(EmbeddingService, "_process_pool", None)
+    monkeypatch.setattr(EmbeddingService, "_process_pool_failed", False)
+
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **kwargs: np.ones((len(texts), 2))
+    model.start_multi_process_pool.return_value = {"processes": []}
+    model.encode_multi_process.side_effect = (
+        lambda texts, pool, **kwargs: np.arange(len(texts) * 2, dtype=np.float64).reshape(-1, 2)
+    )
+
+    service = object.__new__(EmbeddingService)
+    service._model = model
+    with patch("src.core.embeddings.SentenceTransformer.stop_multi_process_pool"):
+        yield service
+
+
+class TestBulkEmbedding:
+    """Test fan-out of large batches to the process pool."""
+
+    def test_small_batch_encoded_in_process(self, bulk_service):
+        """Test that batches below the threshold do not start the pool."""
+        embeddings = bulk_service._encode_bulk(["a"] * 5)
+
+        assert embeddings.shape == (5, 2)
+        bulk_service.model.start_multi_process_pool.assert_not_called()
+
+    def test_large_batch_uses_pool(self, bulk_service):
+        """Test that large batches are encoded by the pool as float32 in order."""
+        embeddings = bulk_service._encode_bulk([str(i) for i in range(12)], batch_size=8)
+
+        bulk_service.model.start_multi_process_pool.assert_called_once_with(target_devices=["cpu"] * 4)
+        bulk_service.model.encode.assert_not_called()
+        assert embeddings.dtype == np.float32
+        assert embeddings[:, 0].tolist() == [float(2 * i) for i in range(12)]
+
+        # The pool is reused
+        bulk_service._encode_bulk([str(i) for i in range(12)])
+        bulk_service.model.start_multi_process_pool.assert_called_once()
+
+    def test_concurrent_callers_take_turns_on_the_pool(self, bulk_service):
+        """Test that concurrent bulk encodes never share the pool's queues."""
+        active = []
+        overlaps = []
+
+        def encode_multi_process(texts, pool, **kwargs):
+            active.append(texts)
+            overlaps.append(len(active))
+            threading.Event().wait(0.05)
+            active.remove(texts)
+            return np.array([[float(text), 0.0] for text in texts])
+
+        bulk_service.model.encode_multi_process.side_effect = encode_multi_process
+        batches = [[str(caller * 100 + i) for i in range(12)] for caller in range(4)]
+        results = [None] * len(batches)
+
+        def encode(caller):
+            results[caller] = bulk_service._encode_bulk(batches[caller])
+
+        threads = [threading.Thread(target=encode, args=(caller,)) for caller in range(len(batches))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(overlaps) == 1
+        for batch, embeddings in zip(batches, results):
+            assert embeddings[:, 0].tolist() == [float(text) for text in batch]
+
+    def test_pool_start_failure_falls_back(self, bulk_service):
+        """Test that a pool that cannot start falls back to in-process encoding."""
+        bulk_service.model.start_multi_process_pool.side_effect = OSError("no fork")
+
+        embeddings = bulk_service._encode_bulk(["a"] * 12)
+        bulk_service._encode_bulk(["a"] * 12)
+
+        assert embeddings.shape == (12, 2)
+        bulk_service.model.start_multi_process_pool.assert_called_once()
+        assert bulk_service.model.encode.call_count == 2
+
+    def test_pool_encode_failure_falls_back(self, bulk_service):
+        """Test that a failing pool is stopped and the batch encoded in-process."""
+        bulk_service.model.encode_multi_process.side_effect = RuntimeError("worker died")
+
+        embeddings = bulk_service._encode_bulk(["a"] * 12)
+
+        assert embeddings.shape == (12, 2)
+        assert EmbeddingService._process_pool is None
+        assert EmbeddingService._process_pool_failed
@@ -2,6 +2,7 @@
 Tests for error handling, circuit breaker, and health check systems.
 """
 
+import asyncio
 import time
 from unittest.mock import Mock, patch
 
@@ -266,6 +267,35 @@ class TestCircuitBreaker:
         assert result2 == "success"
         assert cb.failure_count == 0  # Reset after success
 
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_call_frees_the_slot(self):
+        """Test that cancelling the recovery test call admits the next call."""
+        cb = CircuitBreaker(name="test", failure_threshold=1, timeout_duration=0)
+
+        async def failing_operation():
+            raise Exception("Failure")
+
+        async def hanging_operation():
+            await asyncio.sleep(10)
+
+        async def succeeding_operation():
+            return "success"
+
+        with pytest.raises(Exception):
+            await cb.acall(failing_operation)
+        assert cb.state == CircuitState.OPEN
+
+        # The recovery test call is cancelled (e.g. client disconnected)
+        probe = asyncio.ensure_future(cb.acall(hanging_operation))
+        await asyncio.sleep(0)
+        assert cb.state == CircuitState.HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+        assert await cb.acall(succeeding_operation) == "success"
+        assert cb.state == CircuitState.CLOSED
+
 
 class TestHealthCheck:
     """Test health check system."""
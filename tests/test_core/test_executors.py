@@ -0,0 +1,104 @@
+"""
+Tests for the executor pools used by async callers.
+"""
+
+import asyncio
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from src.config import settings
+from src.core.executors import (
+    INGEST_POOL,
+    QUERY_POOL,
+    SEARCH_LEG_POOL,
+    get_executor,
+    release_workers,
+    run_in_executor,
+    shutdown_executors,
+    try_reserve_workers,
+)
+
+_request_id: ContextVar[str] = ContextVar("test_request_id", default="")
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    """Start and end every test without shared pools."""
+    shutdown_executors()
+    yield
+    shutdown_executors()
+
+
+class TestExecutors:
+    """Test executor pool management."""
+
+    def test_pools_are_shared_and_separate(self):
+        """Test that each pool is created once and pools are distinct."""
+        assert get_executor(QUERY_POOL) is get_executor(QUERY_POOL)
+        assert get_executor(QUERY_POOL) is not get_executor(INGEST_POOL)
+
+    def test_unknown_pool_rejected(self):
+        """Test that unknown pool names raise."""
+        with pytest.raises(ValueError):
+            get_executor("unknown")
+
+    def test_shutdown_recreates_on_next_use(self):
+        """Test that pools are recreated after shutdown."""
+        executor = get_executor(QUERY_POOL)
+        shutdown_executors()
+
+        assert get_executor(QUERY_POOL) is not executor
+
+    def test_worker_reservations(self):
+        """Test that reservations are all-or-nothing and bounded by the pool size."""
+        size = max(2, settings.search_leg_executor_workers)
+        assert try_reserve_workers(SEARCH_LEG_POOL, size - 1)
+
+        # Only one worker left: a request for two reserves nothing
+        assert not try_reserve_workers(SEARCH_LEG_POOL, 2)
+        assert try_reserve_workers(SEARCH_LEG_POOL, 1)
+
+        release_workers(SEARCH_LEG_POOL, size)
+        assert try_reserve_workers(SEARCH_LEG_POOL, size)
+        release_workers(SEARCH_LEG_POOL, size)
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_thread(self):
+        """Test that work runs on a worker thread of the requested pool."""
+        thread_name = await run_in_executor(INGEST_POOL, lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("ingest-worker")
+        assert thread_name != threading.current_thread().name
+
+    @pytest.mark.asyncio
+    async def test_passes_arguments_and_context(self):
+        """Test that arguments and context variables reach the worker."""
+        _request_id.set("req-1")
+
+        def work(a, b=0):
+            return a + b, _request_id.get()
+
+        assert await run_in_executor(QUERY_POOL, work, 1, b=2) == (3, "req-1")
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Test that blocking work does not stall other coroutines."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(timeout=5)
+            return "done"
+
+        task = asyncio.create_task(run_in_executor(QUERY_POOL, blocking))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+
+        # The loop still runs other coroutines while the worker is blocked
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        release.set()
+        assert await task == "done"
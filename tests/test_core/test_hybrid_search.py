@@ -3,16 +3,21 @@ Comprehensive tests for hybrid search (BM25 + Vector).
 
 Tests cover:
 - BM25 tokenization and scoring
+- Inverted-index BM25 equivalence and top-k pruning
 - Reciprocal Rank Fusion (RRF)
 - Weighted Score Fusion
 - Hybrid search integration
 - Edge cases and error handling
 """
 
+import random
+from unittest.mock import patch
+
 import pytest
 from src.core.hybrid_search import (
     BM25,
     HybridSearch,
+    InvertedIndexBM25,
     SearchResult,
     create_bm25_index,
     get_bm25,
@@ -304,6 +309,264 @@ class TestBM25Search:
         assert score > 0
 
 
+class TestInvertedIndexBM25:
+    """Test the inverted-index BM25 engine against the reference BM25."""
+
+    @pytest.fixture
+    def zipf_corpus(self):
+        """Synthetic corpus with skewed term frequencies."""
+        rng = random.Random(7)
+        vocab = [f"term{i}" for i in range(300)]
+        weights = [1.0 / (i + 1) for i in range(300)]
+        corpus = [
+            " ".join(rng.choices(vocab, weights=weights, k=rng.randint(1, 40)))
+            for _ in range(400)
+        ]
+        queries = [
+            " ".join(rng.choices(vocab, weights=weights, k=rng.randint(1, 5)))
+            for _ in range(50)
+        ]
+        return corpus, queries
+
+    def test_search_matches_reference(self, zipf_corpus):
+        """Test identical results and scores to BM25 for varying top_k."""
+        corpus, queries = zipf_corpus
+        reference = BM25()
+        reference.fit(corpus)
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus)
+
+        for query in queries:
+            for top_k in (1, 3, 10, 1000):
+                assert inverted.search(query, top_k=top_k) == reference.search(
+                    query, top_k=top_k
+                )
+
+    def test_score_and_idf_match_reference(self, zipf_corpus):
+        """Test that per-document scores and IDFs are identical."""
+        corpus, queries = zipf_corpus
+        reference = BM25(k1=1.2, b=0.6)
+        reference.fit(corpus)
+        inverted = InvertedIndexBM25(k1=1.2, b=0.6)
+        inverted.fit(corpus)
+
+        assert inverted.idf == reference.idf
+        assert inverted.avgdl == reference.avgdl
+        for doc_idx in range(0, len(corpus), 37):
+            assert inverted.score(queries[0], doc_idx) == reference.score(queries[0], doc_idx)
+
+    def test_repeated_query_terms_are_weighted(self):
+        """Test that duplicate query tokens count like in BM25."""
+        corpus = ["alpha beta", "beta gamma", "alpha alpha gamma"]
+        reference = BM25()
+        reference.fit(corpus)
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus)
+
+        assert inverted.search("alpha alpha beta", top_k=3) == reference.search(
+            "alpha alpha beta", top_k=3
+        )
+
+    def test_postings_only_contain_matching_documents(self):
+        """Test that posting lists are sorted and hold term frequencies."""
+        inverted = InvertedIndexBM25()
+        inverted.fit(["cat dog", "dog dog bird", "cat"], ["a", "b", "c"])
+
+        docs, tfs = inverted._postings(inverted.vocabulary["dog"])
+        assert docs.tolist() == [0, 1]
+        assert tfs.tolist() == [1, 2]
+        assert inverted.doc_len.tolist() == [2, 3, 1]
+
+    def test_empty_and_unknown_queries(self):
+        """Test empty index, unknown terms and non-positive top_k."""
+        inverted = InvertedIndexBM25()
+        assert inverted.search("anything") == []
+
+        inverted.fit(["some document"])
+        assert inverted.search("unknown") == []
+        assert inverted.search("document", top_k=0) == []
+        assert inverted.score("document", 5) == 0.0
+
+    def test_fit_raises_error_on_mismatched_doc_ids(self):
+        """Test that fit validates doc_ids like BM25."""
+        with pytest.raises(ValueError, match="doc_ids length must match corpus length"):
+            InvertedIndexBM25().fit(["doc1", "doc2"], ["id1"])
+
+    def test_incremental_updates_match_refit(self, zipf_corpus):
+        """Test that add/remove/update give the same results as a fresh fit."""
+        corpus, queries = zipf_corpus
+        live = {f"id{i}": text for i, text in enumerate(corpus[:200])}
+        inverted = InvertedIndexBM25()
+        inverted.fit(list(live.values()), list(live.keys()))
+
+        for i, text in enumerate(corpus[200:260]):
+            inverted.add(f"new{i}", text)
+            live[f"new{i}"] = text
+        for doc_id in [f"id{i}" for i in range(0, 200, 9)]:
+            assert inverted.remove(doc_id) is True
+            del live[doc_id]
+        inverted.update("id1", corpus[300])
+        del live["id1"]
+        live["id1"] = corpus[300]
+
+        reference = BM25()
+        reference.fit(list(live.values()), list(live.keys()))
+
+        assert inverted.num_docs == reference.num_docs
+        assert inverted.avgdl == reference.avgdl
+        assert inverted.idf == reference.idf
+        for query in queries:
+            assert inverted.search(query, top_k=10) == reference.search(query, top_k=10)
+
+    def test_postings_merged_once_per_query_term(self, zipf_corpus):
+        """Test that delta and tombstone merging happens once per term, not per candidate."""
+        corpus, queries = zipf_corpus
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus[:300], [f"id{i}" for i in range(300)])
+        for i, text in enumerate(corpus[300:]):
+            inverted.add(f"new{i}", text)
+        for i in range(0, 300, 7):
+            inverted.remove(f"id{i}")
+        inverted.search("term0 term1 term2")  # Fill the per-term bound cache
+
+        with patch.object(inverted, "_postings", wraps=inverted._postings) as postings:
+            inverted.search("term0 term1 term2", top_k=20)
+
+        assert postings.call_count == 3
+
+    def test_remove_unknown_document(self):
+        """Test that removing an unknown ID is a no-op."""
+        inverted = InvertedIndexBM25()
+        inverted.fit(["cat dog"], ["a"])
+
+        assert inverted.remove("missing") is False
+        assert inverted.num_docs == 1
+
+    def test_add_to_empty_index(self):
+        """Test building an index purely through add()."""
+        inverted = InvertedIndexBM25()
+        inverted.add("a", "oauth token flow")
+        inverted.add("b", "api key header")
+
+        results = inverted.search("oauth", top_k=5)
+
+        assert [doc_id for doc_id, _ in results] == ["a"]
+        assert "b" in inverted
+
+    def test_compaction_drops_deleted_documents(self):
+        """Test that compaction rebuilds the base segment from live postings."""
+        inverted = InvertedIndexBM25()
+        inverted.fit(["alpha beta", "beta gamma", "gamma delta"], ["a", "b", "c"])
+        inverted.add("d", "alpha delta")
+        inverted.remove("b")
+        before = inverted.search("alpha gamma", top_k=5)
+
+        inverted.compact()
+
+        assert inverted.doc_ids == ["a", "c", "d"]
+        assert "beta" in inverted.vocabulary
+        assert inverted.search("alpha gamma", top_k=5) == before
+
+    def test_allowed_ids_match_reference(self, zipf_corpus):
+        """Test that restricting to allowed documents matches the reference."""
+        corpus, queries = zipf_corpus
+        doc_ids = [f"doc_{i}" for i in range(len(corpus))]
+        allowed = doc_ids[::7] + ["unknown"]
+        reference = BM25()
+        reference.fit(corpus)
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus)
+
+        for query in queries:
+            expected = reference.search(query, top_k=5, allowed_ids=allowed)
+            assert inverted.search(query, top_k=5, allowed_ids=allowed) == expected
+            assert all(doc_id in allowed for doc_id, _ in expected)
+
+    def test_search_many_matches_single_queries(self, zipf_corpus):
+        """Test that batched search returns the per-query results."""
+        corpus, queries = zipf_corpus
+        allowed = [f"doc_{i}" for i in range(0, len(corpus), 3)]
+        reference = BM25()
+        reference.fit(corpus)
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus)
+
+        expected = [reference.search(q, top_k=5, allowed_ids=allowed) for q in queries]
+
+        assert reference.search_many(queries, top_k=5, allowed_ids=allowed) == expected
+        assert inverted.search_many(queries, top_k=5, allowed_ids=allowed) == expected
+        assert InvertedIndexBM25().search_many(queries) == [[] for _ in queries]
+
+    def test_save_and_load_round_trip(self, zipf_corpus, tmp_path):
+        """Test that a memory-mapped index returns identical results."""
+        corpus, queries = zipf_corpus
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus, [f"ü-{i}" for i in range(len(corpus))])
+        inverted.remove("ü-3")
+        path = tmp_path / "bm25.idx"
+
+        inverted.save(path, metadata={"generation": "abc"})
+        loaded = InvertedIndexBM25.load(path)
+
+        assert InvertedIndexBM25.read_header(path)["metadata"] == {"generation": "abc"}
+        assert loaded.num_docs == inverted.num_docs
+        for query in queries:
+            assert loaded.search(query, top_k=10) == inverted.search(query, top_k=10)
+
+        # Loaded arrays are read-only views; writes go to the delta segment
+        loaded.add("new", "term0 term1")
+        assert "new" in loaded
+
+    def test_save_over_mapped_file_unmaps_it_first(self, zipf_corpus, tmp_path):
+        """Test that saving over the loaded file closes the old mapping and remaps."""
+        corpus, queries = zipf_corpus
+        path = tmp_path / "bm25.idx"
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus, [f"doc-{i}" for i in range(len(corpus))])
+        inverted.save(path)
+
+        loaded = InvertedIndexBM25.load(path)
+        old_mapping = loaded._mapping
+        loaded.save(path, metadata={"generation": "next"})
+
+        assert old_mapping.closed
+        assert loaded._mapping is not None and not loaded._mapping.closed
+        assert InvertedIndexBM25.read_header(path)["metadata"] == {"generation": "next"}
+        for query in queries:
+            assert loaded.search(query, top_k=10) == inverted.search(query, top_k=10)
+
+    def test_close_unmaps_file(self, zipf_corpus, tmp_path):
+        """Test that a closed index no longer maps its file."""
+        corpus, _ = zipf_corpus
+        path = tmp_path / "bm25.idx"
+        inverted = InvertedIndexBM25()
+        inverted.fit(corpus, [f"doc-{i}" for i in range(len(corpus))])
+        inverted.save(path)
+
+        loaded = InvertedIndexBM25.load(path)
+        mapping = loaded._mapping
+        loaded.close()
+        path.unlink()
+
+        assert mapping.closed
+        assert loaded.num_docs == 0
+
+    def test_read_header_rejects_foreign_file(self, tmp_path):
+        """Test that files without the index magic are rejected."""
+        path = tmp_path / "bm25.idx"
+        path.write_bytes(b"not an index")
+
+        with pytest.raises(ValueError):
+            InvertedIndexBM25.read_header(path)
+
+    def test_create_bm25_index_uses_inverted_index(self):
+        """Test that the factory returns the inverted-index engine."""
+        bm25 = create_bm25_index([{"id": "doc1", "content": "first document"}])
+
+        assert isinstance(bm25, InvertedIndexBM25)
+        assert isinstance(bm25, BM25)
+
+
 class TestSearchResult:
     """Test SearchResult dataclass."""
 
@@ -420,6 +683,16 @@ class TestReciprocalRankFusion:
         assert score_low_k != score_high_k
 
 
+    def test_fuse_rankings_rewards_agreement(self):
+        """Test that documents ranked by several lists come first."""
+        merged = HybridSearch.fuse_rankings(
+            [["doc1", "doc2"], ["doc2", "doc3"], []], k=60
+        )
+
+        assert [doc_id for doc_id, _ in merged] == ["doc2", "doc1", "doc3"]
+        assert merged[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+
 class TestWeightedScoreFusion:
     """Test Weighted Score Fusion."""
 
@@ -0,0 +1,117 @@
+"""
+Tests for the embedding/cross-encoder inference backends.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.inference_backends import (
+    INT8_BACKEND,
+    ONNX_BACKEND,
+    TORCH_BACKEND,
+    embedding_agreement,
+    load_cross_encoder,
+    load_sentence_transformer,
+    validate_backend,
+)
+
+
+class TestBackendSelection:
+    """Test backend validation, loading and fallback."""
+
+    def test_validate_backend(self):
+        """Test that names are normalized and unknown names rejected."""
+        assert validate_backend(" ONNX ") == ONNX_BACKEND
+
+        with pytest.raises(ValueError):
+            validate_backend("tensorrt")
+
+    def test_torch_backend_loads_plain_model(self):
+        """Test that the default backend passes no backend argument."""
+        with patch("src.core.inference_backends.SentenceTransformer") as model_cls:
+            load_sentence_transformer("model", TORCH_BACKEND, device="cpu")
+
+        model_cls.assert_called_once_with("model", device="cpu")
+
+    def test_onnx_backend(self):
+        """Test that the ONNX backend is requested from sentence-transformers."""
+        with patch("src.core.inference_backends.SentenceTransformer") as model_cls:
+            _, backend = load_sentence_transformer("model", ONNX_BACKEND)
+
+        model_cls.assert_called_once_with("model", backend=ONNX_BACKEND)
+        assert backend == ONNX_BACKEND
+
+    def test_onnx_falls_back_to_torch(self):
+        """Test that a missing ONNX runtime falls back to the torch model."""
+        fallback = MagicMock()
+        with patch(
+            "src.core.inference_backends.SentenceTransformer",
+            side_effect=[ImportError("optimum not installed"), fallback],
+        ) as model_cls:
+            model, backend = load_sentence_transformer("model", ONNX_BACKEND)
+
+        assert model is fallback
+        assert backend == TORCH_BACKEND
+        assert model_cls.call_args_list[1].kwargs == {}
+
+    def test_onnx_export_failure_falls_back_to_torch(self):
+        """Test that ONNX export/load errors also fall back to the torch model."""
+        fallback = MagicMock()
+        with patch(
+            "src.core.inference_backends.CrossEncoder",
+            side_effect=[OSError("model.onnx not found and export failed"), fallback],
+        ):
+            model, backend = load_cross_encoder("model", ONNX_BACKEND)
+
+        assert model is fallback
+        assert backend == TORCH_BACKEND
+
+    def test_int8_quantizes_cross_encoder_module(self):
+        """Test that int8 quantizes the transformer wrapped by the cross-encoder."""
+        with patch("src.core.inference_backends.CrossEncoder") as model_cls, \
+                patch("src.core.inference_backends.quantize_int8") as quantize:
+            model, backend = load_cross_encoder("model", INT8_BACKEND, max_length=512)
+
+        model_cls.assert_called_once_with("model", max_length=512)
+        quantize.assert_called_once_with(model.model)
+        assert backend == INT8_BACKEND
+
+    def test_int8_failure_keeps_torch_model(self):
+        """Test that a failed quantization reports the unquantized torch backend."""
+        with patch("src.core.inference_backends.SentenceTransformer") as model_cls, \
+                patch("src.core.inference_backends.quantize_int8", side_effect=RuntimeError("no engine")):
+            model, backend = load_sentence_transformer("model", INT8_BACKEND)
+
+        assert model is model_cls.return_value
+        assert backend == TORCH_BACKEND
+
+
+class TestEmbeddingAgreement:
+    """Test the cosine agreement check."""
+
+    def test_identical_embeddings(self):
+        """Test that identical embeddings agree perfectly."""
+        embeddings = np.random.default_rng(0).normal(size=(10, 8))
+
+        agreement = embedding_agreement(embeddings, embeddings)
+
+        assert agreement["mean_cosine"] == pytest.approx(1.0, abs=1e-6)
+        assert agreement["min_cosine"] == pytest.approx(1.0, abs=1e-6)
+
+    def test_scaled_and_perturbed_embeddings(self):
+        """Test that scale is ignored and disagreement lowers the minimum."""
+        reference = np.eye(4)
+        candidate = np.eye(4) * 3
+        candidate[3] = [1.0, 0.0, 0.0, 0.0]
+
+        agreement = embedding_agreement(reference, candidate)
+
+        assert agreement["min_cosine"] == pytest.approx(0.0)
+        assert agreement["mean_cosine"] == pytest.approx(0.75)
+
+    def test_shape_mismatch(self):
+        """Test that embeddings of different shapes are rejected."""
+        with pytest.raises(ValueError):
+            embedding_agreement(np.zeros((2, 4)), np.zeros((3, 4)))
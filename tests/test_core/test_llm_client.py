@@ -0,0 +1,372 @@
+"""
+Tests for the LLM client.
+
+Tests cover:
+- Shared client registry
+- Async chat over the providers' async clients
+- Retries, timeouts and circuit breaker on the async path
+- Async streaming
+- Pooled HTTP clients per event loop
+- Exact and semantic response cache
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import httpx
+import numpy as np
+import pytest
+from tenacity import wait_none
+
+from src.config import settings
+from src.core.cache import get_llm_response_cache, get_llm_semantic_cache
+from src.core.circuit_breaker import llm_circuit_breaker
+from src.core.exceptions import (
+    LLMCircuitBreakerOpen,
+    LLMConnectionError,
+    LLMResponseError,
+    LLMTimeoutError,
+)
+from src.core.llm_client import (
+    LLMClient,
+    aclose_async_clients,
+    get_async_http_client,
+    get_llm_client,
+    reset_llm_clients,
+)
+from src.core.performance import PerformanceMonitor
+
+
+def groq_response(content):
+    """Build a Groq chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def groq_chunk(content):
+    """Build a Groq streaming chunk."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeStream:
+    """Async iterator over chunks that records whether it was closed."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = list(chunks)
+        self.error = error
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.chunks:
+            return self.chunks.pop(0)
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration
+
+    async def close(self):
+        self.closed = True
+
+
+def reset_shared_state():
+    """Drop shared clients, cached responses and circuit breaker state."""
+    reset_llm_clients()
+    llm_circuit_breaker.reset()
+    get_llm_response_cache().clear()
+    get_llm_semantic_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    """Reset shared state around every test."""
+    reset_shared_state()
+    yield
+    reset_shared_state()
+
+
+@pytest.fixture
+def no_retry_wait():
+    """Retry immediately instead of backing off."""
+    with patch.object(LLMClient._achat_uncached.retry, "wait", wait_none()), \
+            patch.object(LLMClient._aopen_stream.retry, "wait", wait_none()):
+        yield
+
+
+@pytest.fixture
+def groq():
+    """LLMClient on Groq with a mocked async Groq client."""
+    client = LLMClient(provider="groq", model="test-model")
+    async_groq = MagicMock()
+    async_groq.chat.completions.create = AsyncMock()
+    with patch.object(LLMClient, "async_groq_client", new_callable=PropertyMock, return_value=async_groq):
+        yield client, async_groq.chat.completions.create
+
+
+class TestSharedClients:
+    """Test the process-wide LLMClient registry."""
+
+    def test_same_provider_and_model_share_a_client(self, monkeypatch):
+        """Test that repeated lookups return one instance per (provider, model)."""
+        monkeypatch.setattr(settings, "llm_provider", "groq")
+        monkeypatch.setattr(settings, "groq_general_model", "general")
+        monkeypatch.setattr(settings, "groq_code_model", "coder")
+
+        general = get_llm_client(agent_type="general")
+
+        assert get_llm_client() is general
+        assert get_llm_client(agent_type="code") is not general
+        assert get_llm_client(agent_type="code").model == "coder"
+
+    def test_reset(self, monkeypatch):
+        """Test that reset drops the shared instances."""
+        monkeypatch.setattr(settings, "llm_provider", "ollama")
+        first = get_llm_client()
+
+        reset_llm_clients()
+
+        assert get_llm_client() is not first
+
+
+class TestAsyncChat:
+    """Test achat/agenerate on the async provider clients."""
+
+    @pytest.mark.asyncio
+    async def test_achat(self, groq):
+        """Test that achat returns the completion text."""
+        client, create = groq
+        create.return_value = groq_response("hello")
+
+        response = await client.achat([{"role": "user", "content": "hi"}], max_tokens=16)
+
+        assert response == "hello"
+        assert create.await_args.kwargs["model"] == "test-model"
+        assert create.await_args.kwargs["max_tokens"] == 16
+
+    @pytest.mark.asyncio
+    async def test_agenerate_builds_messages(self, groq):
+        """Test that agenerate sends the system and user prompts."""
+        client, create = groq
+        create.return_value = groq_response("ok")
+
+        await client.agenerate("question", system_prompt="be brief")
+
+        assert create.await_args.kwargs["messages"] == [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": "question"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_retried(self, groq, no_retry_wait):
+        """Test that a transient connection error is retried."""
+        client, create = groq
+        create.side_effect = [httpx.ConnectError("refused"), groq_response("recovered")]
+
+        response = await client.achat([{"role": "user", "content": "hi"}])
+
+        assert response == "recovered"
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_enforced(self, groq, no_retry_wait):
+        """Test that a hung request raises LLMTimeoutError."""
+        client, create = groq
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        create.side_effect = hang
+
+        with pytest.raises(LLMTimeoutError):
+            await client.achat([{"role": "user", "content": "hi"}], timeout_seconds=0.01)
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_blocks_async_calls(self, groq, no_retry_wait, monkeypatch):
+        """Test that async failures open the shared circuit breaker."""
+        client, create = groq
+        create.side_effect = httpx.ConnectError("refused")
+        monkeypatch.setattr(llm_circuit_breaker, "failure_threshold", 3)
+
+        # Three attempts (with retries) open the circuit
+        with pytest.raises(LLMConnectionError):
+            await client.achat([{"role": "user", "content": "hi"}])
+
+        with pytest.raises(LLMCircuitBreakerOpen):
+            await client.achat([{"role": "user", "content": "hi"}])
+        assert create.await_count == 3
+
+
+class TestAsyncStream:
+    """Test achat_stream."""
+
+    @pytest.mark.asyncio
+    async def test_stream_chunks(self, groq):
+        """Test that text chunks are yielded in order and empty deltas skipped."""
+        client, create = groq
+        stream = FakeStream([groq_chunk("Hel"), groq_chunk(None), groq_chunk("lo")])
+        create.return_value = stream
+
+        chunks = [c async for c in client.achat_stream([{"role": "user", "content": "hi"}])]
+
+        assert chunks == ["Hel", "lo"]
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_when_consumer_stops(self, groq):
+        """Test that closing the generator early closes the provider stream."""
+        client, create = groq
+        stream = FakeStream([groq_chunk("a"), groq_chunk("b"), groq_chunk("c")])
+        create.return_value = stream
+
+        chunks = client.achat_stream([{"role": "user", "content": "hi"}])
+        assert await chunks.__anext__() == "a"
+        await chunks.aclose()
+
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_failure_before_first_chunk_is_retried(self, groq, no_retry_wait):
+        """Test that a stream failing before any output is reopened."""
+        client, create = groq
+        failing = FakeStream([], error=httpx.ReadError("reset"))
+        create.side_effect = [failing, FakeStream([groq_chunk("ok")])]
+
+        chunks = [c async for c in client.achat_stream([{"role": "user", "content": "hi"}])]
+
+        assert chunks == ["ok"]
+        assert failing.closed
+
+
+class FakeEmbeddingService:
+    """Embeds by keyword so near-identical prompts share a vector."""
+
+    KEYWORDS = ["user", "order", "delete"]
+
+    def embed_query_np(self, query):
+        return np.array([float(word in query) for word in self.KEYWORDS], dtype=np.float32)
+
+
+class TestResponseCache:
+    """Test the exact and semantic LLM response cache."""
+
+    MESSAGES = [{"role": "system", "content": "classify"}, {"role": "user", "content": "create a user"}]
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_served_from_cache(self, groq):
+        """Test that an identical low-temperature call skips the provider."""
+        client, create = groq
+        create.return_value = groq_response("intent: create")
+
+        first = await client.achat(self.MESSAGES, temperature=0.3)
+        second = await client.achat(list(self.MESSAGES), temperature=0.3)
+
+        assert first == second == "intent: create"
+        assert create.await_count == 1
+        metrics = PerformanceMonitor.get_instance().caches["llm_response_cache"]
+        assert metrics.hits >= 1
+
+    @pytest.mark.asyncio
+    async def test_parameters_are_part_of_the_key(self, groq):
+        """Test that other temperatures, token limits or models miss."""
+        client, create = groq
+        create.return_value = groq_response("ok")
+
+        await client.achat(self.MESSAGES, temperature=0.3)
+        await client.achat(self.MESSAGES, temperature=0.2)
+        await client.achat(self.MESSAGES, temperature=0.3, max_tokens=100)
+        client.model = "other-model"
+        await client.achat(self.MESSAGES, temperature=0.3)
+
+        assert create.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_opt_out_and_opt_in(self, groq):
+        """Test use_cache=False and caching of hotter calls on request."""
+        client, create = groq
+        create.return_value = groq_response("ok")
+
+        for _ in range(2):
+            await client.achat(self.MESSAGES, temperature=0.3, use_cache=False)
+        assert create.await_count == 2
+
+        # Above llm_cache_max_temperature only explicit opt-ins are cached
+        for _ in range(2):
+            await client.achat(self.MESSAGES, temperature=0.7)
+        assert create.await_count == 4
+        for _ in range(2):
+            await client.achat(self.MESSAGES, temperature=0.7, use_cache=True)
+        assert create.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, groq):
+        """Test that a failed call leaves nothing in the cache."""
+        client, create = groq
+        create.side_effect = [LLMResponseError("bad"), groq_response("ok")]
+
+        with pytest.raises(LLMResponseError):
+            await client.achat(self.MESSAGES, temperature=0.3)
+
+        assert await client.achat(self.MESSAGES, temperature=0.3) == "ok"
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier(self, groq, monkeypatch):
+        """Test that a near-identical prompt hits only with the semantic tier on."""
+        client, create = groq
+        client._embedding_service = FakeEmbeddingService()
+        create.return_value = groq_response("intent: create")
+        similar = [self.MESSAGES[0], {"role": "user", "content": "create the user"}]
+
+        await client.achat(self.MESSAGES, temperature=0.3)
+        await client.achat(similar, temperature=0.3)
+        assert create.await_count == 2
+
+        monkeypatch.setattr(settings, "llm_cache_semantic", True)
+        await client.achat(self.MESSAGES, temperature=0.3, max_tokens=64)
+        assert await client.achat(similar, temperature=0.3, max_tokens=64) == "intent: create"
+        assert create.await_count == 3
+
+        # Different earlier messages are a different scope
+        other_system = [{"role": "system", "content": "summarize"}, similar[1]]
+        await client.achat(other_system, temperature=0.3, max_tokens=64)
+        assert create.await_count == 4
+
+    def test_sync_generate(self, monkeypatch):
+        """Test that generate() shares the cache and honours the global switch."""
+        client = LLMClient(provider="groq", model="test-model")
+        provider = MagicMock(return_value="answer")
+        monkeypatch.setattr(client, "_generate_with_groq", provider)
+
+        client.generate("question", temperature=0.2)
+        client.generate("question", temperature=0.2)
+        assert provider.call_count == 1
+
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        client.generate("question", temperature=0.2)
+        assert provider.call_count == 2
+
+
+class TestPooledHttpClient:
+    """Test the shared keep-alive HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_reused_on_the_same_loop(self):
+        """Test that one pooled client serves the whole event loop."""
+        first = get_async_http_client()
+
+        assert get_async_http_client() is first
+
+        await aclose_async_clients()
+        assert first.is_closed
+        assert get_async_http_client() is not first
+        await aclose_async_clients()
+
+    def test_separate_pool_per_loop(self):
+        """Test that each event loop gets its own client."""
+        async def lookup():
+            client = get_async_http_client()
+            await aclose_async_clients()
+            return client
+
+        assert asyncio.run(lookup()) is not asyncio.run(lookup())
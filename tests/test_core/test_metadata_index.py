@@ -0,0 +1,193 @@
+"""
+Tests for the columnar metadata index.
+
+Compiled masks are checked against the reference semantics: ChromaDB for
+where dicts and ``Filter.matches`` for Filter objects.
+"""
+
+import random
+
+import chromadb
+import pytest
+
+from src.core.advanced_filtering import FilterBuilder, FilterOperator
+from src.core.metadata_index import MetadataIndex
+
+
+@pytest.fixture
+def corpus():
+    """Documents with mixed-type and partly missing metadata."""
+    rng = random.Random(3)
+    methods = ["GET", "POST", "PUT", "DELETE"]
+    apis = ["stripe", "github", "slack"]
+    ids, metadatas = [], []
+    for i in range(300):
+        metadata = {"method": rng.choice(methods), "version": rng.choice([1, 2, 2.5, 3])}
+        if rng.random() < 0.7:
+            metadata["api_name"] = rng.choice(apis)
+        if rng.random() < 0.3:
+            metadata["deprecated"] = rng.random() < 0.5
+        metadata["path"] = f"/v{rng.randint(1, 3)}/{rng.choice(['users', 'charges', 'repos'])}"
+        ids.append(f"doc-{i}")
+        metadatas.append(metadata)
+    return ids, metadatas
+
+
+@pytest.fixture
+def index(corpus):
+    """Index over the corpus."""
+    return MetadataIndex.build(*corpus)
+
+
+def selected(index, where):
+    """IDs selected by a where clause or filter."""
+    candidates = index.select(where)
+    return set(candidates.ids())
+
+
+class TestWhereCompilation:
+    """Test that where dicts match ChromaDB semantics."""
+
+    @pytest.mark.parametrize(
+        "where",
+        [
+            {"method": "POST"},
+            {"method": {"$ne": "GET"}},
+            {"api_name": {"$ne": "stripe"}},
+            {"api_name": {"$nin": ["stripe", "github"]}},
+            {"method": {"$in": ["PUT", "DELETE"]}},
+            {"version": 2},
+            {"version": {"$gte": 2}},
+            {"version": {"$lt": 3}},
+            {"deprecated": True},
+            {"$and": [{"method": "POST"}, {"api_name": "stripe"}]},
+            {"$or": [{"method": "GET"}, {"version": {"$gt": 2}}]},
+            {"unknown_field": "x"},
+        ],
+    )
+    def test_matches_chromadb(self, corpus, index, where):
+        """Test that the selected documents equal ChromaDB's where results."""
+        ids, metadatas = corpus
+        collection = chromadb.EphemeralClient().get_or_create_collection("metadata_index_test")
+        if collection.count() == 0:
+            collection.add(ids=ids, embeddings=[[1.0, 0.0]] * len(ids), metadatas=metadatas)
+
+        assert selected(index, where) == set(collection.get(where=where)["ids"])
+
+    def test_unsupported_operator_returns_none(self, index):
+        """Test that operators the index cannot answer are not pre-filtered."""
+        assert index.select({"path": {"$contains": "users"}}) is None
+        assert index.select({"$and": [{"method": "GET"}, {"path": {"$regex": "x"}}]}) is None
+
+
+class TestFilterCompilation:
+    """Test that Filter objects match Filter.matches."""
+
+    @pytest.mark.parametrize(
+        "filter",
+        [
+            FilterBuilder.eq("method", "GET"),
+            FilterBuilder.ne("api_name", "stripe"),
+            FilterBuilder.gt("version", 1),
+            FilterBuilder.lte("version", 2.5),
+            FilterBuilder.gte("deprecated", 1),
+            FilterBuilder.contains("path", "users"),
+            FilterBuilder.not_contains("path", "/v1"),
+            FilterBuilder.metadata("path", FilterOperator.STARTS_WITH, "/v2"),
+            FilterBuilder.metadata("path", FilterOperator.REGEX, r"^/v[13]/re"),
+            FilterBuilder.in_list("method", ["PUT", "POST"]),
+            FilterBuilder.not_in_list("api_name", ["slack"]),
+            FilterBuilder.and_filters(
+                FilterBuilder.eq("method", "POST"), FilterBuilder.eq("api_name", "stripe")
+            ),
+            FilterBuilder.or_filters(
+                FilterBuilder.contains("path", "charges"), FilterBuilder.lt("version", 2)
+            ),
+            FilterBuilder.not_filter(FilterBuilder.eq("method", "GET")),
+        ],
+    )
+    def test_matches_filter_semantics(self, corpus, index, filter):
+        """Test that the selected documents equal Filter.matches."""
+        ids, metadatas = corpus
+        expected = {doc_id for doc_id, m in zip(ids, metadatas) if filter.matches(m)}
+
+        candidates = index.select(filter)
+
+        assert candidates.exact is True
+        assert set(candidates.ids()) == expected
+
+    def test_content_filter_in_and_gives_superset(self, corpus, index):
+        """Test that unindexable parts widen the candidates instead of failing."""
+        filter = FilterBuilder.and_filters(
+            FilterBuilder.eq("method", "GET"), FilterBuilder.content_contains("token")
+        )
+
+        candidates = index.select(filter)
+
+        assert candidates.exact is False
+        assert set(candidates.ids()) == selected(index, FilterBuilder.eq("method", "GET"))
+
+    def test_content_filter_under_not_or_is_not_prefiltered(self, index):
+        """Test that OR/NOT over content filters are left to client-side filtering."""
+        content = FilterBuilder.content_contains("token")
+
+        assert index.select(content) is None
+        assert index.select(FilterBuilder.or_filters(FilterBuilder.eq("method", "GET"), content)) is None
+        assert index.select(
+            FilterBuilder.not_filter(
+                FilterBuilder.and_filters(FilterBuilder.eq("method", "GET"), content)
+            )
+        ) is None
+
+
+class TestMaintenance:
+    """Test incremental updates."""
+
+    def test_add_remove_and_replace(self):
+        """Test that writes are reflected in later selections."""
+        index = MetadataIndex()
+        index.add("a", {"method": "GET"})
+        index.add("b", {"method": "POST"})
+        index.add("a", {"method": "POST"})
+        index.remove("b")
+
+        assert len(index) == 1
+        assert selected(index, {"method": "POST"}) == {"a"}
+        assert selected(index, {"method": "GET"}) == set()
+        assert index.remove("missing") is False
+
+    def test_compaction_preserves_selection(self, corpus):
+        """Test that compacting drops dead rows without changing results."""
+        ids, metadatas = corpus
+        index = MetadataIndex.build(ids, metadatas)
+        for doc_id in ids[::2]:
+            index.remove(doc_id)
+        before = selected(index, {"method": "GET"})
+
+        index.compact()
+
+        assert len(index.doc_ids) == len(index) == len(ids) // 2
+        assert selected(index, {"method": "GET"}) == before
+
+    def test_candidate_set_is_a_snapshot(self):
+        """Test that later writes do not leak into existing candidate sets."""
+        index = MetadataIndex()
+        index.add("a", {"method": "GET"})
+        candidates = index.select({"method": "GET"})
+
+        index.add("b", {"method": "GET"})
+        index.remove("a")
+        index.compact()
+
+        assert "b" not in candidates
+        assert "a" not in candidates
+        assert candidates.count == 1
+
+    def test_overfetch_factor(self):
+        """Test the over-fetch factor for broad and narrow filters."""
+        index = MetadataIndex()
+        for i in range(100):
+            index.add(str(i), {"even": i % 2 == 0, "small": i < 5})
+
+        assert index.select({"even": True}).overfetch_factor(10) == 2
+        assert index.select({"small": True}).overfetch_factor(10) == 10
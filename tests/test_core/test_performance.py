@@ -15,10 +15,14 @@ from src.core.performance import (
     get_performance_report,
     get_slow_operations,
 )
+from src.config import settings
+from src.core import cache as cache_module
 from src.core.cache import (
     LRUCache,
     EmbeddingCache,
+    PersistentEmbeddingStore,
     SemanticQueryCache,
+    get_embedding_cache,
 )
 
 
@@ -112,6 +116,21 @@ class TestPerformanceMonitor:
         assert report["summary"]["total_errors"] == 1
         assert report["summary"]["avg_cache_hit_rate"] == 50.0
 
+    def test_cancellation_metrics(self):
+        """Test tracking of work cancelled by client disconnects."""
+        monitor = PerformanceMonitor.get_instance()
+
+        monitor.record_cancellation("chat", "generation", elapsed=1.5)
+        monitor.record_cancellation("chat", "generation", elapsed=0.5)
+        monitor.record_cancellation("chat", "url_scraping", elapsed=0.25)
+
+        report = monitor.get_report()
+        cancellations = {c["operation"]: c for c in report["cancellations"]}
+
+        assert cancellations["chat"]["cancelled"] == 3
+        assert cancellations["chat"]["wasted_time_s"] == pytest.approx(2.25)
+        assert cancellations["chat"]["by_stage"] == {"generation": 2, "url_scraping": 1}
+
 
 class TestMonitorPerformanceDecorator:
     """Test performance monitoring decorators."""
@@ -295,6 +314,106 @@ class TestEmbeddingCache:
         for emb1, emb2 in zip(embeddings1, embeddings2):
             assert np.array_equal(emb1, emb2)
 
+    def test_matrix_returns_batch_output_when_uncached(self):
+        """Test that an all-miss batch returns the embedding function's matrix."""
+        cache = EmbeddingCache(max_size=10)
+        batch = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+        matrix = cache.get_embeddings_matrix(["a", "b"], lambda texts: batch)
+
+        assert matrix is batch
+
+    def test_matrix_combines_cached_and_new_rows(self):
+        """Test that cached and computed rows fill one float32 matrix in order."""
+        cache = EmbeddingCache(max_size=10)
+        cache.get_embedding("b", lambda text: np.array([9.0, 9.0]))
+        embed_fn = MagicMock(return_value=np.array([[1.0, 1.0], [2.0, 2.0]]))
+
+        matrix = cache.get_embeddings_matrix(["a", "b", "c"], embed_fn)
+
+        embed_fn.assert_called_once_with(["a", "c"])
+        assert matrix.dtype == np.float32
+        assert matrix.flags["C_CONTIGUOUS"]
+        assert np.array_equal(matrix, [[1.0, 1.0], [9.0, 9.0], [2.0, 2.0]])
+
+
+class TestPersistentEmbeddingStore:
+    """Test the on-disk embedding tier."""
+
+    @staticmethod
+    def embed(texts):
+        return np.array([[len(t), 1.0, 0.5] for t in texts], dtype=np.float32)
+
+    def test_survives_restart(self, tmp_path):
+        """Test that a new cache over the same file does not re-embed."""
+        path = tmp_path / "embeddings.db"
+        first = EmbeddingCache(persistent=PersistentEmbeddingStore(str(path), model="m"))
+        first.get_embeddings_batch(["a", "bb"], self.embed)
+
+        embed_fn = MagicMock(side_effect=self.embed)
+        second = EmbeddingCache(persistent=PersistentEmbeddingStore(str(path), model="m"))
+        embeddings = second.get_embeddings_batch(["a", "bb", "ccc"], embed_fn)
+
+        embed_fn.assert_called_once_with(["ccc"])
+        assert [e.tolist() for e in embeddings] == [[1, 1, 0.5], [2, 1, 0.5], [3, 1, 0.5]]
+        assert embeddings[0].dtype == np.float32
+
+    def test_single_lookup_uses_store(self, tmp_path):
+        """Test that get_embedding consults the store on an in-process miss."""
+        store = PersistentEmbeddingStore(str(tmp_path / "embeddings.db"), model="m")
+        store.put_many({EmbeddingCache()._get_key("text"): np.array([0.25, 0.5])})
+
+        cache = EmbeddingCache(persistent=store)
+        embedding = cache.get_embedding("text", MagicMock(side_effect=AssertionError))
+
+        assert embedding.tolist() == [0.25, 0.5]
+
+    def test_keys_include_model(self, tmp_path):
+        """Test that embeddings of another model are never returned."""
+        path = str(tmp_path / "embeddings.db")
+        PersistentEmbeddingStore(path, model="old").put_many({"h": np.ones(3)})
+
+        store = PersistentEmbeddingStore(path, model="new")
+
+        assert store.get_many(["h"]) == {}
+        assert store.count() == 0
+
+    def test_keys_include_backend(self, tmp_path, monkeypatch):
+        """Test that switching the inference backend misses the disk cache."""
+        monkeypatch.setattr(settings, "embedding_disk_cache_enabled", True)
+        monkeypatch.setattr(settings, "embedding_disk_cache_path", str(tmp_path / "e.db"))
+
+        def cache_for(backend):
+            monkeypatch.setattr(settings, "embedding_backend", backend)
+            monkeypatch.setattr(cache_module, "_embedding_cache", None)
+            return get_embedding_cache()
+
+        torch_cache = cache_for("torch")
+        torch_cache.get_embeddings_batch(["a"], self.embed)
+        torch_cache.persistent.close()
+
+        embed_fn = MagicMock(side_effect=self.embed)
+        onnx_cache = cache_for("onnx")
+        onnx_cache.get_embeddings_batch(["a"], embed_fn)
+        onnx_cache.persistent.close()
+
+        embed_fn.assert_called_once_with(["a"])
+
+    def test_float16_storage(self, tmp_path):
+        """Test half-precision storage round-trips to float32."""
+        store = PersistentEmbeddingStore(str(tmp_path / "e.db"), model="m", dtype="float16")
+        store.put_many({"h": np.array([0.1, -0.5, 1.0])})
+
+        vector = store.get_many(["h"])["h"]
+
+        assert vector.dtype == np.float32
+        assert np.allclose(vector, [0.1, -0.5, 1.0], atol=1e-3)
+
+    def test_invalid_dtype(self, tmp_path):
+        """Test that unsupported precisions are rejected."""
+        with pytest.raises(ValueError):
+            PersistentEmbeddingStore(str(tmp_path / "e.db"), model="m", dtype="int8")
+
 
 class TestSemanticQueryCache:
     """Test semantic query cache functionality."""
@@ -362,6 +481,55 @@ class TestSemanticQueryCache:
         time.sleep(0.15)
 
         assert cache.get(query, embedding) is None
+        assert cache.size() == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = SemanticQueryCache(max_size=2, similarity_threshold=0.95)
+        basis = np.eye(3)
+
+        cache.put("a", basis[0], "a")
+        cache.put("b", basis[1], "b")
+        cache.get("a", basis[0])  # "b" is now least recently used
+        cache.put("c", basis[2], "c")
+
+        assert cache.size() == 2
+        assert cache.get("b", basis[1]) is None
+        assert cache.get("a", basis[0]) == "a"
+        assert cache.get("c", basis[2]) == "c"
+
+    def test_same_embedding_replaces_entry(self):
+        """Test that re-caching a query updates it instead of duplicating it."""
+        cache = SemanticQueryCache(max_size=10)
+
+        cache.put("q", np.array([1.0, 0.0]), "old")
+        cache.put("q", np.array([2.0, 0.0]), "new")
+
+        assert cache.size() == 1
+        assert cache.get("q", np.array([1.0, 0.0])) == "new"
+
+    def test_scopes_are_isolated(self):
+        """Test that entries only match lookups in the same scope."""
+        cache = SemanticQueryCache(max_size=10)
+        embedding = np.array([1.0, 0.0, 0.0])
+
+        cache.put("q", embedding, "hybrid", scope="hybrid")
+        cache.put("q", embedding, "vector", scope="vector")
+
+        assert cache.get("q", embedding, scope="hybrid") == "hybrid"
+        assert cache.get("q", embedding, scope="vector") == "vector"
+        assert cache.get("q", embedding) is None
+
+    def test_best_match_among_many_entries(self):
+        """Test lookups against a matrix that has grown past its initial capacity."""
+        cache = SemanticQueryCache(max_size=3000, similarity_threshold=0.99)
+        embeddings = np.random.default_rng(0).normal(size=(3000, 16))
+
+        for i, embedding in enumerate(embeddings):
+            cache.put(str(i), embedding, i)
+
+        assert cache.size() == 3000
+        assert [cache.get("", embeddings[i]) for i in (0, 1500, 2999)] == [0, 1500, 2999]
 
 
 class TestPerformanceIntegration:
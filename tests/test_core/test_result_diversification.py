@@ -138,6 +138,17 @@ class TestEmbeddingBasedDiversification:
         python_docs = sum(1 for id in doc_ids if id in ["doc1", "doc2", "doc4"])
         assert python_docs <= 2  # At most 2 Python docs
 
+    def test_matrix_matches_list_of_vectors(self, sample_results, sample_embeddings):
+        """Test that a float32 matrix gives the same selection as a list of vectors."""
+        diversifier = ResultDiversifier(lambda_param=0.3)
+        matrix = np.asarray(sample_embeddings, dtype=np.float32)
+
+        from_list = diversifier.diversify(sample_results, top_k=4, embeddings=sample_embeddings)
+        from_matrix = diversifier.diversify(sample_results, top_k=4, embeddings=matrix)
+
+        assert [d['id'] for d in from_matrix] == [d['id'] for d in from_list]
+        assert len({d['id'] for d in from_matrix}) == 4
+
     def test_diversify_validates_embeddings_count(self, sample_results):
         """Test that embedding count must match results count."""
         diversifier = ResultDiversifier()
@@ -0,0 +1,766 @@
+"""
+Tests for the VectorStore service.
+
+Tests cover:
+- Shared VectorStore registry
+- Incremental BM25 index maintenance
+- Batched multi-query search
+- Concurrent hybrid search legs
+- Search result cache
+- Bulk deletes
+- Async facade
+- Startup warmup
+"""
+
+import hashlib
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.core.advanced_filtering import FilterBuilder, FilterOperator
+from src.core.hybrid_search import InvertedIndexBM25
+from src.core.vector_store import (
+    AsyncVectorStore,
+    VectorStore,
+    get_vector_store,
+    reset_vector_stores,
+)
+
+
+class FakeEmbeddingService:
+    """Deterministic bag-of-words embeddings (no model download)."""
+
+    dimension = 32
+
+    def embed_text(self, text):
+        vector = [0.0] * self.dimension
+        for token in text.lower().split():
+            digest = hashlib.md5(token.encode()).digest()
+            vector[digest[0] % self.dimension] += 1.0
+        norm = sum(v * v for v in vector) ** 0.5 or 1.0
+        return [v / norm for v in vector]
+
+    def embed_texts(self, texts, batch_size=32):
+        return [self.embed_text(t) for t in texts]
+
+    def embed_query(self, query):
+        return self.embed_text(query)
+
+    def embed_queries(self, queries):
+        return self.embed_texts(queries)
+
+    def embed_texts_np(self, texts, batch_size=32):
+        return np.array([self.embed_text(t) for t in texts], dtype=np.float32).reshape(-1, self.dimension)
+
+    def embed_query_np(self, query):
+        return np.array(self.embed_text(query), dtype=np.float32)
+
+    async def aembed_query_np(self, query):
+        return self.embed_query_np(query)
+
+    def embed_queries_np(self, queries):
+        return self.embed_texts_np(queries)
+
+    def warmup(self):
+        pass
+
+
+@pytest.fixture
+def store(tmp_path):
+    """VectorStore backed by a temporary ChromaDB directory."""
+    return VectorStore(
+        collection_name="test_docs",
+        persist_directory=str(tmp_path / "chroma"),
+        embedding_service=FakeEmbeddingService(),
+    )
+
+
+@pytest.fixture
+def sample_docs():
+    """Small API documentation corpus."""
+    return [
+        {"id": "users-get", "content": "GET /users list users", "metadata": {"method": "GET"}},
+        {"id": "users-post", "content": "POST /users create user", "metadata": {"method": "POST"}},
+        {"id": "auth-login", "content": "POST /auth/login oauth token", "metadata": {"method": "POST"}},
+    ]
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Reset the shared VectorStore registry around each test."""
+    reset_vector_stores()
+    yield
+    reset_vector_stores()
+
+
+class TestVectorStoreRegistry:
+    """Test the process-wide VectorStore registry."""
+
+    @patch("src.core.vector_store.VectorStore")
+    def test_same_collection_returns_same_instance(self, mock_cls):
+        """Test that repeated calls share one instance."""
+        mock_cls.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        first = get_vector_store(collection_name="docs", persist_directory="/tmp/vs")
+        second = get_vector_store(collection_name="docs", persist_directory="/tmp/vs")
+
+        assert first is second
+        assert mock_cls.call_count == 1
+
+    @patch("src.core.vector_store.VectorStore")
+    def test_different_collections_are_isolated(self, mock_cls):
+        """Test that each collection gets its own instance."""
+        mock_cls.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        docs = get_vector_store(collection_name="docs", persist_directory="/tmp/vs")
+        other = get_vector_store(collection_name="other", persist_directory="/tmp/vs")
+        moved = get_vector_store(collection_name="docs", persist_directory="/tmp/vs2")
+
+        assert docs is not other
+        assert docs is not moved
+        assert mock_cls.call_count == 3
+
+    @patch("src.core.vector_store.VectorStore")
+    def test_later_callers_do_not_change_features(self, mock_cls):
+        """Test that the creating call's feature flags stick."""
+        mock_cls.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        store = get_vector_store(
+            enable_hybrid_search=False, collection_name="docs", persist_directory="/tmp/vs"
+        )
+        again = get_vector_store(
+            enable_hybrid_search=True,
+            enable_reranker=True,
+            collection_name="docs",
+            persist_directory="/tmp/vs",
+        )
+
+        assert again is store
+        assert store.enable_hybrid_search is False
+        assert store.enable_reranker is False
+
+    @patch("src.core.vector_store.VectorStore")
+    def test_reset_drops_instances(self, mock_cls):
+        """Test that reset creates fresh instances afterwards."""
+        mock_cls.side_effect = lambda **kwargs: Mock(**kwargs)
+
+        first = get_vector_store(collection_name="docs", persist_directory="/tmp/vs")
+        reset_vector_stores()
+        second = get_vector_store(collection_name="docs", persist_directory="/tmp/vs")
+
+        assert first is not second
+
+
+class TestIncrementalIndexing:
+    """Test that writes update the BM25 index without full rebuilds."""
+
+    def test_add_after_build_updates_index_incrementally(self, store, sample_docs):
+        """Test that adding a document does not trigger a rebuild."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+        assert isinstance(store._bm25, InvertedIndexBM25)
+
+        with patch.object(store, "_rebuild_bm25_index") as rebuild:
+            store.add_document("DELETE /webhooks remove webhook", {"method": "DELETE"}, "hook")
+            results = store.search("webhook", n_results=3)
+
+        rebuild.assert_not_called()
+        assert "hook" in store._bm25
+        assert results[0]["id"] == "hook"
+
+    def test_delete_removes_from_index_without_rebuild(self, store, sample_docs):
+        """Test that deleting a document updates the index in place."""
+        store.add_documents(sample_docs)
+        store.search("oauth", n_results=3)
+
+        with patch.object(store, "_rebuild_bm25_index") as rebuild:
+            assert store.delete_document("auth-login") is True
+            bm25_hits = store._bm25.search("oauth", top_k=5)
+
+        rebuild.assert_not_called()
+        assert bm25_hits == []
+        assert "auth-login" not in store._bm25
+
+    def test_writes_before_first_search_build_lazily(self, store, sample_docs):
+        """Test that the index is built on first search when absent."""
+        store.add_documents(sample_docs)
+        assert store._bm25 is None
+
+        results = store.search("login", n_results=3)
+
+        assert store._bm25.num_docs == 3
+        assert results[0]["id"] == "auth-login"
+
+
+class TestPersistedIndex:
+    """Test that the BM25 index is persisted and reused across instances."""
+
+    def test_rebuild_persists_index(self, store, sample_docs):
+        """Test that building the index writes it next to the ChromaDB data."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        assert store.bm25_index_path.exists()
+
+    def test_new_instance_loads_without_rebuild(self, store, sample_docs):
+        """Test that a fresh store memory-maps the saved index."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        reopened = VectorStore(
+            collection_name=store.collection_name,
+            persist_directory=store.persist_directory,
+            embedding_service=FakeEmbeddingService(),
+        )
+        with patch.object(reopened, "_rebuild_bm25_index") as rebuild:
+            results = reopened.search("login", n_results=3)
+
+        rebuild.assert_not_called()
+        assert reopened._bm25.num_docs == 3
+        assert results[0]["id"] == "auth-login"
+        assert results[0]["content"] == "POST /auth/login oauth token"
+
+    def test_write_after_save_invalidates_file(self, store, sample_docs):
+        """Test that a stale index file is rebuilt instead of loaded."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+        store.add_document("DELETE /webhooks remove webhook", {"method": "DELETE"}, "hook")
+
+        reopened = VectorStore(
+            collection_name=store.collection_name,
+            persist_directory=store.persist_directory,
+            embedding_service=FakeEmbeddingService(),
+        )
+        results = reopened.search("webhook", n_results=3)
+
+        assert reopened._bm25.num_docs == 4
+        assert results[0]["id"] == "hook"
+
+    def test_save_bm25_index_after_writes(self, store, sample_docs):
+        """Test that an explicit save makes the current index loadable."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+        store.delete_document("users-post")
+
+        assert store.save_bm25_index() is True
+        reopened = VectorStore(
+            collection_name=store.collection_name,
+            persist_directory=store.persist_directory,
+            embedding_service=FakeEmbeddingService(),
+        )
+        assert reopened._load_bm25_index() is True
+        assert "users-post" not in reopened._bm25
+
+    def test_clear_removes_index_file(self, store, sample_docs):
+        """Test that clearing the collection deletes the persisted index."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        store.clear()
+
+        assert not store.bm25_index_path.exists()
+
+
+class TestHybridHydration:
+    """Test that hybrid search fuses on IDs and hydrates only the final results."""
+
+    def test_bm25_hits_are_filtered_by_where(self, store, sample_docs):
+        """Test that metadata filters apply to BM25-only hits."""
+        store.add_documents(sample_docs)
+
+        results = store.search("users", n_results=3, where={"method": "GET"})
+
+        assert [r["id"] for r in results] == ["users-get"]
+
+    def test_only_final_results_are_hydrated(self, store, sample_docs):
+        """Test that content is fetched for at most n_results documents."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        with patch.object(
+            store, "_get_documents_by_ids", wraps=store._get_documents_by_ids
+        ) as hydrate:
+            results = store.search("oauth token login", n_results=1)
+
+        assert len(results) == 1
+        assert results[0]["content"] == "POST /auth/login oauth token"
+        assert hydrate.call_count == 1
+        assert len(hydrate.call_args.args[0]) <= 1
+
+
+class TestMetadataPrefilter:
+    """Test candidate pre-selection from the metadata index."""
+
+    def test_no_matching_documents_skips_retrieval(self, store, sample_docs):
+        """Test that an unsatisfiable filter returns without querying."""
+        store.add_documents(sample_docs)
+
+        with patch.object(store, "_vector_search_impl") as vector_search:
+            results = store.search("users", where={"method": "PATCH"})
+
+        vector_search.assert_not_called()
+        assert results == []
+
+    def test_client_side_filter_does_not_starve_results(self, store):
+        """Test that unsupported Filter operators still fill n_results."""
+        store.add_documents([
+            {"id": f"noise-{i}", "content": f"users endpoint {i}", "metadata": {"path": f"/v1/{i}"}}
+            for i in range(20)
+        ] + [
+            {"id": "target", "content": "account settings", "metadata": {"path": "/v2/account"}},
+        ])
+
+        results = store.search(
+            "users endpoint", n_results=3, where=FilterBuilder.contains("path", "/v2/")
+        )
+
+        assert [r["id"] for r in results] == ["target"]
+
+    def test_allow_list_falls_back_to_overfetch_on_old_chroma(self, store, monkeypatch):
+        """Test that ChromaDB releases without query(ids=) still get filtered results."""
+        monkeypatch.setattr("src.core.vector_store._CHROMA_QUERY_ACCEPTS_IDS", False)
+        store.add_documents([
+            {"id": f"noise-{i}", "content": f"users endpoint {i}", "metadata": {"path": f"/v1/{i}"}}
+            for i in range(20)
+        ] + [
+            {"id": "target", "content": "account settings", "metadata": {"path": "/v2/account"}},
+        ])
+        query = store.collection.query
+
+        with patch.object(store.collection, "query", wraps=query) as chroma_query:
+            results = store.search(
+                "users endpoint", n_results=3, where=FilterBuilder.contains("path", "/v2/")
+            )
+
+        assert [r["id"] for r in results] == ["target"]
+        assert chroma_query.called
+        assert all("ids" not in call.kwargs for call in chroma_query.call_args_list)
+
+    def test_index_follows_writes(self, store, sample_docs):
+        """Test that adds and deletes are reflected in filtered searches."""
+        store.add_documents(sample_docs)
+        store.search("users", where={"method": "POST"})
+
+        store.add_document("DELETE /users/{id} remove user", {"method": "DELETE"}, "users-delete")
+        store.delete_document("users-post")
+
+        assert [r["id"] for r in store.search("users", where={"method": "DELETE"})] == [
+            "users-delete"
+        ]
+        assert "users-post" not in store._metadata_index
+
+
+class TestAddDocuments:
+    """Test the ingestion pipeline."""
+
+    def test_existing_documents_are_not_embedded(self, store, sample_docs):
+        """Test that only new content is embedded on re-upload."""
+        store.add_documents(sample_docs)
+        new_doc = {"id": "hook", "content": "DELETE /webhooks remove webhook", "metadata": {"method": "DELETE"}}
+
+        with patch.object(
+            store.embedding_service, "embed_texts_np", wraps=store.embedding_service.embed_texts_np
+        ) as embed:
+            result = store.add_documents(sample_docs + [new_doc])
+
+        embed.assert_called_once()
+        assert embed.call_args.args[0] == [new_doc["content"]]
+        assert result["new_count"] == 1
+        assert result["skipped_count"] == 3
+
+    def test_all_existing_skips_embedding(self, store, sample_docs):
+        """Test that an unchanged re-upload does no embedding work."""
+        store.add_documents(sample_docs)
+
+        with patch.object(store.embedding_service, "embed_texts_np") as embed:
+            result = store.add_documents(sample_docs)
+
+        embed.assert_not_called()
+        assert result["new_count"] == 0
+        assert set(result["timings_ms"]) == {"prepare", "lookup"}
+
+    def test_id_lookup_is_batched(self, store, sample_docs):
+        """Test that existence checks are split into bounded batches."""
+        store.add_documents(sample_docs)
+        store.ID_LOOKUP_BATCH_SIZE = 2
+
+        with patch.object(store.collection, "get", wraps=store.collection.get) as get:
+            result = store.add_documents(sample_docs)
+
+        assert [len(call.kwargs["ids"]) for call in get.call_args_list] == [2, 1]
+        assert result["skipped_count"] == 3
+
+    def test_timings_reported_per_stage(self, store, sample_docs):
+        """Test that each ingestion stage is timed."""
+        result = store.add_documents(sample_docs)
+
+        assert set(result["timings_ms"]) == {"prepare", "lookup", "embed", "write", "index"}
+        assert all(ms >= 0 for ms in result["timings_ms"].values())
+
+
+class TestSearchMany:
+    """Test batched multi-query search."""
+
+    QUERIES = ["list users", "oauth login token", "create user"]
+
+    def test_matches_single_query_search(self, store, sample_docs):
+        """Test that per-query results equal separate search() calls."""
+        store.add_documents(sample_docs)
+        store.add_document("DELETE /webhooks remove webhook", {"method": "DELETE"}, "hook")
+
+        expected = [store.search(q, n_results=2) for q in self.QUERIES]
+        batch = store.search_many(self.QUERIES, n_results=2)
+
+        assert batch["results"] == expected
+        assert "fused" not in batch
+
+    def test_single_embedding_and_query_call(self, store, sample_docs):
+        """Test that all queries share one embedding batch and one ChromaDB query."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+
+        with patch.object(
+            store.embedding_service, "embed_queries_np", wraps=store.embedding_service.embed_queries_np
+        ) as embed, patch.object(store.collection, "query", wraps=store.collection.query) as query, \
+                patch.object(store._bm25, "search_many", wraps=store._bm25.search_many) as bm25:
+            store.search_many(self.QUERIES, n_results=2)
+
+        embed.assert_called_once_with(self.QUERIES)
+        query.assert_called_once()
+        assert len(query.call_args.kwargs["query_embeddings"]) == 3
+        bm25.assert_called_once()
+
+    def test_fused_results(self, store, sample_docs):
+        """Test that the fused list favours documents found by several queries."""
+        store.add_documents(sample_docs)
+
+        batch = store.search_many(["users", "POST users", "create user"], n_results=3, fuse=True)
+
+        fused = batch["fused"]
+        assert fused[0]["id"] == "users-post"
+        assert all(r["method"] == "multi_query" for r in fused)
+        assert [r["score"] for r in fused] == sorted((r["score"] for r in fused), reverse=True)
+
+    def test_filters_apply_to_every_query(self, store, sample_docs):
+        """Test that where filters restrict the results of all queries."""
+        store.add_documents(sample_docs)
+
+        batch = store.search_many(self.QUERIES, n_results=3, where=FilterBuilder.eq("method", "GET"))
+        empty = store.search_many(self.QUERIES, where={"method": "PATCH"}, fuse=True)
+
+        assert [[r["id"] for r in results] for results in batch["results"]] == [["users-get"]] * 3
+        assert empty == {"results": [[], [], []], "fused": []}
+
+
+class TestConcurrentHybridLegs:
+    """Test that hybrid search runs its legs in parallel and degrades gracefully."""
+
+    def test_legs_run_concurrently(self, store, sample_docs):
+        """Test that each leg waits for the other to have started."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+        barrier = threading.Barrier(2, timeout=5)
+
+        vector_search = store._vector_search_many
+        bm25_search = store._bm25_search_many
+
+        def vector_leg(*args, **kwargs):
+            barrier.wait()
+            return vector_search(*args, **kwargs)
+
+        def bm25_leg(*args, **kwargs):
+            barrier.wait()
+            return bm25_search(*args, **kwargs)
+
+        with patch.object(store, "_vector_search_many", side_effect=vector_leg), \
+                patch.object(store, "_bm25_search_many", side_effect=bm25_leg):
+            results = store.search("create user", n_results=2)
+
+        assert results[0]["id"] == "users-post"
+
+    def test_slow_leg_is_dropped(self, store, sample_docs):
+        """Test that a leg exceeding its budget yields single-leg results."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+        store.hybrid_leg_timeout = 0.05
+        release = threading.Event()
+        bm25_search = store._bm25_search_many
+
+        def slow_bm25(*args, **kwargs):
+            release.wait(timeout=5)
+            return bm25_search(*args, **kwargs)
+
+        with patch.object(store, "_bm25_search_many", side_effect=slow_bm25):
+            start = time.perf_counter()
+            results = store.search("create user", n_results=2)
+            elapsed = time.perf_counter() - start
+        release.set()
+
+        assert elapsed < 2
+        assert results
+        assert all(r["original_method"] == "vector" for r in results)
+
+    def test_abandoned_legs_do_not_block_new_searches(self, store, sample_docs):
+        """Test that a search runs its legs inline while stuck legs hold the pool."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+        store.hybrid_leg_timeout = 0.05
+        release = threading.Event()
+        bm25_search = store._bm25_search_many
+
+        def stuck_bm25(*args, **kwargs):
+            release.wait(timeout=10)
+            return bm25_search(*args, **kwargs)
+
+        # Abandoned BM25 legs hold all but one worker
+        with patch.object(store, "_bm25_search_many", side_effect=stuck_bm25):
+            for i in range(settings.search_leg_executor_workers - 1):
+                store.search(f"stuck query {i}", n_results=1)
+
+        with patch.object(store, "_bm25_search_many", wraps=bm25_search) as inline_bm25:
+            start = time.perf_counter()
+            results = store.search("create user", n_results=2)
+            elapsed = time.perf_counter() - start
+        release.set()
+
+        assert elapsed < 5
+        assert results[0]["id"] == "users-post"
+        inline_bm25.assert_called_once()
+
+    def test_failed_leg_is_dropped(self, store, sample_docs):
+        """Test that a failing leg yields the other leg's results."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+
+        with patch.object(store, "_vector_search_many", side_effect=RuntimeError("chroma down")):
+            results = store.search("oauth login", n_results=2)
+
+        assert results[0]["id"] == "auth-login"
+        assert all(r["original_method"] == "bm25" for r in results)
+
+    def test_fast_failure_waits_for_slow_leg(self, store, sample_docs):
+        """Test that a leg failing within budget does not drop a slower healthy leg."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+        store.hybrid_leg_timeout = 0.05
+        bm25_search = store._bm25_search_many
+
+        def slow_bm25(*args, **kwargs):
+            time.sleep(0.2)
+            return bm25_search(*args, **kwargs)
+
+        with patch.object(store, "_vector_search_many", side_effect=RuntimeError("chroma down")), \
+                patch.object(store, "_bm25_search_many", side_effect=slow_bm25):
+            results = store.search("oauth login", n_results=2)
+
+        assert results[0]["id"] == "auth-login"
+        assert all(r["original_method"] == "bm25" for r in results)
+
+    def test_both_legs_failing_raises(self, store, sample_docs):
+        """Test that the vector error is raised if no leg succeeds."""
+        store.add_documents(sample_docs)
+        store.search("warm up", n_results=1)
+
+        with patch.object(store, "_vector_search_many", side_effect=RuntimeError("chroma down")), \
+                patch.object(store, "_bm25_search_many", side_effect=ValueError("bm25 down")):
+            with pytest.raises(RuntimeError, match="chroma down"):
+                store.search("oauth login", n_results=2)
+
+
+class TestSearchResultCache:
+    """Test the search result cache and its write invalidation."""
+
+    def test_repeated_search_skips_retrieval(self, store, sample_docs):
+        """Test that an identical query is served from the cache."""
+        store.add_documents(sample_docs)
+        first = store.search("create  user", n_results=2)
+
+        with patch.object(store, "_search_uncached") as search, \
+                patch.object(store.embedding_service, "embed_query_np") as embed:
+            second = store.search(" create user ", n_results=2)
+
+        search.assert_not_called()
+        embed.assert_not_called()
+        assert second == first
+
+    def test_semantic_tier_is_opt_in(self, store, sample_docs):
+        """Test that near-identical queries only share results when enabled."""
+        store.add_documents(sample_docs)
+        store.search("create user", n_results=2)
+
+        with patch.object(store, "_search_uncached", wraps=store._search_uncached) as search, \
+                patch("src.core.vector_store.get_query_cache") as query_cache:
+            store.search("user create", n_results=2)
+
+        search.assert_called_once()
+        query_cache.assert_not_called()
+
+    def test_semantically_identical_query_hits(self, store, sample_docs, monkeypatch):
+        """Test that a query with the same embedding is served from the cache."""
+        monkeypatch.setattr(settings, "search_cache_semantic", True)
+        store.add_documents(sample_docs)
+        first = store.search("create user", n_results=2)
+
+        with patch.object(store, "_search_uncached") as search:
+            second = store.search("user create", n_results=2)
+
+        search.assert_not_called()
+        assert second == first
+
+    def test_parameters_are_part_of_the_key(self, store, sample_docs):
+        """Test that different modes, filters and sizes are cached separately."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=2)
+
+        with patch.object(store, "_search_uncached", wraps=store._search_uncached) as search:
+            store.search("users", n_results=3)
+            store.search("users", n_results=2, use_hybrid=False)
+            store.search("users", n_results=2, where={"method": "GET"})
+            store.search("users", n_results=2, where=FilterBuilder.eq("method", "GET"))
+
+        assert search.call_count == 4
+
+    def test_writes_invalidate_cached_results(self, store, sample_docs):
+        """Test that adds and deletes are visible to repeated queries."""
+        store.add_documents(sample_docs)
+        assert [r["id"] for r in store.search("webhook", n_results=1)] != ["hook"]
+
+        store.add_document("DELETE /webhooks remove webhook", {"method": "DELETE"}, "hook")
+        assert [r["id"] for r in store.search("webhook", n_results=1)] == ["hook"]
+
+        store.delete_document("hook")
+        assert "hook" not in [r["id"] for r in store.search("webhook", n_results=1)]
+
+    def test_opt_out_and_isolation(self, store, sample_docs):
+        """Test use_cache=False and that callers cannot corrupt cached results."""
+        store.add_documents(sample_docs)
+        results = store.search("create user", n_results=2)
+        results[0]["metadata"]["method"] = "MUTATED"
+
+        with patch.object(store, "_search_uncached", wraps=store._search_uncached) as search:
+            uncached = store.search("create user", n_results=2, use_cache=False)
+            cached = store.search("create user", n_results=2)
+
+        search.assert_called_once()
+        assert cached == uncached
+        assert cached[0]["metadata"]["method"] == "POST"
+
+
+class TestBulkDelete:
+    """Test batched deletes."""
+
+    def test_delete_documents_updates_indexes_once(self, store, sample_docs):
+        """Test that a bulk delete updates both indexes without a rebuild."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        with patch.object(store, "_rebuild_bm25_index") as rebuild, patch.object(
+            store, "_unindex_documents", wraps=store._unindex_documents
+        ) as unindex:
+            deleted = store.delete_documents(["users-get", "missing", "users-get", "auth-login"])
+
+        rebuild.assert_not_called()
+        unindex.assert_called_once_with(["users-get", "auth-login"])
+        assert deleted == ["users-get", "auth-login"]
+        assert store.collection.count() == 1
+        assert "auth-login" not in store._bm25
+        assert "users-get" not in store._metadata_index
+
+    def test_delete_batches_chromadb_calls(self, store, sample_docs):
+        """Test that large deletes are split into bounded ChromaDB calls."""
+        store.add_documents(sample_docs)
+        store.ID_LOOKUP_BATCH_SIZE = 2
+
+        with patch.object(store.collection, "delete", wraps=store.collection.delete) as delete:
+            store.delete_documents([doc["id"] for doc in sample_docs])
+
+        assert [len(call.kwargs["ids"]) for call in delete.call_args_list] == [2, 1]
+        assert store.collection.count() == 0
+
+    def test_delete_where_dict(self, store, sample_docs):
+        """Test deleting by a where dict."""
+        store.add_documents(sample_docs)
+
+        deleted = store.delete_where({"method": "POST"})
+
+        assert sorted(deleted) == ["auth-login", "users-post"]
+        assert [r["id"] for r in store.search("users", n_results=3)] == ["users-get"]
+
+    def test_delete_where_client_side_filter(self, store, sample_docs):
+        """Test deleting by a Filter with operators ChromaDB cannot evaluate."""
+        store.add_documents(sample_docs)
+        store.search("users", n_results=3)
+
+        deleted = store.delete_where(FilterBuilder.metadata("method", FilterOperator.STARTS_WITH, "PO"))
+
+        assert sorted(deleted) == ["auth-login", "users-post"]
+        assert store.collection.get()["ids"] == ["users-get"]
+
+    def test_delete_where_requires_filter(self, store):
+        """Test that an empty filter is rejected instead of deleting everything."""
+        with pytest.raises(ValueError):
+            store.delete_where({})
+
+
+class TestAsyncVectorStore:
+    """Test the async facade."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, store, sample_docs):
+        """Test that facade calls return the same results as the store."""
+        async_store = AsyncVectorStore(store)
+
+        added = await async_store.add_documents(sample_docs)
+        results = await async_store.search("create user", n_results=2)
+
+        assert added["new_count"] == len(sample_docs)
+        assert results == store.search("create user", n_results=2)
+        assert await async_store.count() == len(sample_docs)
+        assert (await async_store.get_document("users-get"))["id"] == "users-get"
+        assert await async_store.delete_documents(["users-get"]) == ["users-get"]
+        assert await async_store.count() == len(sample_docs) - 1
+
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_use_separate_pools(self, store):
+        """Test that searches run on the query pool and writes on the ingest pool."""
+        async_store = AsyncVectorStore(store)
+        pools = []
+
+        async def record(pool, func, *args, **kwargs):
+            pools.append(pool)
+            return func(*args, **kwargs)
+
+        with patch("src.core.vector_store.run_in_executor", side_effect=record):
+            await async_store.add_document("GET /health status", {"method": "GET"})
+            await async_store.search("health")
+
+        assert pools == ["ingest", "query"]
+
+
+class TestWarmup:
+    """Test that warmup initializes lazy state ahead of the first search."""
+
+    def test_warmup_builds_indexes(self, store, sample_docs):
+        """Test that warmup builds the BM25 index and reports every stage."""
+        store.add_documents(sample_docs)
+        completed = []
+
+        timings = store.warmup(on_stage=lambda name, ms: completed.append(name))
+
+        assert completed == ["embedding_model", "vector_store", "keyword_index", "metadata_index"]
+        assert list(timings) == completed
+        assert store._bm25.num_docs == 3
+
+    def test_warmup_loads_reranker_when_enabled(self, store):
+        """Test that the cross-encoder is loaded and exercised when enabled."""
+        store.enable_reranker = True
+
+        with patch("src.core.vector_store.CrossEncoderReranker") as reranker_cls:
+            timings = store.warmup()
+
+        assert "reranker" in timings
+        reranker_cls.return_value.warmup.assert_called_once()
@@ -33,6 +33,9 @@ def mock_vector_store():
     """Create mock vector store."""
     mock = Mock()
     mock.search = Mock(return_value=[])
+    mock.search_many = Mock(
+        side_effect=lambda queries, **kwargs: {"results": [mock.search(query=q, **kwargs) for q in queries]}
+    )
     mock.add_documents = Mock()
     return mock
 
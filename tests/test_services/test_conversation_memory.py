@@ -318,6 +318,32 @@ class TestConversationSearch:
         assert results == []
 
 
+class TestSessionDocumentDeletion:
+    """Test deleting documents of removed sessions."""
+
+    def test_delete_session_documents(self, memory_service, mock_vector_store):
+        """Test that all sessions are removed with one filtered delete."""
+        mock_vector_store.delete_where.return_value = ["a", "b", "c"]
+
+        count = memory_service.delete_session_documents(["s1", "s2"])
+
+        assert count == 3
+        mock_vector_store.delete_where.assert_called_once_with(
+            {"session_id": {"$in": ["s1", "s2"]}}
+        )
+
+    def test_delete_no_sessions(self, memory_service, mock_vector_store):
+        """Test that an empty list does not touch the store."""
+        assert memory_service.delete_session_documents([]) == 0
+        mock_vector_store.delete_where.assert_not_called()
+
+    def test_delete_error_handling(self, memory_service, mock_vector_store):
+        """Test that store errors are swallowed."""
+        mock_vector_store.delete_where.side_effect = Exception("Delete Error")
+
+        assert memory_service.delete_session_documents(["s1"]) == 0
+
+
 class TestFactoryFunction:
     """Test factory function."""
 
@@ -7,11 +7,15 @@ Tests cover:
 - HTML parsing
 - Error handling
 - Content formatting
+- Concurrent scraping and cancellation
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
+from src.core.exceptions import RequestCancelledError
 from src.services.url_scraper import URLScraperService, get_url_scraper_service
 
 
@@ -462,3 +466,50 @@ class TestEdgeCases:
         assert "param=value" in urls[0]
         assert "&other=test" in urls[0]
         assert "#fragment" in urls[0]
+
+
+class TestConcurrentScraping:
+    """Test async scraping on the scrape pool and cancellation."""
+
+    def test_cancelled_scrape_makes_no_request(self, url_scraper):
+        """Test that a cancelled scrape returns without fetching."""
+        cancelled = threading.Event()
+        cancelled.set()
+
+        with patch('src.services.url_scraper.httpx.Client') as mock_client_class:
+            result = url_scraper.scrape_url("https://example.com", cancelled)
+
+        assert result is None
+        mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ascrape_urls_keeps_order_and_drops_failures(self, url_scraper):
+        """Test that results come back in URL order without failed scrapes."""
+        def fake_scrape(url, cancelled=None):
+            return None if "bad" in url else {"title": url, "content": "", "url": url}
+
+        with patch.object(url_scraper, "scrape_url", side_effect=fake_scrape):
+            results = await url_scraper.ascrape_urls(
+                ["https://a.example.com", "https://bad.example.com", "https://b.example.com"]
+            )
+
+        assert [r["url"] for r in results] == ["https://a.example.com", "https://b.example.com"]
+
+    @pytest.mark.asyncio
+    async def test_ascrape_urls_stops_on_disconnect(self, url_scraper):
+        """Test that a disconnect signals running scrapes to stop."""
+        signals = []
+
+        def slow_scrape(url, cancelled=None):
+            signals.append(cancelled)
+            cancelled.wait(5)
+            return None
+
+        async def disconnected():
+            return True
+
+        with patch.object(url_scraper, "scrape_url", side_effect=slow_scrape):
+            with pytest.raises(RequestCancelledError):
+                await url_scraper.ascrape_urls(["https://slow.example.com"], is_disconnected=disconnected)
+
+        assert signals and signals[0].is_set()
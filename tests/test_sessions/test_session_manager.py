@@ -17,6 +17,7 @@ import pytest
 import time
 import threading
 from datetime import datetime, timedelta
+from unittest.mock import Mock
 
 from src.sessions import (
     SessionManager,
@@ -272,6 +273,42 @@ class TestSessionExpiration:
         assert count == 2
         assert len(manager.list_sessions()) == 1
 
+    def test_removal_listeners_receive_removed_ids(self):
+        """Test that listeners are notified once per delete or cleanup."""
+        manager = SessionManager()
+        removed = []
+        manager.add_removal_listener(removed.append)
+        expired = [manager.create_session(ttl_minutes=0).session_id for _ in range(2)]
+        active = manager.create_session(ttl_minutes=60)
+
+        time.sleep(0.1)
+        manager.cleanup_expired_sessions()
+        manager.delete_session(active.session_id)
+        manager.delete_session("nonexistent")
+
+        assert [sorted(ids) for ids in removed] == [sorted(expired), [active.session_id]]
+
+    def test_listener_registered_again_under_key_replaces_previous(self):
+        """Test that keyed listeners don't pile up when re-registered."""
+        manager = SessionManager()
+        first, second = Mock(), Mock()
+        manager.add_removal_listener(first, key="memory")
+        manager.add_removal_listener(second, key="memory")
+        session = manager.create_session()
+
+        manager.delete_session(session.session_id)
+
+        first.assert_not_called()
+        second.assert_called_once_with([session.session_id])
+
+    def test_failing_listener_does_not_break_cleanup(self):
+        """Test that listener errors are logged, not raised."""
+        manager = SessionManager()
+        manager.add_removal_listener(Mock(side_effect=RuntimeError("boom")))
+        session = manager.create_session()
+
+        assert manager.delete_session(session.session_id) is True
+
     def test_extend_session(self):
         """Test extending session expiration."""
         manager = SessionManager()